@@ -0,0 +1,155 @@
+import queue
+import tkinter as tk
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+
+from config import BACKGROUND_POLL_MS, BACKGROUND_WORKERS
+
+# Shared by every window so worker threads survive switching between Tk roots
+_pool = ThreadPoolExecutor(
+    max_workers=BACKGROUND_WORKERS, thread_name_prefix="jobconnect-net"
+)
+
+
+class BackgroundRunner:
+    """
+    Runs blocking calls (HTTP requests) on a worker pool and hands the results
+    back to the Tk thread, so the mainloop never waits on the network.
+    Tk is not thread safe: workers only push onto a queue that the Tk thread
+    drains with after().
+    """
+
+    def __init__(self, root: tk.Misc, poll_ms: int = BACKGROUND_POLL_MS):
+        """
+        :param root: Tk root whose event loop delivers the callbacks
+        :param poll_ms: How often the result queue is drained
+        """
+        self.root = root
+        self.poll_ms = poll_ms
+        self.results = queue.SimpleQueue()  # callables to run on the Tk thread
+        self.root.after(self.poll_ms, self._poll)
+
+    def submit(
+        self,
+        fn,
+        *args,
+        on_success=None,
+        on_error=None,
+        cancelled=None,
+        **kwargs,
+    ) -> Future:
+        """
+        Run fn(*args, **kwargs) in the background.
+        :param on_success: Called on the Tk thread with the return value
+        :param on_error: Called on the Tk thread with the raised exception
+        :param cancelled: Checked on the Tk thread before either callback; when
+            it returns True the outcome is dropped (e.g. a generation Token)
+        """
+        future = _pool.submit(fn, *args, **kwargs)
+        future.add_done_callback(
+            lambda f: self.results.put(
+                partial(self._deliver, f, on_success, on_error, cancelled)
+            )
+        )
+        return future
+
+    def stream(
+        self,
+        fn,
+        *args,
+        on_batch=None,
+        on_success=None,
+        on_error=None,
+        cancelled=None,
+        **kwargs,
+    ) -> Future:
+        """
+        Iterate the generator returned by fn(*args, **kwargs) in the background,
+        handing each item to on_batch on the Tk thread as soon as it is produced.
+        :param on_batch: Called on the Tk thread with every yielded item
+        :param on_success: Called on the Tk thread, without arguments, at the end
+        :param on_error: Called on the Tk thread with the raised exception
+        :param cancelled: Checked by the worker between items; when it returns
+            True the generator is closed (releasing its connection) and no
+            further callbacks run
+        """
+
+        def run():
+            iterator = fn(*args, **kwargs)
+            try:
+                for item in iterator:
+                    if cancelled is not None and cancelled():
+                        return False
+                    if on_batch:
+                        self.post(on_batch, item, cancelled)
+            finally:
+                iterator.close()
+            return True
+
+        return self.submit(
+            run,
+            on_success=lambda finished: finished and on_success and on_success(),
+            on_error=on_error,
+            cancelled=cancelled,
+        )
+
+    def post(self, callback, item, cancelled=None):
+        """
+        Queue callback(item) to run on the Tk thread. Safe to call from workers.
+        :param cancelled: Checked on the Tk thread first; True drops the call
+        """
+        self.results.put(partial(self._call, callback, item, cancelled))
+
+    def _poll(self):
+        """
+        Deliver finished results, then reschedule while the root is alive.
+        """
+        try:
+            while True:
+                try:
+                    callback = self.results.get_nowait()
+                except queue.Empty:
+                    break
+                callback()
+        finally:
+            try:
+                self.root.after(self.poll_ms, self._poll)
+            except tk.TclError:
+                pass
+
+    @staticmethod
+    def _deliver(future: Future, on_success, on_error, cancelled=None):
+        """
+        Invoke the callback matching the outcome of a finished future.
+        """
+        if future.cancelled() or (cancelled is not None and cancelled()):
+            return
+        error = future.exception()
+        try:
+            if error is not None:
+                if on_error:
+                    on_error(error)
+            elif on_success:
+                on_success(future.result())
+        except tk.TclError:
+            # Target widget was closed while the request was in flight
+            pass
+
+    @staticmethod
+    def _call(callback, item, cancelled=None):
+        """
+        Invoke a streaming callback, ignoring widgets closed meanwhile.
+        """
+        if cancelled is not None and cancelled():
+            return
+        try:
+            callback(item)
+        except tk.TclError:
+            pass
+
+
+def get_runner(widget: tk.Misc) -> BackgroundRunner:
+    """
+    Return the background runner owned by the Tk root of a widget.
+    """
+    return widget.nametowidget(".").runner
@@ -0,0 +1,36 @@
+import itertools
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from config import BULK_CONCURRENCY
+
+
+def run_bounded(fn, items, concurrency: int = BULK_CONCURRENCY):
+    """
+    Call fn(item) for every item with at most concurrency calls in flight,
+    yielding (item, result, error) as each call completes; result is None on
+    failure and error is None on success.
+    Closing the generator cancels the calls not started yet and waits for the
+    ones already in flight.
+    :param fn: Blocking call made once per item, e.g. a single PUT
+    :param items: Iterable of items, consumed lazily as slots free up
+    :param concurrency: Maximum number of calls running at the same time
+    """
+    items = iter(items)
+    with ThreadPoolExecutor(
+        max_workers=concurrency, thread_name_prefix="jobconnect-bulk"
+    ) as pool:
+        in_flight = {
+            pool.submit(fn, item): item for item in itertools.islice(items, concurrency)
+        }
+        try:
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    item = in_flight.pop(future)
+                    for following in itertools.islice(items, 1):
+                        in_flight[pool.submit(fn, following)] = following
+                    error = future.exception()
+                    yield item, None if error else future.result(), error
+        finally:
+            for future in in_flight:
+                future.cancel()
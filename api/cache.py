@@ -0,0 +1,103 @@
+import threading
+import time
+from collections import OrderedDict
+
+from config import CACHE_MAX_ENTRIES, CACHE_TTL_SECONDS
+
+
+class CacheEntry:
+    """
+    A decoded response body and the validators needed to revalidate it.
+    """
+
+    __slots__ = ("data", "etag", "last_modified", "stored_at")
+
+    def __init__(self, data, etag: str, last_modified: str, stored_at: float):
+        self.data = data
+        self.etag = etag
+        self.last_modified = last_modified
+        self.stored_at = stored_at
+
+
+class ResponseCache:
+    """
+    Thread-safe, size-bounded LRU cache of decoded GET responses with a TTL.
+    Fresh entries are served without touching the network; expired or
+    invalidated entries keep their ETag/Last-Modified so they can be revalidated
+    with a conditional request, which costs a 304 when nothing changed.
+    """
+
+    def __init__(
+        self,
+        ttl: float = CACHE_TTL_SECONDS,
+        max_entries: int = CACHE_MAX_ENTRIES,
+        clock=time.monotonic,
+    ):
+        """
+        :param ttl: Seconds an entry is served without revalidation
+        :param max_entries: Entries kept before the least recently used is evicted
+        :param clock: Monotonic time source, replaceable for benchmarks
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key) -> CacheEntry:
+        """
+        Return the entry for key, fresh or not, or None.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        """
+        Whether an entry can be served without revalidation.
+        """
+        return self.clock() - entry.stored_at < self.ttl
+
+    def put(self, key, data, etag: str = None, last_modified: str = None):
+        """
+        Store a freshly downloaded body, evicting the least recently used entry
+        when the cache is full.
+        """
+        with self._lock:
+            self._entries[key] = CacheEntry(data, etag, last_modified, self.clock())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def touch(self, key):
+        """
+        Mark an entry fresh again after the server confirmed it is unchanged.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.stored_at = self.clock()
+
+    def invalidate(self, path_prefix: str, with_params_only: bool = False):
+        """
+        Force revalidation of every entry whose path starts with path_prefix.
+        Validators are kept, so an unchanged resource still costs only a 304.
+        :param with_params_only: Leave the entries fetched without query
+            parameters alone
+        """
+        with self._lock:
+            for (path, params), entry in self._entries.items():
+                if path.startswith(path_prefix) and (params or not with_params_only):
+                    entry.stored_at = float("-inf")
+
+    def clear(self):
+        """
+        Drop every entry, e.g. when the logged-in user changes.
+        """
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,858 @@
+import json
+import time
+
+import requests
+
+from api.bulk import run_bounded
+from api.cache import CacheEntry, ResponseCache
+from api.generation import RequestCancelled, Token
+from api.interrupt import InterruptibleAdapter, interruptible
+from api.metrics import endpoint, metrics
+from api.resilience import CircuitBreaker, ServiceUnavailable, backoff_delay
+from api.singleflight import FlightAbandoned, SingleFlight
+from api.streaming import iter_json_array
+from config import (
+    APPLICATION_CACHE_MAX_ENTRIES,
+    BASE_API_URL,
+    COUNTS_CONCURRENCY,
+    HTTP_POOL_CONNECTIONS,
+    HTTP_POOL_MAXSIZE,
+    HTTP_RETRIES,
+    HTTP_TIMEOUT,
+    HTTP_TIMEOUTS,
+    RETRY_BACKOFF_CAP_SECONDS,
+    STREAM_BATCH_SIZE,
+    STREAM_CHUNK_BYTES,
+)
+from objects import Account, Application, Job
+from store.catalog import JobCatalog
+from store.counts import ApplicationCounts, count_statuses
+from store.session import SessionStore
+
+# Methods safe to send twice. DELETE is idempotent too, but a retry after an
+# attempt that did go through finds nothing to delete and reports a 404.
+_RETRY_METHODS = frozenset({"GET", "HEAD", "PUT"})
+# Statuses meaning the server or a proxy in front of it is struggling
+_RETRY_STATUSES = frozenset({502, 503, 504})
+
+
+class ApiError(Exception):
+    """
+    Raised when the API answers with an unexpected status code.
+    """
+
+    def __init__(self, status_code: int, text: str, message: str = None):
+        """
+        :param status_code: HTTP status code of the response
+        :param text: Raw response body
+        :param message: Human readable message extracted from the body
+        """
+        super().__init__(message or text)
+        self.status_code = status_code
+        self.text = text
+        self.message = message or text
+
+    @classmethod
+    def from_response(cls, res):
+        """
+        Build an error from a response, pulling a message out of a JSON body if any.
+        """
+        try:
+            body = res.json()
+            if isinstance(body, dict):
+                message = body.get("message", str(body))
+            elif isinstance(body, list):
+                message = "\n".join(str(item) for item in body)
+            else:
+                message = str(body)
+        except ValueError:
+            message = res.text
+        return cls(res.status_code, res.text, message)
+
+
+class ServerError(ApiError):
+    """
+    Raised when the server kept answering 502/503/504 through every retry.
+    """
+
+
+# Failures that leave cached data as the best available answer
+_UNREACHABLE = (
+    ServiceUnavailable,
+    ServerError,
+    requests.ConnectionError,
+    requests.Timeout,
+)
+
+
+class JobConnectClient:
+    """
+    Shared client for the JobConnect API.
+    Owns one pooled keep-alive session holding the auth cookies, so every window
+    reuses the same connections instead of opening a new one per request.
+    """
+
+    def __init__(
+        self,
+        base_url: str = BASE_API_URL,
+        cache: ResponseCache = None,
+        session_store: SessionStore = None,
+    ):
+        """
+        :param base_url: Root URL of the JobConnect API
+        :param cache: Cache for job and application lists, a default one if omitted
+        :param session_store: (Optional) where the auth cookies are kept between
+            launches; sessions are not persisted without one
+        """
+        self.base_url = base_url
+        self.session_store = session_store
+        # Concurrent identical GETs share one request (see flights.stats())
+        self.flights = SingleFlight()
+        # Fails fast while the API is unhealthy, then probes for recovery
+        self.breaker = CircuitBreaker()
+        # (connect, read) seconds: per path prefix, and for every other path
+        self.timeouts = dict(HTTP_TIMEOUTS)
+        self.default_timeout = HTTP_TIMEOUT
+        self.cache = cache if cache is not None else ResponseCache()
+        # Application lists get their own bound so prefetching never evicts jobs
+        self.application_cache = ResponseCache(
+            max_entries=APPLICATION_CACHE_MAX_ENTRIES
+        )
+        # Learned from the first paged response: None until known
+        self.job_query_supported = None
+        # Indexed copy of the whole catalog, used when the server cannot filter
+        self.catalog = None
+        self._catalog_source = None
+        # Per-job status counts shown on job cards
+        self.application_counts = ApplicationCounts()
+        # Whether the server offers /application/counts: None until known
+        self.counts_endpoint_supported = None
+        self.session = requests.Session()
+        self.session.verify = False
+
+        # Cancelled fetches shut their connection down, even before the headers
+        adapter = InterruptibleAdapter(
+            pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    @property
+    def cookies(self):
+        """
+        Auth cookies of the current session.
+        """
+        return self.session.cookies
+
+    def close(self):
+        """
+        Release pooled connections.
+        """
+        self.session.close()
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        expected=(200,),
+        token: Token = None,
+        span=None,
+        flight=None,
+        **kwargs,
+    ):
+        """
+        Send a request and raise ApiError unless the status is one of expected.
+        Every request gets the connect/read timeouts of its path. Idempotent
+        requests are retried with jittered exponential backoff on connection
+        errors, timeouts and 502/503/504 (honouring Retry-After). While the
+        circuit breaker is open, ServiceUnavailable is raised without sending.
+        :param token: Generation token; cancelling it aborts the request until
+            its headers are in (RequestCancelled), and it is not retried
+        :param span: Metrics span of the caller, charged with the "network"
+            phase; the request is recorded as its own event when omitted
+        :param flight: Single-flight of the request; while callers wait on it,
+            a cancelled token leaves the request running for them
+        """
+        own_span = span is None
+        if own_span:
+            span = metrics.span("api", endpoint(method, path))
+        try:
+            res = self._send(method, path, expected, token, span, flight, **kwargs)
+        except BaseException as error:
+            span.set(error=type(error).__name__)
+            raise
+        finally:
+            span.mark("network")
+            if own_span:
+                span.end()
+        return res
+
+    def _send(
+        self, method: str, path: str, expected, token: Token, span, flight, **kwargs
+    ):
+        """
+        The retry loop behind _request.
+        """
+
+        def abortable():
+            # Callers sharing the request through single-flight still want it
+            return flight is None or not flight.waiters
+
+        def cancelled():
+            return token is not None and token.cancelled and abortable()
+
+        kwargs.setdefault("timeout", self._timeout(path))
+        retries = HTTP_RETRIES if method in _RETRY_METHODS else 0
+        attempt = 0
+        while True:
+            span.set(attempts=attempt + 1)
+            if cancelled():
+                raise RequestCancelled()
+            self.breaker.before()
+            try:
+                with interruptible(token, abortable):
+                    res = self.session.request(
+                        method, f"{self.base_url}{path}", **kwargs
+                    )
+            except requests.RequestException as error:
+                if cancelled():
+                    # Aborted on purpose: not a failure of the server
+                    raise RequestCancelled() from error
+                self.breaker.record_failure()
+                if attempt >= retries or (token is not None and token.cancelled):
+                    raise
+                delay = backoff_delay(attempt)
+            else:
+                span.set(status=res.status_code)
+                if res.status_code not in _RETRY_STATUSES:
+                    self.breaker.record_success()
+                    if res.status_code not in expected:
+                        raise ApiError.from_response(res)
+                    return res
+                self.breaker.record_failure()
+                if attempt >= retries or (token is not None and token.cancelled):
+                    raise ServerError.from_response(res)
+                delay = self._retry_after(res, attempt)
+                res.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def _timeout(self, path: str) -> tuple:
+        """
+        (connect, read) timeouts for a path: the longest matching prefix in
+        self.timeouts, else self.default_timeout.
+        """
+        matches = [prefix for prefix in self.timeouts if path.startswith(prefix)]
+        return self.timeouts[max(matches, key=len)] if matches else self.default_timeout
+
+    @staticmethod
+    def _retry_after(res, attempt: int) -> float:
+        """
+        Delay before retrying a 502/503/504: the server's Retry-After in
+        seconds when given (capped like the backoff), else the backoff.
+        """
+        try:
+            return min(float(res.headers["Retry-After"]), RETRY_BACKOFF_CAP_SECONDS)
+        except (KeyError, ValueError):
+            return backoff_delay(attempt)
+
+    def _get_json(
+        self,
+        path: str,
+        params: dict = None,
+        decode=None,
+        cache: ResponseCache = None,
+        token: Token = None,
+    ):
+        """
+        GET a JSON body through the response cache.
+        Fresh entries skip the network; stale ones are revalidated with
+        If-None-Match/If-Modified-Since so an unchanged body costs a 304.
+        Concurrent calls for the same path and parameters share one request.
+        :param decode: Turns the JSON body into the value cached and returned,
+            so the raw dicts are not kept alive next to the decoded objects
+        :param cache: Cache to go through, self.cache if omitted
+        :param token: Generation token of the fetch; once it is cancelled the
+            connection is aborted and RequestCancelled raised before decoding
+        """
+        cache = cache if cache is not None else self.cache
+        key = (path, tuple(sorted(params.items())) if params else ())
+        entry = cache.get(key)
+        if entry is not None and cache.is_fresh(entry):
+            return entry.data
+
+        try:
+            return self.flights.do(
+                ("GET",) + key,
+                lambda flight: self._fetch_json(
+                    cache, key, params, decode, token, flight
+                ),
+            )
+        except _UNREACHABLE:
+            if entry is None:
+                raise
+            # Server unreachable: the last known answer beats an error
+            return entry.data
+
+    def _fetch_json(
+        self, cache: ResponseCache, key: tuple, params: dict, decode, token, flight
+    ):
+        """
+        Send the GET behind _get_json and cache its decoded body.
+        """
+        path = key[0]
+        entry = cache.get(key)
+        if entry is not None and cache.is_fresh(entry):
+            # Filled by a request that finished while this one was being set up
+            return entry.data
+        if token is not None:
+            token.check()
+
+        with metrics.span("api", endpoint("GET", path)) as span:
+            res = self._request(
+                "GET",
+                path,
+                expected=(200, 304) if entry is not None else (200,),
+                token=token,
+                span=span,
+                flight=flight,
+                params=params,
+                headers=self._validators(entry),
+                stream=token is not None,
+            )
+            with res:
+                if token is not None:
+                    self._abort_on_cancel(token, res, flight)
+                if res.status_code == 304:
+                    cache.touch(key)
+                    return entry.data
+
+                try:
+                    body = res.content
+                except Exception:
+                    if token is not None and token.cancelled:
+                        raise RequestCancelled()
+                    raise
+                span.mark("download")
+                if token is not None and token.cancelled and not flight.waiters:
+                    raise RequestCancelled()
+                data = json.loads(body)
+                span.mark("decode")
+            if decode is not None:
+                data = decode(data)
+                span.mark("build")
+            span.set(bytes=len(body), items=len(data) if isinstance(data, list) else 1)
+            cache.put(
+                key, data, res.headers.get("ETag"), res.headers.get("Last-Modified")
+            )
+            return data
+
+    @staticmethod
+    def _abort_on_cancel(token: Token, res, flight):
+        """
+        Close a response as soon as its fetch is superseded, unless other
+        callers share it.
+        """
+        token.on_cancel(lambda: flight.waiters or res.close())
+
+    @staticmethod
+    def _validators(entry: CacheEntry):
+        """
+        Conditional request headers revalidating a cache entry, or None.
+        """
+        headers = {}
+        if entry is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+        return headers or None
+
+    # Account
+
+    def login(self, email: str, password: str):
+        """
+        Log in; the session keeps the returned auth cookies.
+        """
+        self._request(
+            "POST", "/account/login", json={"email": email, "password": password}
+        )
+        if self.session_store is not None:
+            self.session_store.save(self.session.cookies)
+
+    def restore_session(self) -> bool:
+        """
+        Load the auth cookies persisted by a previous login.
+        Returns whether there was a session to restore; check it with me().
+        """
+        if self.session_store is None:
+            return False
+        return self.session_store.load_into(self.session.cookies)
+
+    def forget_session(self):
+        """
+        Drop the auth cookies, in memory and on disk.
+        """
+        self.session.cookies.clear()
+        if self.session_store is not None:
+            self.session_store.clear()
+
+    def me(self) -> Account:
+        """
+        Fetch the account of the logged-in user.
+        """
+        data = self.flights.do(
+            ("GET", "/account/me", ()),
+            lambda _: self._request("GET", "/account/me").json(),
+        )
+        return Account(
+            data["id"],
+            data["first_name"],
+            data["last_name"],
+            data["email"],
+            data["role"],
+        )
+
+    def logout(self):
+        """
+        Log out and drop the session cookies.
+        """
+        self._request("POST", "/account/logout")
+        self.forget_session()
+        self.cache.clear()
+        self.application_cache.clear()
+        self.application_counts.clear()
+
+    def register(self, data: dict):
+        """
+        Register a new account.
+        """
+        self._request("POST", "/account/register", json=data)
+
+    def delete_account(self):
+        """
+        Permanently delete the logged-in account.
+        """
+        self._request("DELETE", "/account/delete")
+        self.forget_session()
+        self.cache.clear()
+        self.application_cache.clear()
+        self.application_counts.clear()
+
+    # Jobs
+
+    def list_jobs(
+        self,
+        min_salary: float = None,
+        max_salary: float = None,
+        offset: int = None,
+        limit: int = None,
+        token: Token = None,
+    ) -> list:
+        """
+        Fetch jobs, optionally restricted to a salary range and a page.
+        Parameters left as None are not sent; servers that do not support them
+        return the whole catalog, which callers must be ready to handle.
+        Once a server is known to ignore them they are no longer sent, so every
+        filter shares the single cached catalog instead of refetching it.
+        :param token: Generation token of the fetch, see _get_json
+        """
+        if self.job_query_supported is False:
+            return self.job_catalog(token).all()
+
+        params = self._job_params(min_salary, max_salary, offset, limit)
+        job_list = self._get_json("/job", params, decode=_decode_jobs, token=token)
+        self._learn_job_query_support(params, job_list, limit)
+        return list(job_list)
+
+    def stream_jobs(
+        self,
+        min_salary: float = None,
+        max_salary: float = None,
+        offset: int = None,
+        limit: int = None,
+        batch_size: int = STREAM_BATCH_SIZE,
+        token: Token = None,
+    ):
+        """
+        Like list_jobs, but yield jobs in batches while the body downloads.
+        The JSON array is decoded incrementally, so the first batch is available
+        after a few kilobytes and the raw body is never held in full. The
+        complete result is cached once the last batch has been read.
+        :param token: Generation token of the fetch; once it is cancelled the
+            download is aborted and nothing more is parsed
+        """
+        if self.job_query_supported is False:
+            params = None
+            # The catalog carries local create/update/delete patches
+            entry = self.cache.get(("/job", ()))
+            if entry is not None and self.cache.is_fresh(entry):
+                yield from _batches(self.job_catalog().all(), batch_size)
+                return
+        else:
+            params = self._job_params(min_salary, max_salary, offset, limit)
+            entry = None
+
+        key = ("/job", tuple(sorted(params.items())) if params else ())
+        entry = entry or self.cache.get(key)
+        if entry is not None and self.cache.is_fresh(entry):
+            yield from _batches(entry.data, batch_size)
+            return
+
+        # Share the download with identical concurrent reads, list_jobs included
+        flight_key = ("GET",) + key
+        while True:
+            if token is not None:
+                token.check()
+            flight, leader = self.flights.begin(flight_key)
+            if leader:
+                break
+            try:
+                shared = self.flights.wait(flight)
+            except FlightAbandoned:
+                continue
+            if params is None:
+                shared = self.job_catalog(token).all()
+            yield from _batches(shared, batch_size)
+            return
+
+        # Time the consumer spends between batches is charged to "stream"
+        span = metrics.span("api", "GET /job (streamed)")
+        finished = False
+        try:
+            if token is not None:
+                token.check()
+            try:
+                res = self._request(
+                    "GET",
+                    "/job",
+                    expected=(200, 304) if entry is not None else (200,),
+                    token=token,
+                    span=span,
+                    flight=flight,
+                    params=params,
+                    headers=self._validators(entry),
+                    stream=True,
+                )
+            except _UNREACHABLE:
+                if entry is None:
+                    raise
+                # Server unreachable: the last known answer beats an error
+                self.flights.finish(flight_key, flight, entry.data)
+                finished = True
+                cached = self.job_catalog().all() if params is None else entry.data
+                yield from _batches(cached, batch_size)
+                return
+            with res:
+                if token is not None:
+                    self._abort_on_cancel(token, res, flight)
+                if res.status_code == 304:
+                    self.cache.touch(key)
+                    self.flights.finish(flight_key, flight, entry.data)
+                    finished = True
+                    cached = self.job_catalog().all() if params is None else entry.data
+                    yield from _batches(cached, batch_size)
+                    return
+
+                job_list, batch = [], []
+                jobs = iter_json_array(res.iter_content(STREAM_CHUNK_BYTES))
+                try:
+                    for job_data in jobs:
+                        if token is not None and token.cancelled and not flight.waiters:
+                            raise RequestCancelled()
+                        batch.append(Job(**job_data))
+                        if len(batch) >= batch_size:
+                            if not job_list:
+                                span.mark("first_batch")
+                            job_list.extend(batch)
+                            full, batch = batch, []
+                            yield full
+                except GeneratorExit:
+                    if not flight.waiters:
+                        raise
+                    # Closed early, but others wait on this body: read the rest
+                    job_list.extend(batch)
+                    job_list.extend(Job(**job_data) for job_data in jobs)
+                    self._jobs_downloaded(key, res, job_list, params, limit)
+                    self.flights.finish(flight_key, flight, job_list)
+                    finished = True
+                    raise
+                except Exception:
+                    if token is not None and token.cancelled and not flight.waiters:
+                        # Aborted by the token: report it as such, not as a failure
+                        raise RequestCancelled()
+                    raise
+
+                job_list.extend(batch)
+                span.mark("stream")
+                span.set(items=len(job_list), bytes=res.raw.tell())
+                self._jobs_downloaded(key, res, job_list, params, limit)
+                self.flights.finish(flight_key, flight, job_list)
+                finished = True
+                if batch:
+                    yield batch
+        except GeneratorExit:
+            if not finished:
+                span.set(error="GeneratorExit")
+                self.flights.finish(flight_key, flight, error=FlightAbandoned())
+            raise
+        except BaseException as error:
+            span.set(error=type(error).__name__)
+            if not finished:
+                self.flights.finish(flight_key, flight, error=error)
+            raise
+        finally:
+            span.end()
+
+    def _jobs_downloaded(self, key, res, job_list: list, params: dict, limit: int):
+        """
+        Cache a fully streamed /job body and learn from it whether the server
+        honours paging.
+        """
+        self.cache.put(
+            key, job_list, res.headers.get("ETag"), res.headers.get("Last-Modified")
+        )
+        self._learn_job_query_support(params, job_list, limit)
+
+    @staticmethod
+    def _job_params(min_salary, max_salary, offset, limit):
+        """
+        Query parameters for /job, leaving out the ones not given.
+        """
+        params = {
+            name: value
+            for name, value in (
+                ("min_salary", min_salary),
+                ("max_salary", max_salary),
+                ("offset", offset),
+                ("limit", limit),
+            )
+            if value is not None
+        }
+        return params or None
+
+    def _learn_job_query_support(self, params: dict, job_list: list, limit: int):
+        """
+        Record whether the server honoured paging, judging by the first paged
+        response: more jobs than the limit means it sent the whole catalog.
+        """
+        if limit is None or self.job_query_supported is not None:
+            return
+        self.job_query_supported = len(job_list) <= limit
+        if not self.job_query_supported:
+            # The body is the whole catalog: reuse it for the bare /job key
+            entry = self.cache.get(("/job", tuple(sorted(params.items()))))
+            self.cache.put(("/job", ()), job_list, entry.etag, entry.last_modified)
+
+    def has_fresh_catalog(self) -> bool:
+        """
+        Whether job_catalog() can answer without touching the network.
+        """
+        entry = self.cache.get(("/job", ()))
+        return (
+            self.catalog is not None
+            and entry is not None
+            and entry.data is self._catalog_source
+            and self.cache.is_fresh(entry)
+        )
+
+    def job_catalog(self, token: Token = None) -> JobCatalog:
+        """
+        Return the whole catalog with its salary index.
+        The index is only rebuilt when the cached /job body actually changed;
+        otherwise the catalog kept up to date by create/update/delete is reused.
+        :param token: Generation token of the fetch, see _get_json
+        """
+        job_list = self._get_json("/job", decode=_decode_jobs, token=token)
+        if job_list is not self._catalog_source:
+            self.catalog = JobCatalog(job_list)
+            self._catalog_source = job_list
+        return self.catalog
+
+    def _jobs_changed(self, job: Job = None, removed_id: int = None):
+        """
+        Apply a job mutation to the indexed catalog, or invalidate cached job
+        lists when it cannot be applied locally. Paged and filtered lists are
+        invalidated either way: only the bare /job body is backed by the catalog.
+        """
+        if self.catalog is not None and (job is not None or removed_id is not None):
+            if job is not None:
+                self.catalog.upsert(job)
+            else:
+                self.catalog.remove(removed_id)
+            self.cache.invalidate("/job", with_params_only=True)
+            return
+        self.catalog = None
+        self._catalog_source = None
+        self.cache.invalidate("/job")
+
+    def create_job(self, data: dict):
+        """
+        Create a new job.
+        """
+        res = self._request("POST", "/job", expected=(200, 201, 204), json=data)
+        try:
+            created = res.json()
+            job = Job(**{**data, "job_id": created["job_id"]})
+        except (ValueError, TypeError, KeyError):
+            job = None
+        self._jobs_changed(job=job)
+
+    def update_job(self, job_id: int, data: dict):
+        """
+        Replace an existing job.
+        """
+        self._request("PUT", f"/job/{job_id}", expected=(200, 201, 204), json=data)
+        self._jobs_changed(job=Job(**{**data, "job_id": job_id}))
+
+    def delete_job(self, job_id: int):
+        """
+        Delete a job.
+        """
+        self._request("DELETE", f"/job/{job_id}", expected=(204,))
+        self._jobs_changed(removed_id=job_id)
+
+    # Applications
+
+    def get_applications_for_job(self, job_id: int, token: Token = None) -> list:
+        """
+        Fetch all applications submitted to a job.
+        :param token: Generation token of the fetch, see _get_json
+        """
+        return list(
+            self._get_json(
+                f"/application/job/{job_id}",
+                decode=_decode_applications,
+                cache=self.application_cache,
+                token=token,
+            )
+        )
+
+    def cached_applications(self, job_id: int) -> list:
+        """
+        Applications of a job as last fetched or prefetched, fresh or not,
+        without touching the network; None if they were never fetched.
+        """
+        entry = self.application_cache.get((f"/application/job/{job_id}", ()))
+        return None if entry is None else list(entry.data)
+
+    def has_fresh_applications(self, job_id: int) -> bool:
+        """
+        Whether get_applications_for_job can answer without touching the network.
+        """
+        entry = self.application_cache.get((f"/application/job/{job_id}", ()))
+        return entry is not None and self.application_cache.is_fresh(entry)
+
+    def stream_application_counts(
+        self, job_ids: list, concurrency: int = COUNTS_CONCURRENCY, token: Token = None
+    ):
+        """
+        Yield (job_id, {status: count}) for every job id.
+        One aggregate request is tried first: GET /application/counts with a
+        job_id parameter per job, answered by a JSON object mapping each job id
+        to its counts. Servers without it get a bounded parallel fan-out of
+        /application/job/{id} requests instead, which also warms the application
+        cache. Closing the generator cancels the requests not started yet.
+        Jobs whose list cannot be fetched are left out.
+        :param token: Generation token of the fan-out; cancelling it aborts the
+            requests in flight
+        """
+        if self.counts_endpoint_supported is not False:
+            try:
+                body = self._request(
+                    "GET", "/application/counts", params={"job_id": job_ids}
+                ).json()
+            except ApiError as error:
+                if error.status_code not in (404, 405, 501):
+                    raise
+                body = None
+            except ValueError:
+                body = None
+            self.counts_endpoint_supported = isinstance(body, dict)
+            if self.counts_endpoint_supported:
+                for job_id in job_ids:
+                    counts = body.get(str(job_id))
+                    if isinstance(counts, dict):
+                        yield job_id, {k.lower(): v for k, v in counts.items()}
+                return
+
+        for job_id, applications, error in run_bounded(
+            lambda job_id: self.get_applications_for_job(job_id, token),
+            job_ids,
+            concurrency,
+        ):
+            if error is None:
+                yield job_id, count_statuses(applications)
+
+    def create_application(self, job_id: int, content: str) -> Application:
+        """
+        Submit a new application to a job.
+        Returns the created application when the server echoes it back, else None.
+        """
+        res = self._request(
+            "POST",
+            f"/application/job/{job_id}",
+            expected=(200, 201),
+            json={"content": content},
+        )
+        self.application_cache.invalidate(f"/application/job/{job_id}")
+        try:
+            return _decode_applications([res.json()])[0]
+        except (ValueError, TypeError, KeyError):
+            return None
+
+    def update_application(self, app: Application, status: str):
+        """
+        Change the status of an application.
+        """
+        self._request(
+            "PUT",
+            f"/application/{app.application_id}",
+            expected=(204,),
+            json={
+                "application_id": app.application_id,
+                "job_id": app.job_id,
+                "account_id": app.account_id,
+                "content": app.content,
+                "status": status,
+            },
+        )
+        self.application_cache.invalidate(f"/application/job/{app.job_id}")
+
+    def delete_application(self, application_id: int):
+        """
+        Withdraw an application.
+        """
+        self._request("DELETE", f"/application/{application_id}", expected=(204,))
+        self.application_cache.invalidate("/application/job/")
+
+
+def _decode_jobs(body: list) -> list:
+    """
+    Turn a /job JSON body into Job records.
+    """
+    return [Job(**job_data) for job_data in body]
+
+
+def _decode_applications(body: list) -> list:
+    """
+    Turn an /application/job/{id} JSON body into Application records.
+    """
+    return [
+        Application(
+            application_id=data["application_id"],
+            job_id=data["job_id"],
+            account_id=data["account_id"],
+            content=data["content"],
+            status=data["status"],
+        )
+        for data in body
+    ]
+
+
+def _batches(items: list, size: int):
+    """
+    Yield consecutive slices of items of at most size elements.
+    """
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
@@ -0,0 +1,85 @@
+import threading
+
+from api.singleflight import FlightAbandoned
+
+
+class RequestCancelled(FlightAbandoned):
+    """
+    Raised on a worker when the fetch it serves was superseded.
+    Callers sharing the request (see SingleFlight) send their own instead.
+    """
+
+
+class Token:
+    """
+    Identifies one fetch of a list view.
+    Calling the token tells whether it was cancelled, so it can be passed
+    straight to BackgroundRunner's cancelled= parameter; responses registered
+    with on_cancel() are closed the moment it is, aborting their connection.
+    """
+
+    def __init__(self):
+        self.cancelled = False
+        self._closers = []
+        self._lock = threading.Lock()
+
+    def __call__(self) -> bool:
+        return self.cancelled
+
+    def check(self):
+        """
+        Raise RequestCancelled if the fetch was superseded.
+        """
+        if self.cancelled:
+            raise RequestCancelled()
+
+    def on_cancel(self, closer):
+        """
+        Call closer() when the token is cancelled, right away if it already is.
+        """
+        with self._lock:
+            if not self.cancelled:
+                self._closers.append(closer)
+                return
+        closer()
+
+    def cancel(self):
+        """
+        Mark the fetch as superseded and run the registered closers.
+        """
+        with self._lock:
+            if self.cancelled:
+                return
+            self.cancelled = True
+            closers, self._closers = self._closers, []
+        for closer in closers:
+            try:
+                closer()
+            except Exception:
+                pass  # the worker notices the cancellation either way
+
+
+class Generation:
+    """
+    Hands out the tokens of a list view's fetches, newest wins: starting a
+    fetch cancels the one before, so a slow answer to an old filter can
+    never overwrite the current one nor waste time being parsed and drawn.
+    """
+
+    def __init__(self):
+        self.current = None
+
+    def next(self) -> Token:
+        """
+        Cancel the current fetch and return the token of a new one.
+        """
+        self.cancel()
+        self.current = Token()
+        return self.current
+
+    def cancel(self):
+        """
+        Cancel the current fetch, e.g. when the view is closed.
+        """
+        if self.current is not None:
+            self.current.cancel()
@@ -0,0 +1,156 @@
+import socket
+import threading
+from contextlib import contextmanager
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from api.generation import Token
+
+# Send in progress on the current thread, if it can be interrupted
+_local = threading.local()
+
+
+class _Send:
+    """
+    One request being sent under a token, and the connection carrying it.
+    """
+
+    def __init__(self, token: Token, abortable):
+        self.token = token
+        self.abortable = abortable
+        self.connection = None
+        self.aborted = False
+        self.done = False
+        self._lock = threading.Lock()
+
+    def attach(self, connection):
+        """
+        Record the connection the request goes out on.
+        """
+        with self._lock:
+            self.connection = connection
+            if self.aborted:
+                _shut(connection)
+
+    def abort(self):
+        """
+        Shut the connection down, waking the thread blocked on it, unless the
+        send is over or someone else still wants its answer.
+        """
+        with self._lock:
+            if self.done or (self.abortable is not None and not self.abortable()):
+                return
+            self.aborted = True
+            if self.connection is not None:
+                _shut(self.connection)
+
+    def finish(self):
+        """
+        The headers are in: from here on the response belongs to the caller.
+        """
+        with self._lock:
+            self.done = True
+
+
+def _shut(connection):
+    """
+    Shut down the socket of a connection; a no-op while it is still being
+    opened (connect() checks again once it is).
+    """
+    sock = getattr(connection, "sock", None)
+    if sock is not None:
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass  # already closed
+
+
+@contextmanager
+def interruptible(token: Token, abortable=None):
+    """
+    Let cancelling token abort the request sent inside the block, even while
+    it waits for the response headers, by shutting its connection down.
+    The sender then sees a connection error. Sessions must use
+    InterruptibleAdapter for this to have any effect.
+    :param abortable: Checked at cancellation time; when it returns False
+        the request is left alone (e.g. other callers share its answer)
+    """
+    if token is None:
+        yield
+        return
+    send = _local.send = _Send(token, abortable)
+    token.on_cancel(send.abort)
+    try:
+        yield
+    finally:
+        send.finish()
+        _local.send = None
+
+
+class _Interruptible:
+    """
+    Connection mixin: re-checks for an abort once the socket is open, since
+    a connection still connecting has no socket to shut down.
+    """
+
+    def connect(self):
+        """
+        Open the connection, then shut it straight down if the send was
+        aborted meanwhile.
+        """
+        super().connect()
+        send = getattr(_local, "send", None)
+        if send is not None and send.aborted:
+            _shut(self)
+
+
+class _InterruptibleHTTPConnection(_Interruptible, HTTPConnection):
+    pass
+
+
+class _InterruptibleHTTPSConnection(_Interruptible, HTTPSConnection):
+    pass
+
+
+class _InterruptiblePool:
+    """
+    Pool mixin handing every connection it lends to the send in progress.
+    """
+
+    def _get_conn(self, timeout=None):
+        """
+        Take a connection from the pool and attach it to the current send.
+        """
+        connection = super()._get_conn(timeout)
+        send = getattr(_local, "send", None)
+        if send is not None:
+            send.attach(connection)
+        return connection
+
+
+class _InterruptibleHTTPPool(_InterruptiblePool, HTTPConnectionPool):
+    ConnectionCls = _InterruptibleHTTPConnection
+
+
+class _InterruptibleHTTPSPool(_InterruptiblePool, HTTPSConnectionPool):
+    ConnectionCls = _InterruptibleHTTPSConnection
+
+
+class InterruptibleAdapter(HTTPAdapter):
+    """
+    HTTPAdapter whose connections can be shut down from another thread by
+    cancelling the token of an interruptible() block.
+    Connections through a proxy are not covered and wait for the response.
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        """
+        Build the pool manager with interruptible pools.
+        """
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _InterruptibleHTTPPool,
+            "https": _InterruptibleHTTPSPool,
+        }
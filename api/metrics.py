@@ -0,0 +1,293 @@
+import json
+import logging
+import os
+import queue
+import re
+import threading
+import time
+from collections import deque
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+from config import (
+    METRICS_BACKUPS,
+    METRICS_ENABLED,
+    METRICS_FILE,
+    METRICS_MAX_BYTES,
+    METRICS_SAMPLES,
+)
+
+_ID = re.compile(r"/\d+")
+# Operations closed early or superseded by the caller: recorded, not failures
+_CANCELLATIONS = frozenset({"GeneratorExit", "RequestCancelled"})
+
+
+def endpoint(method: str, path: str) -> str:
+    """
+    Name of the endpoint a request goes to, ids replaced by a placeholder so
+    every job or application shares one series (e.g. "GET /application/job/{id}").
+    """
+    return f"{method} {_ID.sub('/{id}', path)}"
+
+
+class Span:
+    """
+    Timing of one operation (a request, a render), split into phases.
+    mark(phase) charges the time since the previous mark to phase; marking the
+    same phase repeatedly accumulates. Fields such as status, bytes or widget
+    counts are attached with set(). Recorded when the span ends.
+    """
+
+    __slots__ = ("metrics", "kind", "name", "fields", "phases", "_start", "_last")
+
+    def __init__(self, metrics: "Metrics", kind: str, name: str, fields: dict):
+        self.metrics = metrics
+        self.kind = kind
+        self.name = name
+        self.fields = fields
+        self.phases = {}
+        self._start = self._last = time.perf_counter()
+
+    def mark(self, phase: str):
+        """
+        Charge the time since the previous mark (or the start) to phase.
+        """
+        now = time.perf_counter()
+        self.phases[phase] = self.phases.get(phase, 0.0) + (now - self._last) * 1000
+        self._last = now
+
+    def set(self, **fields):
+        """
+        Attach fields to the recorded event.
+        """
+        self.fields.update(fields)
+
+    def end(self):
+        """
+        Record the span.
+        """
+        self.phases["total"] = (time.perf_counter() - self._start) * 1000
+        self.metrics.record(self.kind, self.name, self.phases, self.fields)
+
+    def __enter__(self) -> "Span":
+        return self
+
+    def __exit__(self, error_type, error, traceback):
+        if error_type is not None:
+            self.fields["error"] = error_type.__name__
+        self.end()
+
+
+class _NullSpan:
+    """
+    What span() returns while recording is off: every method does nothing.
+    """
+
+    __slots__ = ()
+
+    def mark(self, phase: str):
+        pass
+
+    def set(self, **fields):
+        pass
+
+    def end(self):
+        pass
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, error_type, error, traceback):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Series:
+    """
+    Recent timings of one (kind, name), per phase, with counters.
+    """
+
+    def __init__(self, samples: int):
+        """
+        :param samples: Timings kept per phase
+        """
+        self.samples = samples
+        self.count = 0
+        self.errors = 0
+        self.counts = {}  # phase -> events that reached it
+        self.timings = {}  # phase -> deque of milliseconds
+        self.last = {}  # fields of the last event
+
+    def add(self, phases: dict, fields: dict):
+        """
+        Account for one event.
+        """
+        self.count += 1
+        error = fields.get("error")
+        if error not in (None, *_CANCELLATIONS) or fields.get("status", 0) >= 400:
+            self.errors += 1
+        for phase, ms in phases.items():
+            self.counts[phase] = self.counts.get(phase, 0) + 1
+            timings = self.timings.get(phase)
+            if timings is None:
+                timings = self.timings[phase] = deque(maxlen=self.samples)
+            timings.append(ms)
+        self.last = fields
+
+
+def percentile(ordered: list, p: float) -> float:
+    """
+    Nearest-rank percentile p (0-100) of an ascending list.
+    """
+    rank = max(int(round(p / 100 * len(ordered) + 0.5)) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+class Metrics:
+    """
+    Collects timings of API requests and UI refreshes.
+    Every event is appended to a rotating JSONL log, written by a background
+    thread so callers never wait on the disk, and kept in memory for the
+    percentiles shown by the diagnostics window. While disabled, span()
+    returns a shared object whose methods do nothing, so instrumented code
+    pays one attribute check. Thread-safe.
+    """
+
+    def __init__(
+        self,
+        path: str = METRICS_FILE,
+        max_bytes: int = METRICS_MAX_BYTES,
+        backups: int = METRICS_BACKUPS,
+        samples: int = METRICS_SAMPLES,
+        enabled: bool = METRICS_ENABLED,
+    ):
+        """
+        :param path: JSONL log file, None to keep events in memory only
+        :param max_bytes: Size at which the log is rotated
+        :param backups: Rotated logs kept (metrics.jsonl.1, .2, ...)
+        :param samples: Timings kept in memory per phase for the percentiles
+        :param enabled: Start recording right away
+        """
+        self.path = os.path.expanduser(path) if path else None
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.samples = samples
+        self.enabled = False
+        self.series = {}  # (kind, name) -> Series
+        self._lock = threading.Lock()
+        self._logger = logging.getLogger("jobconnect.metrics")
+        self._logger.propagate = False
+        self._logger.setLevel(logging.INFO)
+        self._listener = None
+        if enabled:
+            self.enable()
+
+    def enable(self):
+        """
+        Start recording, opening the log.
+        """
+        if self.enabled:
+            return
+        if self.path is not None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            events = queue.SimpleQueue()
+            file_handler = RotatingFileHandler(
+                self.path, maxBytes=self.max_bytes, backupCount=self.backups
+            )
+            self._listener = QueueListener(events, file_handler)
+            self._logger.addHandler(QueueHandler(events))
+            self._listener.start()
+        self.enabled = True
+
+    def disable(self):
+        """
+        Stop recording, flushing and closing the log. Collected timings stay
+        available until clear().
+        """
+        if not self.enabled:
+            return
+        self.enabled = False
+        if self._listener is not None:
+            for handler in list(self._logger.handlers):
+                self._logger.removeHandler(handler)
+            self._listener.stop()
+            for handler in self._listener.handlers:
+                handler.close()
+            self._listener = None
+
+    def span(self, kind: str, name: str, **fields):
+        """
+        Start timing an operation; end() it, or use it as a context manager.
+        :param kind: "api" or "ui"
+        :param name: Endpoint or view, e.g. "GET /job" or "jobs"
+        :param fields: Initial fields of the event
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return Span(self, kind, name, fields)
+
+    def record(self, kind: str, name: str, phases: dict, fields: dict):
+        """
+        Record an event: phase timings in milliseconds and extra fields.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            series = self.series.get((kind, name))
+            if series is None:
+                series = self.series[(kind, name)] = Series(self.samples)
+            series.add(phases, fields)
+        if self._logger.handlers:
+            event = {"ts": round(time.time(), 3), "kind": kind, "name": name}
+            event.update((f"{phase}_ms", round(ms, 3)) for phase, ms in phases.items())
+            event.update(fields)
+            self._logger.info(json.dumps(event, default=str))
+
+    def summary(self) -> list:
+        """
+        One row per (kind, name, phase) seen: events that reached the phase,
+        failed events of the series, p50, p95, p99 and max in milliseconds, and
+        the fields of the last event.
+        """
+        rows = []
+        with self._lock:
+            for (kind, name), series in sorted(self.series.items()):
+                for phase, timings in series.timings.items():
+                    ordered = sorted(timings)
+                    rows.append(
+                        {
+                            "kind": kind,
+                            "name": name,
+                            "phase": phase,
+                            "count": series.counts[phase],
+                            "errors": series.errors,
+                            "p50": percentile(ordered, 50),
+                            "p95": percentile(ordered, 95),
+                            "p99": percentile(ordered, 99),
+                            "max": ordered[-1],
+                            "last": dict(series.last),
+                        }
+                    )
+        return rows
+
+    def timings(self, kind: str, name: str, phase: str) -> list:
+        """
+        Recent timings of one phase, oldest first, e.g. to draw a histogram.
+        """
+        with self._lock:
+            series = self.series.get((kind, name))
+            if series is None:
+                return []
+            return list(series.timings.get(phase, ()))
+
+    def clear(self):
+        """
+        Forget the collected timings (the log is left alone).
+        """
+        with self._lock:
+            self.series.clear()
+
+
+# Shared by the client and every view
+metrics = Metrics()
@@ -0,0 +1,184 @@
+from api.client import JobConnectClient
+from api.generation import Token
+from config import JOB_PAGE_SIZE
+from objects import Job
+
+
+class JobPager:
+    """
+    Walks the job catalog page by page for a salary range, using the server's
+    min_salary/max_salary/offset/limit query parameters.
+    When the server ignores them it falls back to a salary range query on the
+    client's indexed catalog and pages over the result locally.
+    fetch() blocks and is meant to run on a background worker, one call at a time.
+    """
+
+    def __init__(
+        self,
+        client: JobConnectClient,
+        min_salary: float = None,
+        max_salary: float = None,
+        page_size: int = JOB_PAGE_SIZE,
+    ):
+        """
+        :param client: API client used to fetch pages
+        :param min_salary: Lowest salary to include, or None
+        :param max_salary: Highest salary to include, or None
+        :param page_size: Jobs requested per page
+        """
+        self.client = client
+        self.min_salary = min_salary
+        self.max_salary = max_salary
+        self.page_size = page_size
+        self.offset = 0
+        self.exhausted = False
+        self._local = None  # full filtered catalog when the server ignores paging
+        self._first_id = None
+
+    @property
+    def filtered(self) -> bool:
+        """
+        Whether the pages are a subset of the catalog rather than all of it.
+        """
+        return self.min_salary is not None or self.max_salary is not None
+
+    def matches(self, job: Job) -> bool:
+        """
+        Whether a job falls inside the salary range.
+        """
+        if self.min_salary is not None and job.salary < self.min_salary:
+            return False
+        if self.max_salary is not None and job.salary > self.max_salary:
+            return False
+        return True
+
+    def stream(self, limit: int = None, token: Token = None):
+        """
+        Yield the first page in batches while it downloads, for progressive
+        rendering. If the server turns out to ignore paging, the whole catalog
+        streams in but only the first limit matching jobs are yielded; later
+        pages come from the indexed catalog, exactly as fetch() pages it.
+        :param limit: Page size for this call, defaults to page_size
+        :param token: Generation token aborting the download once superseded
+        """
+        limit = limit or self.page_size
+        if self.client.job_query_supported is False and self.client.has_fresh_catalog():
+            # Nothing to download: the salary index answers directly
+            yield self.fetch(limit, token)
+            return
+
+        total = shown = 0
+        for batch in self.client.stream_jobs(
+            self.min_salary, self.max_salary, offset=0, limit=limit, token=token
+        ):
+            if not total and batch:
+                self._first_id = batch[0].job_id
+            total += len(batch)
+            matching = [job for job in batch if self.matches(job)][: limit - shown]
+            if matching:
+                shown += len(matching)
+                yield matching
+
+        if self.client.job_query_supported is False:
+            # The catalog is cached now: page over its salary index from here on
+            self._local = self.client.job_catalog(token).range(
+                self.min_salary, self.max_salary
+            )
+            self.offset = shown
+            self.exhausted = self.offset >= len(self._local)
+        else:
+            self.offset = total
+            self.exhausted = total < limit
+
+    def fetch(self, limit: int = None, token: Token = None) -> list:
+        """
+        Return the next page of matching jobs.
+        :param limit: Page size for this call, defaults to page_size
+        :param token: Generation token aborting the request once superseded
+        """
+        limit = limit or self.page_size
+
+        if self._local is None and self.client.job_query_supported is False:
+            self._local = self.client.job_catalog(token).range(
+                self.min_salary, self.max_salary
+            )
+
+        if self._local is None:
+            jobs = self.client.list_jobs(
+                min_salary=self.min_salary,
+                max_salary=self.max_salary,
+                offset=self.offset,
+                limit=limit,
+                token=token,
+            )
+            if self.offset and jobs and jobs[0].job_id == self._first_id:
+                # Server ignored the offset and sent the first page again
+                self.exhausted = True
+                return []
+            if len(jobs) <= limit:
+                if not self.offset and jobs:
+                    self._first_id = jobs[0].job_id
+                self.offset += len(jobs)
+                self.exhausted = len(jobs) < limit
+                # No-op when the server applied the salary range itself
+                return [job for job in jobs if self.matches(job)]
+
+            # Server ignored paging and sent the whole catalog
+            self._local = self.client.job_catalog(token).range(
+                self.min_salary, self.max_salary
+            )
+
+        page = self._local[self.offset : self.offset + limit]
+        self.offset += len(page)
+        self.exhausted = self.offset >= len(self._local)
+        return page
+
+
+class JobSearch(JobPager):
+    """
+    Pages through the results of a full-text search over the client's indexed
+    catalog, restricted to a salary range.
+    Only the ids are computed up front; jobs are looked up a page at a time.
+    """
+
+    def __init__(
+        self,
+        client: JobConnectClient,
+        query: str,
+        min_salary: float = None,
+        max_salary: float = None,
+        page_size: int = JOB_PAGE_SIZE,
+    ):
+        """
+        :param query: Search terms, each matched as a word prefix
+        """
+        super().__init__(client, min_salary, max_salary, page_size)
+        self.query = query
+        self._ids = None
+
+    @property
+    def filtered(self) -> bool:
+        """
+        Search results are always a subset of the catalog.
+        """
+        return True
+
+    def fetch(self, limit: int = None, token: Token = None) -> list:
+        """
+        Return the next page of matching jobs.
+        :param limit: Page size for this call, defaults to page_size
+        :param token: Generation token aborting the request once superseded
+        """
+        limit = limit or self.page_size
+        catalog = self.client.job_catalog(token)
+        if self._ids is None:
+            self._ids = catalog.search(self.query)
+
+        page = []
+        while self.offset < len(self._ids) and len(page) < limit:
+            job = catalog.get(self._ids[self.offset])
+            self.offset += 1
+            if job is not None and self.matches(job):
+                page.append(job)
+        self.exhausted = self.offset >= len(self._ids)
+        return page
@@ -0,0 +1,143 @@
+import time
+import tkinter as tk
+from collections import deque
+
+from api.background import get_runner
+from api.client import ApiError
+from config import (
+    PREFETCH_BUDGET,
+    PREFETCH_CONCURRENCY,
+    PREFETCH_DELAY_MS,
+    PREFETCH_WINDOW_SECONDS,
+)
+
+
+class Prefetcher:
+    """
+    Warms a cache in the background while Tk is idle.
+    Keys are requested by what is on screen; only the latest request is kept,
+    so scrolling past items never queues work for them. At most concurrency
+    fetches run at once and at most budget start per window of seconds, so
+    prefetching stays a trickle next to the requests the user asked for.
+    """
+
+    def __init__(
+        self,
+        widget: tk.Misc,
+        fetch,
+        is_fresh,
+        concurrency: int = PREFETCH_CONCURRENCY,
+        budget: int = PREFETCH_BUDGET,
+        window: float = PREFETCH_WINDOW_SECONDS,
+        delay_ms: int = PREFETCH_DELAY_MS,
+        clock=time.monotonic,
+    ):
+        """
+        :param widget: Widget whose event loop schedules the work
+        :param fetch: Blocking call fetch(key) filling the cache, run on a worker
+        :param is_fresh: is_fresh(key), True when fetching key would be wasted
+        :param concurrency: Prefetches running at the same time
+        :param budget: Prefetches started per window
+        :param window: Length of the budget window in seconds
+        :param delay_ms: Quiet time after the last request before prefetching,
+            so a fast scroll settles first
+        :param clock: Monotonic time source
+        """
+        self.widget = widget
+        self.fetch = fetch
+        self.is_fresh = is_fresh
+        self.concurrency = concurrency
+        self.budget = budget
+        self.window = window
+        self.delay_ms = delay_ms
+        self.clock = clock
+
+        self.queue = deque()  # keys still wanted, most wanted first
+        self.in_flight = set()
+        self.started = deque()  # start times of the prefetches in the window
+        self.enabled = True
+        self._timer = None
+        self._idle_pending = False
+
+    def want(self, keys: list):
+        """
+        Replace the keys to prefetch, e.g. with the items now on screen.
+        """
+        self.queue = deque(keys)
+        self._restart_timer(self.delay_ms)
+
+    def prioritize(self, key):
+        """
+        Prefetch key before anything else, e.g. on hover.
+        """
+        try:
+            self.queue.remove(key)
+        except ValueError:
+            pass
+        self.queue.appendleft(key)
+        self._schedule()
+
+    def _restart_timer(self, delay_ms: int):
+        """
+        Run the queue once delay_ms pass without another request.
+        """
+        try:
+            if self._timer is not None:
+                self.widget.after_cancel(self._timer)
+            self._timer = self.widget.after(delay_ms, self._schedule)
+        except tk.TclError:
+            pass
+
+    def _schedule(self):
+        """
+        Run the queue on the next idle cycle.
+        """
+        self._timer = None
+        if self._idle_pending:
+            return
+        try:
+            self.widget.after_idle(self._pump)
+            self._idle_pending = True
+        except tk.TclError:
+            pass
+
+    def _pump(self):
+        """
+        Start prefetches while slots and budget allow.
+        """
+        self._idle_pending = False
+        now = self.clock()
+        while self.started and now - self.started[0] >= self.window:
+            self.started.popleft()
+
+        while self.enabled and self.queue and len(self.in_flight) < self.concurrency:
+            if len(self.started) >= self.budget:
+                # Out of budget: come back when the oldest prefetch leaves the window
+                wait = self.window - (now - self.started[0])
+                self._restart_timer(int(wait * 1000) + 1)
+                return
+            key = self.queue.popleft()
+            if key in self.in_flight or self.is_fresh(key):
+                continue
+            self.in_flight.add(key)
+            self.started.append(now)
+            get_runner(self.widget).submit(
+                self.fetch,
+                key,
+                on_success=lambda _, k=key: self._finished(k),
+                on_error=lambda e, k=key: self._finished(k, e),
+            )
+
+    def _finished(self, key, error: Exception = None):
+        """
+        Free the slot of a completed prefetch and carry on with the queue.
+        Failures are not retried; a refused request stops prefetching for good
+        since every other key would be refused too.
+        """
+        self.in_flight.discard(key)
+        if isinstance(error, ApiError) and error.status_code in (401, 403):
+            self.enabled = False
+            self.queue.clear()
+            return
+        if self.queue:
+            self._schedule()
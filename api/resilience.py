@@ -0,0 +1,107 @@
+import random
+import threading
+import time
+
+from config import (
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_RESET_SECONDS,
+    RETRY_BACKOFF_CAP_SECONDS,
+    RETRY_BACKOFF_SECONDS,
+)
+
+
+class ServiceUnavailable(Exception):
+    """
+    Raised without touching the network while the circuit breaker is open.
+    """
+
+    def __init__(self, retry_in: float):
+        """
+        :param retry_in: Seconds until the next request is let through as a probe
+        """
+        super().__init__(
+            "The JobConnect server is not responding. "
+            f"Trying again in {max(retry_in, 0):.0f} s."
+        )
+        self.retry_in = retry_in
+
+
+def backoff_delay(attempt: int, rng=random) -> float:
+    """
+    Seconds to wait before retry number attempt (0 for the first retry):
+    exponential backoff with full jitter, so clients that failed together do
+    not retry together.
+    """
+    return rng.uniform(
+        0, min(RETRY_BACKOFF_CAP_SECONDS, RETRY_BACKOFF_SECONDS * 2**attempt)
+    )
+
+
+class CircuitBreaker:
+    """
+    Fails fast while the API is unhealthy.
+    Closed: requests flow and consecutive failures are counted. After
+    failure_threshold of them it opens: every request raises
+    ServiceUnavailable at once for reset_seconds. Then it is half open: a
+    single probe request is let through; its success closes the breaker, its
+    failure opens it again. Thread-safe.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(
+        self,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        reset_seconds: float = BREAKER_RESET_SECONDS,
+        clock=time.monotonic,
+    ):
+        """
+        :param failure_threshold: Consecutive failures that open the breaker
+        :param reset_seconds: Time spent open before probing for recovery
+        :param clock: Monotonic time source
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.clock = clock
+        self.state = self.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def before(self):
+        """
+        Let a request through or raise ServiceUnavailable.
+        """
+        with self._lock:
+            if self.state == self.CLOSED:
+                return
+            retry_in = self._opened_at + self.reset_seconds - self.clock()
+            if self.state == self.OPEN and retry_in <= 0:
+                self.state = self.HALF_OPEN
+            if self.state == self.HALF_OPEN and not self._probing:
+                self._probing = True
+                return
+            raise ServiceUnavailable(max(retry_in, 0))
+
+    def record_success(self):
+        """
+        The API answered: close the breaker.
+        """
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self._probing = False
+
+    def record_failure(self):
+        """
+        The API failed to answer (timeout, connection error, 5xx).
+        """
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self._opened_at = self.clock()
+            self._probing = False
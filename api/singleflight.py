@@ -0,0 +1,115 @@
+import threading
+from concurrent.futures import Future
+
+
+class FlightAbandoned(Exception):
+    """
+    Raised to callers sharing a request whose leader stopped before the
+    response was complete; they should issue the request themselves.
+    """
+
+
+class Flight:
+    """
+    One request in progress and the number of callers waiting on it.
+    """
+
+    __slots__ = ("future", "waiters")
+
+    def __init__(self):
+        self.future = Future()
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical reads.
+    The first caller for a key (the leader) performs the request; callers
+    arriving while it is in flight wait for its outcome instead of sending the
+    same request again, and receive the same result or exception.
+    Thread-safe: meant to be shared by every background worker.
+    """
+
+    def __init__(self):
+        self._flights = {}  # key -> Flight in progress
+        self._lock = threading.Lock()
+        self.executed = 0  # requests actually sent
+        self.coalesced = 0  # callers served by another caller's request
+
+    def begin(self, key) -> tuple:
+        """
+        Join the flight for key, or start one.
+        Returns (flight, leader): a leader must call finish() exactly once;
+        other callers wait() for it.
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None:
+                flight.waiters += 1
+                return flight, False
+            flight = self._flights[key] = Flight()
+            self.executed += 1
+            return flight, True
+
+    def finish(self, key, flight: Flight, result=None, error: BaseException = None):
+        """
+        Hand the outcome of a leader's request to everyone waiting on it.
+        """
+        with self._lock:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+        if error is not None:
+            flight.future.set_exception(error)
+        else:
+            flight.future.set_result(result)
+
+    def wait(self, flight: Flight):
+        """
+        Wait for a flight joined as a follower and return its result, raising
+        the leader's exception, or FlightAbandoned if there is no result to share.
+        """
+        try:
+            result = flight.future.result()
+        except FlightAbandoned:
+            raise
+        except BaseException:
+            self._count_coalesced()
+            raise
+        self._count_coalesced()
+        return result
+
+    def _count_coalesced(self):
+        """
+        Record a caller served without sending its own request.
+        """
+        with self._lock:
+            self.coalesced += 1
+
+    def do(self, key, fn):
+        """
+        Return fn(flight), sharing a single call among concurrent callers of key.
+        fn gets the flight it leads, e.g. to check whether anyone waits on it.
+        """
+        while True:
+            flight, leader = self.begin(key)
+            if leader:
+                break
+            try:
+                return self.wait(flight)
+            except FlightAbandoned:
+                continue
+
+        try:
+            result = fn(flight)
+        except BaseException as error:
+            self.finish(key, flight, error=error)
+            raise
+        self.finish(key, flight, result)
+        return result
+
+    def stats(self) -> dict:
+        """
+        Counters: requests sent and callers that shared one instead.
+        """
+        with self._lock:
+            return {"executed": self.executed, "coalesced": self.coalesced}
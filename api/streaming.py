@@ -0,0 +1,52 @@
+import codecs
+import json
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+
+
+def iter_json_array(chunks):
+    """
+    Incrementally decode a JSON array of objects from an iterable of byte chunks,
+    yielding each element as soon as its closing brace has arrived.
+    Only the undecoded tail is buffered, so neither the whole body nor the
+    whole decoded list is ever held at once.
+    :param chunks: Iterable of bytes, e.g. Response.iter_content()
+    """
+    text = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    position = 0
+    started = False
+
+    for chunk in chunks:
+        buffer = buffer[position:] + text.decode(chunk)
+        position = 0
+
+        while True:
+            while position < len(buffer) and buffer[position] in _WHITESPACE:
+                position += 1
+            if position == len(buffer):
+                break
+
+            if not started:
+                if buffer[position] != "[":
+                    raise ValueError("Expected a JSON array")
+                started = True
+                position += 1
+                continue
+
+            char = buffer[position]
+            if char == "]":
+                return
+            if char == ",":
+                position += 1
+                continue
+
+            try:
+                element, position = _decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                # Element not complete yet: wait for the next chunk
+                break
+            yield element
+
+    raise ValueError("Truncated JSON array")
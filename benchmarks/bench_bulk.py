@@ -0,0 +1,91 @@
+"""
+Bulk status change wall time against the local stand-in API with injected
+latency: one PUT after another versus the bounded-concurrency pipeline used by
+the triage toolbar. Every PUT goes through JobConnectClient.update_application,
+so its connection pool, retries and circuit breaker are part of the timing.
+16 in flight is more than HTTP_POOL_MAXSIZE, so some connections are opened
+per request and discarded (urllib3 warns about it).
+
+Run from the repository root:
+    python -m benchmarks.bench_bulk [count] [round_trip_ms]
+"""
+
+import sys
+import time
+
+from api.bulk import run_bounded
+from api.client import JobConnectClient
+from benchmarks.stand_in_server import PASSWORD, Faults, StandInServer
+from config import BULK_CONCURRENCY
+
+JOB_ID = 1
+STATUSES = ("accepted", "rejected")
+
+
+def sequential(put, apps: list) -> int:
+    """
+    What the per-card buttons amount to: one request at a time.
+    Returns the number of failed updates.
+    """
+    failed = 0
+    for app in apps:
+        try:
+            put(app)
+        except Exception:
+            failed += 1
+    return failed
+
+
+def pipelined(put, apps: list, concurrency: int) -> int:
+    """
+    Drain run_bounded, returning the number of failed updates.
+    """
+    return sum(1 for _, _, error in run_bounded(put, apps, concurrency) if error)
+
+
+def timed(fn, *args) -> tuple:
+    """
+    (wall time in seconds, result) of fn(*args).
+    """
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+def main(count: int = 500, round_trip_ms: float = 40.0):
+    server = StandInServer(
+        jobs=JOB_ID, applications=count, faults=Faults(latency=round_trip_ms / 1000)
+    ).start()
+    client = JobConnectClient(server.url)
+    try:
+        client.login("recruiter@test.com", PASSWORD)
+        apps = client.get_applications_for_job(JOB_ID)
+        runs = [("sequential", sequential, ())] + [
+            (f"{concurrency} in flight", pipelined, (concurrency,))
+            for concurrency in sorted({4, BULK_CONCURRENCY, 16})
+        ]
+
+        print(f"{len(apps)} updates, {round_trip_ms:.0f} ms injected per request")
+        print(f"{'strategy':>14} {'seconds':>8} {'failed':>7} {'requests':>9}")
+        for n, (name, run, args) in enumerate(runs):
+            # A different status every run, so each PUT really changes something
+            status = STATUSES[n % len(STATUSES)]
+            before = server.requests
+            seconds, failed = timed(
+                run,
+                lambda app: client.update_application(app, status),
+                apps,
+                *args,
+            )
+            requests = server.requests - before
+            print(f"{name:>14} {seconds:>8.2f} {failed:>7} {requests:>9}")
+    finally:
+        client.close()
+        server.stop()
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 500,
+        float(sys.argv[2]) if len(sys.argv) > 2 else 40.0,
+    )
@@ -0,0 +1,187 @@
+"""
+Rendering a long card list in a scrollable frame, the way the applications
+window does: the previous reconcile loop (asking Tk for the pack order after
+every card, scrollregion refitted on every <Configure>) versus KeyedList's
+batched layout, in one pass and in idle-time slices.
+Reports the time until everything is laid out, the longest stretch the event
+loop was blocked (input latency) and how often the scrollregion was refitted.
+
+Needs a display; on a headless machine:
+    xvfb-run -a python -m benchmarks.bench_layout [count]
+
+Run from the repository root:
+    python -m benchmarks.bench_layout [count]
+"""
+
+import _tkinter
+import sys
+import time
+import tkinter as tk
+
+from config import RENDER_CHUNK_SIZE
+from widgets.keyed_list import KeyedList
+
+
+class Card(tk.Frame):
+    """
+    Stand-in for an application card: a few labels and buttons.
+    """
+
+    def __init__(self, parent: tk.Frame, item: tuple):
+        super().__init__(parent, relief="ridge", borderwidth=2, padx=15, pady=12)
+        self.content = tk.Label(self, anchor="w", justify="left", wraplength=550)
+        self.content.pack(fill="x")
+        self.status = tk.Label(self, font=("Arial", 10, "bold"))
+        self.status.pack(anchor="w")
+        for text in ("Mark pending", "Mark accepted"):
+            tk.Button(self, text=text, width=12).pack(side="left", padx=5)
+        self.set_item(item)
+
+    def set_item(self, item: tuple):
+        self.content.config(text=f"Content:\n{item[1]}")
+        self.status.config(text=f"Status: {item[2]}")
+
+
+class Scroller:
+    """
+    Canvas with a scrollable frame, counting scrollregion refits.
+    """
+
+    def __init__(self, root: tk.Tk):
+        self.canvas = tk.Canvas(root, width=700, height=500)
+        self.canvas.pack(fill="both", expand=True)
+        self.frame = tk.Frame(self.canvas)
+        self.canvas.create_window((0, 0), window=self.frame, anchor="nw")
+        self.refits = 0
+        configure = self.canvas.configure
+
+        def counting_configure(**options):
+            if "scrollregion" in options:
+                self.refits += 1
+            return configure(**options)
+
+        self.canvas.configure = counting_configure
+
+    def destroy(self):
+        """
+        Remove the canvas and every card in it.
+        """
+        self.canvas.destroy()
+
+
+def legacy_sync(parent: tk.Frame, items: list, cards: dict):
+    """
+    The reconcile loop KeyedList.sync used before batching: pack order
+    fetched from Tk again after every card it packs.
+    """
+    previous = None
+    slaves = parent.pack_slaves()
+    for item in items:
+        card = cards.get(item[0])
+        if card is None:
+            card = cards[item[0]] = Card(parent, item)
+            if previous is not None:
+                card.pack(after=previous, fill="x", padx=15, pady=10)
+            elif slaves:
+                card.pack(before=slaves[0], fill="x", padx=15, pady=10)
+            else:
+                card.pack(fill="x", padx=15, pady=10)
+            slaves = parent.pack_slaves()
+        previous = card
+
+
+def drain(root: tk.Tk, busy) -> float:
+    """
+    Process events until busy() is false and nothing is pending; returns the
+    longest single event or idle pass, in milliseconds.
+    """
+    longest = 0.0
+    while True:
+        start = time.perf_counter()
+        handled = root.tk.dooneevent(_tkinter.DONT_WAIT)
+        longest = max(longest, (time.perf_counter() - start) * 1000)
+        if not handled and not busy():
+            return longest
+
+
+def run(root: tk.Tk, name: str, items: list, render):
+    """
+    Render items in a fresh scroller and print the measurements.
+    """
+    scroller = Scroller(root)
+    root.update()
+    start = time.perf_counter()
+    busy = render(scroller, items)
+    first = (time.perf_counter() - start) * 1000
+    longest = max(first, drain(root, busy))
+    total = (time.perf_counter() - start) * 1000
+    cards = len(scroller.frame.pack_slaves())
+    print(f"{name:>24} {total:>9.0f} {longest:>11.0f} {scroller.refits:>7} {cards:>7}")
+    scroller.destroy()
+    root.update()
+
+
+def legacy(scroller: Scroller, items: list):
+    """
+    Render with the previous reconcile loop and a scrollregion refit on
+    every <Configure> of the frame.
+    """
+    canvas = scroller.canvas
+    scroller.frame.bind(
+        "<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+    )
+    legacy_sync(scroller.frame, items, {})
+    return lambda: False
+
+
+def keyed(chunk_size: int):
+    """
+    Renderer syncing a KeyedList laid out chunk_size cards per idle cycle.
+    """
+
+    def render(scroller: Scroller, items: list):
+        cards = KeyedList(
+            scroller.frame,
+            key=lambda item: item[0],
+            create_card=lambda item: Card(scroller.frame, item),
+            canvas=scroller.canvas,
+            chunk_size=chunk_size,
+            fill="x",
+            padx=15,
+            pady=10,
+        )
+        cards.sync(items)
+        return lambda: cards.rendering
+
+    return render
+
+
+def main(count: int = 5000):
+    """
+    Render count cards with each strategy and print one line per strategy.
+    """
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        print("No display: run under xvfb-run -a")
+        return
+    root.geometry("720x520")
+    items = [(i, f"Cover letter {i} " * 8, "pending") for i in range(count)]
+
+    print(f"{count} cards")
+    print(
+        f"{'strategy':>24} {'total ms':>9} {'longest ms':>11} {'refits':>7} {'cards':>7}"
+    )
+    run(root, "per-card pack_slaves", items, legacy)
+    run(root, "batched, one pass", items, keyed(count))
+    run(
+        root,
+        f"batched, {RENDER_CHUNK_SIZE}/idle slice",
+        items,
+        keyed(RENDER_CHUNK_SIZE),
+    )
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
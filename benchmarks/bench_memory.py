@@ -0,0 +1,102 @@
+"""
+Resident memory of a decoded job catalog: the original representation
+(raw JSON dicts kept next to one __dict__-based Job per row) versus the
+slotted, interned Job records the client now keeps, with and without the
+JobCatalog salary index on top.
+
+Run from the repository root:
+    python -m benchmarks.bench_memory [job_count]
+"""
+
+import gc
+import json
+import sys
+import tracemalloc
+
+from benchmarks.bench_search import make_jobs
+from objects import Job
+from store.catalog import JobCatalog
+
+
+class LegacyJob:
+    """
+    The Job class as it was before: a plain class with a per-instance __dict__.
+    """
+
+    def __init__(self, job_id, title, description, salary, location):
+        self.job_id = job_id
+        self.title = title
+        self.description = description
+        self.salary = salary
+        self.location = location
+
+
+def make_body(count: int) -> bytes:
+    """
+    Serialize count synthetic jobs the way the /job endpoint would.
+    """
+    return json.dumps(
+        [
+            {
+                "job_id": job.job_id,
+                "title": job.title,
+                "description": job.description,
+                "salary": job.salary,
+                "location": job.location,
+            }
+            for job in make_jobs(count)
+        ]
+    ).encode()
+
+
+def legacy(body: bytes):
+    """
+    What refresh_jobs used to keep: the decoded dicts plus a Job per row.
+    """
+    raw = json.loads(body)
+    return raw, [LegacyJob(**job_data) for job_data in raw]
+
+
+def slotted(body: bytes):
+    """
+    What the client caches now: slotted Job records only.
+    """
+    return [Job(**job_data) for job_data in json.loads(body)]
+
+
+def indexed(body: bytes):
+    """
+    Slotted Job records held by a JobCatalog with its salary column.
+    """
+    return JobCatalog(Job(**job_data) for job_data in json.loads(body))
+
+
+def retained_mb(build, body: bytes) -> float:
+    """
+    Memory still allocated after build(body) returns, in megabytes.
+    """
+    gc.collect()
+    tracemalloc.start()
+    result = build(body)
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current / 1024 / 1024
+
+
+def main(count: int = 100_000):
+    body = make_body(count)
+    print(f"{count} jobs, JSON body {len(body) / 1024 / 1024:.1f} MB")
+    baseline = retained_mb(legacy, body)
+    for name, build in [
+        ("dicts + legacy Job", legacy),
+        ("slotted Job", slotted),
+        ("slotted Job + JobCatalog", indexed),
+    ]:
+        size = retained_mb(build, body)
+        print(f"{name:>26} {size:8.1f} MB  {size / baseline:6.1%}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
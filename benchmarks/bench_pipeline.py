@@ -0,0 +1,291 @@
+"""
+End-to-end cost of the job and application list pipelines on synthetic
+datasets, against the local stand-in API.
+
+The data half (download, decode, salary filter, card text) needs no display.
+The widget half (JobsTab refresh and filter, per-card cost,
+JobApplicationsWindow with a large list, widget counts) needs one and is
+skipped without it; on a headless machine run it under a virtual display:
+    xvfb-run -a python -m benchmarks.bench_pipeline
+
+Run from the repository root:
+    python -m benchmarks.bench_pipeline [--sizes 100,1000,10000,100000]
+        [--applications 1000] [--paging] [--json results.jsonl]
+The stand-in server runs in this process and every size's client in its own,
+so peak RSS is the client's alone. With --json, one record per size is
+appended, tagged with the commit, to track regressions.
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+
+SALARY_RANGE = (80_000, 120_000)
+CARD_SAMPLES = 50
+WAIT_TIMEOUT_SECONDS = 120
+
+
+def elapsed_ms(start: float) -> float:
+    """
+    Milliseconds since start (a perf_counter() reading).
+    """
+    return (time.perf_counter() - start) * 1000
+
+
+def peak_rss_mb() -> float:
+    """
+    Peak resident memory of this process, in megabytes.
+    """
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak / 1024 / (1024 if sys.platform == "darwin" else 1)
+
+
+def run_data(url: str, job_id: int) -> dict:
+    """
+    The display-free half: what the background workers do for a refresh, a
+    salary filter and an applications window, plus the card text.
+    """
+    from api.client import JobConnectClient
+    from api.paging import JobPager
+    from benchmarks.stand_in_server import PASSWORD
+    from config import JOB_PAGE_SIZE
+    from widgets.card_text import application_text, job_text
+
+    client = JobConnectClient(url)
+    client.login("recruiter@test.com", PASSWORD)
+    results = {}
+
+    start = time.perf_counter()
+    first = None
+    for batch in JobPager(client).stream(JOB_PAGE_SIZE):
+        if first is None:
+            first = elapsed_ms(start)
+    results["first_page_first_batch_ms"] = first
+    results["first_page_ms"] = elapsed_ms(start)
+
+    start = time.perf_counter()
+    jobs = client.job_catalog().all()
+    results["catalog_ms"] = elapsed_ms(start)
+    results["jobs"] = len(jobs)
+
+    start = time.perf_counter()
+    JobPager(client, *SALARY_RANGE).fetch(JOB_PAGE_SIZE)
+    results["salary_filter_ms"] = elapsed_ms(start)
+
+    start = time.perf_counter()
+    for job in jobs:
+        job_text(job)
+    results["job_text_us_per_card"] = elapsed_ms(start) * 1000 / max(len(jobs), 1)
+
+    start = time.perf_counter()
+    applications = client.get_applications_for_job(job_id)
+    results["applications_fetch_ms"] = elapsed_ms(start)
+    results["applications_listed"] = len(applications)
+
+    start = time.perf_counter()
+    for app in applications:
+        application_text(app)
+    results["application_text_us_per_card"] = (
+        elapsed_ms(start) * 1000 / max(len(applications), 1)
+    )
+    client.close()
+    return results
+
+
+def run_widgets(url: str, job_id: int) -> dict:
+    """
+    The Tk half, or None without a display.
+    """
+    import tkinter as tk
+
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        return None
+
+    from api.background import BackgroundRunner
+    from api.client import JobConnectClient
+    from benchmarks.stand_in_server import PASSWORD
+    from tabs.jobs import JobCard, JobsTab
+    from windows.diagnostics import count_widgets
+    from windows.job_applications import JobApplicationsWindow
+
+    def wait_until(done):
+        deadline = time.monotonic() + WAIT_TIMEOUT_SECONDS
+        while not done():
+            if time.monotonic() > deadline:
+                raise TimeoutError("the UI did not settle")
+            root.update()
+        root.update_idletasks()
+
+    def jobs_settled():
+        return tab._loading is None and not tab.job_view._render_pending
+
+    root.geometry("700x600")
+    root.runner = BackgroundRunner(root)
+    client = JobConnectClient(url)
+    client.login("recruiter@test.com", PASSWORD)
+    account = client.me()
+    results = {}
+
+    start = time.perf_counter()
+    tab = JobsTab(root, client, account)
+    tab.pack(fill="both", expand=True)
+    wait_until(lambda: jobs_settled() and tab.job_view.items)
+    results["jobs_tab_first_load_ms"] = elapsed_ms(start)
+
+    start = time.perf_counter()
+    tab.refresh_jobs()
+    wait_until(jobs_settled)
+    results["refresh_jobs_ms"] = elapsed_ms(start)
+    results["jobs_listed"] = len(tab.job_view.items)
+
+    tab.min_salary_entry.insert(0, str(SALARY_RANGE[0]))
+    tab.max_salary_entry.insert(0, str(SALARY_RANGE[1]))
+    start = time.perf_counter()
+    tab.apply_filter()
+    wait_until(jobs_settled)
+    results["salary_filter_ui_ms"] = elapsed_ms(start)
+    results["job_rows"] = tab.job_view.row_count()
+    results["widgets_jobs_tab"] = count_widgets(root)
+
+    jobs = tab.job_view.items[:CARD_SAMPLES]
+    start = time.perf_counter()
+    cards = [JobCard(tab) for _ in jobs]
+    root.update_idletasks()
+    results["job_card_create_ms"] = elapsed_ms(start) / len(cards)
+    start = time.perf_counter()
+    for card, job in zip(cards, jobs):
+        card.set_item(job)
+    root.update_idletasks()
+    results["job_card_bind_ms"] = elapsed_ms(start) / len(cards)
+    for card in cards:
+        card.destroy()
+
+    job = client.job_catalog().get(job_id) or jobs[0]
+    expected = len(client.get_applications_for_job(job.job_id))
+    client.application_cache.clear()
+    start = time.perf_counter()
+    window = JobApplicationsWindow(root, client, account, job)
+    applications = window.application_list
+    wait_until(lambda: len(applications) >= expected and not applications.rendering)
+    results["applications_window_ms"] = elapsed_ms(start)
+
+    # Reconciling an unchanged list with the cards already on screen
+    loaded = []
+    on_loaded = window._on_applications_loaded
+    window._on_applications_loaded = lambda apps: loaded.append(on_loaded(apps))
+    start = time.perf_counter()
+    window.refresh_applications()
+    wait_until(lambda: loaded)
+    results["refresh_applications_ms"] = elapsed_ms(start)
+    results["widgets_with_applications"] = count_widgets(root)
+
+    root.destroy()
+    client.close()
+    return results
+
+
+def run_client(url: str) -> dict:
+    """
+    Benchmark the client against a running stand-in, in this process.
+    """
+    job_id = 1
+    record = run_data(url, job_id)
+    record["widgets"] = run_widgets(url, job_id)
+    record["peak_rss_mb"] = peak_rss_mb()
+    return record
+
+
+def run_size(size: int, args) -> dict:
+    """
+    Serve a dataset of size jobs and benchmark a fresh client process on it.
+    """
+    from benchmarks.stand_in_server import StandInServer
+
+    server = StandInServer(
+        jobs=size, applications=args.applications, paging=args.paging
+    ).start()
+    try:
+        command = [sys.executable, "-m", "benchmarks.bench_pipeline"]
+        out = subprocess.run(
+            command + ["--client", server.url],
+            stdout=subprocess.PIPE,
+            text=True,
+            check=True,
+        )
+    finally:
+        server.stop()
+    return {"size": size, **json.loads(out.stdout.splitlines()[-1])}
+
+
+def commit() -> str:
+    """
+    Commit of the working tree, or None outside a git checkout.
+    """
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="100,1000,10000,100000")
+    parser.add_argument("--applications", type=int, default=1000)
+    parser.add_argument("--paging", action="store_true")
+    parser.add_argument("--json", metavar="PATH")
+    parser.add_argument("--client", metavar="URL", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.client is not None:
+        print(json.dumps(run_client(args.client)))
+        return
+
+    meta = {
+        "commit": commit(),
+        "ts": round(time.time()),
+        "python": platform.python_version(),
+        "display": bool(os.environ.get("DISPLAY")),
+        "applications": args.applications,
+        "paging": args.paging,
+    }
+    records = []
+    for size in [int(s) for s in args.sizes.split(",")]:
+        record = dict(meta, **run_size(size, args))
+        records.append(record)
+        print_record(record)
+
+    if args.json:
+        with open(args.json, "a") as file:
+            for record in records:
+                file.write(json.dumps(record) + "\n")
+
+
+def print_record(record: dict):
+    """
+    Print the results of one size as aligned name/value lines.
+    """
+    print(f"--- {record['size']} jobs ---")
+    values = {k: v for k, v in record.items() if isinstance(v, (int, float))}
+    values.update(record["widgets"] or {"widgets": "skipped (no display)"})
+    for name, value in values.items():
+        if name in ("size", "ts") or isinstance(value, bool):
+            continue
+        shown = f"{value:,.2f}" if isinstance(value, float) else value
+        print(f"{name:>34} {shown:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Client behaviour against an unhealthy API, using the local stand-in server:
+a transient 503 absorbed by a retry, a stalled response cut by the read
+timeout, an outage where the circuit breaker fails fast with cached data, and
+the probe that closes it again.
+
+Run from the repository root:
+    python -m benchmarks.bench_resilience
+"""
+
+import time
+
+from api.cache import ResponseCache
+from api.client import JobConnectClient
+from api.resilience import CircuitBreaker
+from benchmarks.stand_in_server import PASSWORD, Faults, StandInServer
+
+READ_TIMEOUT = 0.5
+RESET_SECONDS = 1.0
+
+
+def timed(fn, *args):
+    """
+    Call fn(*args); returns (milliseconds, result or the exception raised).
+    """
+    start = time.perf_counter()
+    try:
+        result = fn(*args)
+    except Exception as error:
+        result = error
+    return (time.perf_counter() - start) * 1000, result
+
+
+def describe(result) -> str:
+    """
+    One-line summary of a result or exception.
+    """
+    if isinstance(result, Exception):
+        return f"{type(result).__name__}"
+    return f"{len(result)} jobs"
+
+
+def main():
+    server = StandInServer().start()
+    # ttl=0: every call goes to the server, with the last answer kept as fallback
+    client = JobConnectClient(server.url, cache=ResponseCache(ttl=0))
+    client.timeouts = {}
+    client.default_timeout = (0.5, READ_TIMEOUT)
+    client.breaker = CircuitBreaker(failure_threshold=3, reset_seconds=RESET_SECONDS)
+    client.login("recruiter@test.com", PASSWORD)
+
+    def step(label: str):
+        before = server.requests
+        ms, result = timed(client.list_jobs)
+        print(
+            f"{label:<34} {ms:>7.0f} ms {server.requests - before:>4}"
+            f"  {describe(result):<20} {client.breaker.state}"
+        )
+
+    print(f"{'scenario':<34} {'time':>10} {'sent':>4}  {'result':<20} breaker")
+    step("healthy")
+
+    server.faults.fail_next = 1
+    step("one 503, then healthy")
+
+    server.faults.hang = READ_TIMEOUT * 2
+    client.cache.clear()
+    step("stalled past the read timeout")
+    server.faults.hang = 0
+    time.sleep(RESET_SECONDS)
+    step("healthy, probe after reset")
+
+    server.faults = Faults(error_rate=1.0)
+    step("outage (cached list served)")
+    step("outage, breaker open")
+    step("outage, breaker open")
+
+    server.faults = Faults()
+    time.sleep(RESET_SECONDS)
+    step("recovered, probe after reset")
+    step("healthy")
+    server.stop()
+
+
+if __name__ == "__main__":
+    main()
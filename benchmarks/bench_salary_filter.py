@@ -0,0 +1,76 @@
+"""
+Salary filter latency on a synthetic catalog: the original two list
+comprehensions over every job versus a range query on the JobCatalog index.
+
+Run from the repository root:
+    python -m benchmarks.bench_salary_filter [job_count]
+"""
+
+import random
+import sys
+import time
+
+from objects import Job
+from store.catalog import JobCatalog
+
+
+def make_jobs(count: int, seed: int = 42) -> list:
+    """
+    Build count synthetic jobs with salaries spread over 30k-250k.
+    """
+    rng = random.Random(seed)
+    return [
+        Job(
+            job_id=i,
+            title=f"Job {i}",
+            description="Synthetic job posting",
+            salary=float(rng.randrange(30_000, 250_000, 500)),
+            location="Remote",
+        )
+        for i in range(count)
+    ]
+
+
+def linear_filter(jobs: list, min_salary: float, max_salary: float) -> list:
+    """
+    The filter JobsTab used before the index: two passes over every job.
+    """
+    jobs = [j for j in jobs if j.salary >= min_salary]
+    return [j for j in jobs if j.salary <= max_salary]
+
+
+def best_of(repeats: int, fn, *args) -> float:
+    """
+    Best wall time of fn(*args) over repeats runs, in milliseconds.
+    """
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main(count: int = 100_000):
+    jobs = make_jobs(count)
+
+    start = time.perf_counter()
+    catalog = JobCatalog(jobs)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    print(f"{count} jobs, index build {build_ms:.1f} ms")
+    print(f"{'range':>18} {'matches':>8} {'linear ms':>10} {'index ms':>9}")
+    for low, high in [(100_000, 101_000), (100_000, 120_000), (30_000, 250_000)]:
+        matches = len(catalog.range(low, high))
+        linear = best_of(5, linear_filter, jobs, low, high)
+        indexed = best_of(5, catalog.range, low, high)
+        print(f"{low:>8}-{high:<9} {matches:>8} {linear:>10.2f} {indexed:>9.3f}")
+
+    new_job = Job(count, "New", "Synthetic job posting", 75_000.0, "Remote")
+    update_ms = best_of(1, catalog.upsert, new_job)
+    remove_ms = best_of(1, catalog.remove, count)
+    print(f"single upsert {update_ms:.3f} ms, single remove {remove_ms:.3f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,76 @@
+"""
+Full-text job search latency on a synthetic catalog, as run on every
+keystroke in the Jobs tab search box: the index query plus building the
+first page of results.
+
+Run from the repository root:
+    python -m benchmarks.bench_search [job_count]
+"""
+
+import random
+import sys
+import time
+
+from benchmarks.bench_salary_filter import best_of
+from config import JOB_PAGE_SIZE
+from objects import Job
+from store.catalog import JobCatalog
+
+TITLES = ["Software", "Data", "Product", "Marketing", "Sales", "Support", "Cloud"]
+ROLES = ["Engineer", "Developer", "Analyst", "Manager", "Designer", "Specialist"]
+CITIES = ["Toronto", "Ottawa", "Vancouver", "Montreal", "Calgary", "Remote"]
+WORDS = (
+    "build maintain scalable services team customers python java react sql "
+    "kubernetes agile mentor roadmap stakeholders analytics dashboards cloud"
+).split()
+
+
+def make_jobs(count: int, seed: int = 7) -> list:
+    """
+    Build count synthetic jobs with varied titles, locations and descriptions.
+    """
+    rng = random.Random(seed)
+    return [
+        Job(
+            job_id=i,
+            title=f"{rng.choice(TITLES)} {rng.choice(ROLES)} {i}",
+            description=" ".join(rng.choices(WORDS, k=30)),
+            salary=float(rng.randrange(30_000, 250_000, 500)),
+            location=rng.choice(CITIES),
+        )
+        for i in range(count)
+    ]
+
+
+def main(count: int = 100_000):
+    catalog = JobCatalog(make_jobs(count))
+
+    start = time.perf_counter()
+    catalog.search("warmup")
+    print(f"{count} jobs, text index build {(time.perf_counter() - start):.2f} s")
+
+    def first_page(query: str) -> list:
+        ids = catalog.search(query)
+        return [catalog.get(job_id) for job_id in ids[:JOB_PAGE_SIZE]]
+
+    print(f"{'query':>26} {'matches':>8} {'ms':>8}")
+    for query in [
+        "d",
+        "dev",
+        "developer toronto",
+        "data analyst sql",
+        "cloud eng rem kube",
+        "software engineer 4242",
+        "nomatch",
+    ]:
+        matches = len(catalog.search(query))
+        elapsed = best_of(5, first_page, query)
+        print(f"{query:>26} {matches:>8} {elapsed:>8.3f}")
+
+    job = Job(count, "Quantum Developer", "new posting", 90_000.0, "Ottawa")
+    print(f"incremental add {best_of(1, catalog.upsert, job):.3f} ms")
+    print(f"incremental remove {best_of(1, catalog.remove, count):.3f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,102 @@
+"""
+Startup cost of main.py: the import time of everything loaded before the login
+window exists (from python -X importtime) and, when a display is available,
+the time from interpreter start to the first painted login window.
+Exits with status 1 when time-to-first-paint exceeds the budget, so it can
+be tracked in CI.
+
+Run from the repository root:
+    python -m benchmarks.bench_startup [runs]
+"""
+
+import os
+import subprocess
+import sys
+
+# Time-to-first-paint budget for the login window, in milliseconds
+FIRST_PAINT_BUDGET_MS = 250
+
+# Heavy modules that must not be imported before the login window paints
+DEFERRED = ("requests", "urllib3", "sqlite3", "windows.dashboard", "tabs.jobs")
+
+FIRST_PAINT = """
+import time
+start = time.perf_counter()
+from windows.login import LoginWindow
+window = LoginWindow()
+window.update()
+print((time.perf_counter() - start) * 1000)
+window.destroy()
+"""
+
+
+def import_times(module: str) -> dict:
+    """
+    Cumulative import time in microseconds of every module loaded by
+    importing module in a fresh interpreter.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        try:
+            times[name.strip()] = int(cumulative)
+        except ValueError:
+            pass  # header line
+    return times
+
+
+def first_paint_ms() -> float:
+    """
+    Milliseconds from the first import to a painted login window, measured in
+    a fresh interpreter; None without a display.
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", FIRST_PAINT], capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        return None
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def main(runs: int = 5):
+    # Drop what the interpreter imports anyway (site, .pth hooks)
+    baseline = import_times("sys")
+    times = {
+        name: micros
+        for name, micros in import_times("windows.login").items()
+        if name not in baseline
+    }
+    total = times.get("windows.login", 0) / 1000
+    print(f"import windows.login: {total:.1f} ms cumulative")
+    for name, micros in sorted(times.items(), key=lambda kv: -kv[1])[:8]:
+        print(f"  {micros / 1000:>7.1f} ms  {name}")
+
+    eager = [name for name in DEFERRED if name in times]
+    if eager:
+        print(f"loaded before the login window: {', '.join(eager)}")
+
+    paints = [first_paint_ms() for _ in range(runs)]
+    if None in paints:
+        print("time-to-first-paint: skipped (no display)")
+        return 1 if eager else 0
+
+    best = min(paints)
+    verdict = "ok" if best <= FIRST_PAINT_BUDGET_MS else "OVER BUDGET"
+    print(
+        f"time-to-first-paint: best {best:.1f} ms of {runs}, "
+        f"budget {FIRST_PAINT_BUDGET_MS} ms: {verdict}"
+    )
+    return 0 if best <= FIRST_PAINT_BUDGET_MS and not eager else 1
+
+
+if __name__ == "__main__":
+    os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 5))
@@ -0,0 +1,584 @@
+"""
+Local stand-in for the JobConnect API, built on the standard library only.
+Serves the endpoints the client uses with the same JSON shapes and cookie
+auth, over a synthetic dataset of configurable size, and injects latency,
+jitter, stalls and error statuses. Every client benchmark runs against it.
+
+Run from the repository root:
+    python -m benchmarks.stand_in_server [--port 5251] [--jobs 100000]
+        [--applications 50] [--latency-ms 0] [--jitter-ms 0]
+        [--error-rate 0] [--error-status 503] [--no-paging]
+then point BASE_API_URL at http://localhost:<port>/api and log in as
+recruiter@test.com or applicant@test.com with the password "password".
+"""
+
+import argparse
+import json
+import random
+import secrets
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+SESSION_COOKIE = "jobconnect_session"
+PASSWORD = "password"
+STATUSES = ("pending", "accepted", "rejected")
+
+TITLES = ["Software", "Data", "Product", "Marketing", "Sales", "Support", "Cloud"]
+ROLES = ["Engineer", "Developer", "Analyst", "Manager", "Designer", "Specialist"]
+CITIES = ["Toronto", "Ottawa", "Vancouver", "Montreal", "Calgary", "Remote"]
+WORDS = (
+    "build maintain scalable services team customers python java react sql "
+    "kubernetes agile mentor roadmap stakeholders analytics dashboards cloud "
+    "experience passionate delivered projects years collaborate learn growth"
+).split()
+
+
+class Faults:
+    """
+    What the stand-in does wrong, adjustable while it runs.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        hang: float = 0.0,
+        fail_next: int = 0,
+        jitter: float = 0.0,
+    ):
+        """
+        :param latency: Seconds added before every response
+        :param error_rate: Share of requests answered with error_status
+        :param error_status: Status of injected errors
+        :param hang: Seconds to stall before answering, e.g. past a read timeout
+        :param fail_next: Answer this many upcoming requests with error_status
+        :param jitter: Up to this many seconds added at random on top of latency
+        """
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.hang = hang
+        self.fail_next = fail_next
+        self.jitter = jitter
+
+
+class Dataset:
+    """
+    Synthetic accounts, jobs and applications behind the stand-in.
+    Jobs are built up front; the applications of a job are generated from a
+    per-job seed the first time they are needed, so a large catalog with many
+    applications per job costs memory only for the jobs actually opened.
+    Not thread-safe: StandInServer serializes access.
+    """
+
+    def __init__(self, jobs: int = 200, applications: int = 5, seed: int = 7):
+        """
+        :param jobs: Number of synthetic jobs
+        :param applications: Synthetic applications per job
+        :param seed: Seed of the generated data
+        """
+        self.seed = seed
+        self.per_job = applications
+        self.accounts = {}  # email -> account dict, password included
+        for role in ("recruiter", "applicant"):
+            self.add_account(
+                {
+                    "first_name": role.title(),
+                    "last_name": "Test",
+                    "email": f"{role}@test.com",
+                    "password": PASSWORD,
+                    "role": role,
+                }
+            )
+        rng = random.Random(seed)
+        self.jobs = {i: make_job(i, rng) for i in range(1, jobs + 1)}
+        # Only jobs 1..synthetic_jobs get generated applications
+        self.synthetic_jobs = jobs
+        self.next_job_id = jobs + 1
+        self.applications = {}  # job_id -> {application_id: application dict}
+        # Generated ids are job_id * per_job + n; created ones are numbered above
+        self.next_application_id = (jobs + 1) * max(applications, 1)
+        self.owner = {}  # created application_id -> job_id
+        self.version = 0  # bumped on every change, used for ETags
+
+    def add_account(self, data: dict) -> dict:
+        """
+        Store an account, giving it an id.
+        """
+        account = dict(data, id=f"account-{len(self.accounts) + 1}")
+        self.accounts[account["email"]] = account
+        return account
+
+    def applications_of(self, job_id: int) -> dict:
+        """
+        Applications of a job by id, generated on first use.
+        """
+        apps = self.applications.get(job_id)
+        if apps is None:
+            rng = random.Random(self.seed * 1_000_003 + job_id)
+            apps = self.applications[job_id] = {}
+            if job_id > self.synthetic_jobs:
+                return apps
+            for n in range(self.per_job):
+                application_id = job_id * self.per_job + n
+                apps[application_id] = {
+                    "application_id": application_id,
+                    "job_id": job_id,
+                    "account_id": f"applicant-{rng.randrange(1, 10_000)}",
+                    "content": " ".join(rng.choices(WORDS, k=rng.randrange(20, 120))),
+                    "status": rng.choice(STATUSES),
+                }
+        return apps
+
+    def find_application(self, application_id: int) -> dict:
+        """
+        The application with an id, or None.
+        """
+        job_id = self.owner.get(application_id)
+        if job_id is None and self.per_job:
+            job_id = application_id // self.per_job
+        if job_id not in self.jobs or (
+            job_id > self.synthetic_jobs and application_id not in self.owner
+        ):
+            return None
+        return self.applications_of(job_id).get(application_id)
+
+    def changed(self):
+        """
+        Record a change, invalidating every ETag handed out.
+        """
+        self.version += 1
+
+
+def make_job(job_id: int, rng: random.Random) -> dict:
+    """
+    Build one synthetic job dict.
+    """
+    return {
+        "job_id": job_id,
+        "title": f"{rng.choice(TITLES)} {rng.choice(ROLES)} {job_id}",
+        "description": " ".join(rng.choices(WORDS, k=30)),
+        "salary": float(rng.randrange(30_000, 250_000, 500)),
+        "location": rng.choice(CITIES),
+    }
+
+
+class StandInServer:
+    """
+    Threaded HTTP server implementing the JobConnect API over a Dataset,
+    through the configured Faults.
+    Login sets a session cookie that every other endpoint except register
+    requires. GET responses carry an ETag and answer If-None-Match with 304.
+    """
+
+    def __init__(
+        self,
+        jobs: int = 200,
+        applications: int = 5,
+        port: int = 0,
+        faults: Faults = None,
+        paging: bool = True,
+        counts: bool = False,
+        seed: int = 7,
+    ):
+        """
+        :param jobs: Number of synthetic jobs
+        :param applications: Synthetic applications per job
+        :param port: Port to listen on, any free one if 0
+        :param faults: Faults to inject, none if omitted
+        :param paging: Whether /job honours min_salary/max_salary/offset/limit;
+            when False the whole catalog is always returned
+        :param counts: Whether to serve the aggregate /application/counts
+        :param seed: Seed of the generated data
+        """
+        self.data = Dataset(jobs, applications, seed)
+        self.faults = faults or Faults()
+        self.paging = paging
+        self.counts = counts
+        self.requests = 0  # requests received, injected failures included
+        self.sessions = {}  # session cookie -> account email
+        self._lock = threading.Lock()
+        self._catalog_body = None  # (version, encoded full /job body)
+        self._server = _QuietServer(("127.0.0.1", port), self._handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        """
+        Base URL to give JobConnectClient.
+        """
+        return f"http://127.0.0.1:{self._server.server_port}/api"
+
+    def start(self) -> "StandInServer":
+        """
+        Serve in a background thread.
+        """
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        """
+        Serve on the calling thread until interrupted.
+        """
+        self._server.serve_forever()
+
+    def stop(self):
+        """
+        Stop serving and release the port.
+        """
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _inject(self) -> int:
+        """
+        Apply the configured faults to one request; returns the error status
+        to answer with, or None to answer normally.
+        """
+        faults = self.faults
+        with self._lock:
+            self.requests += 1
+            failing = faults.fail_next > 0
+            if failing:
+                faults.fail_next -= 1
+        delay = faults.hang + faults.latency
+        if faults.jitter:
+            delay += random.uniform(0, faults.jitter)
+        if delay:
+            time.sleep(delay)
+        if failing or random.random() < faults.error_rate:
+            return faults.error_status
+        return None
+
+    # Routes: each returns (status, JSON body or encoded bytes or None)
+
+    def route(self, method: str, path: str, query: dict, body, cookie: str) -> tuple:
+        """
+        Answer one request.
+        """
+        parts = path.strip("/").split("/")[1:]  # without the leading "api"
+        with self._lock:
+            if parts == ["account", "login"] and method == "POST":
+                return self._login(body)
+            if parts == ["account", "register"] and method == "POST":
+                return self._register(body)
+
+            account = self.data.accounts.get(self.sessions.get(cookie))
+            if account is None:
+                return 401, {"message": "Not logged in"}
+
+            if parts[0] == "account":
+                return self._account(method, parts[1:], account, cookie)
+            if parts[0] == "job":
+                return self._job(method, parts[1:], query, body, account)
+            if parts[0] == "application":
+                return self._application(method, parts[1:], query, body, account)
+            return 404, {"message": "Not found"}
+
+    def _login(self, body: dict) -> tuple:
+        """
+        POST /account/login: check the credentials and open a session.
+        """
+        account = self.data.accounts.get((body or {}).get("email"))
+        if account is None or account["password"] != body.get("password"):
+            return 401, {"message": "Invalid email or password"}
+        cookie = secrets.token_urlsafe(16)
+        self.sessions[cookie] = account["email"]
+        return 200, {"message": "Logged in"}, cookie
+
+    def _register(self, body: dict) -> tuple:
+        """
+        POST /account/register, with the field names the register form sends.
+        """
+        fields = ("FirstName", "LastName", "Email", "Password", "Role")
+        if not body or not all(body.get(field) for field in fields):
+            return 400, {"message": "Every field is required"}
+        if body["Email"] in self.data.accounts:
+            return 400, {"message": "Email already registered"}
+        self.data.add_account(
+            {
+                "first_name": body["FirstName"],
+                "last_name": body["LastName"],
+                "email": body["Email"],
+                "password": body["Password"],
+                "role": body["Role"].lower(),
+            }
+        )
+        return 200, {"message": "Registered"}
+
+    def _account(self, method: str, parts: list, account: dict, cookie: str):
+        """
+        /account/me, /account/logout and /account/delete.
+        """
+        if parts == ["me"] and method == "GET":
+            return 200, {k: v for k, v in account.items() if k != "password"}
+        if parts == ["logout"] and method == "POST":
+            del self.sessions[cookie]
+            return 200, {"message": "Logged out"}
+        if parts == ["delete"] and method == "DELETE":
+            del self.data.accounts[account["email"]]
+            for key in [k for k, v in self.sessions.items() if v == account["email"]]:
+                del self.sessions[key]
+            return 200, {"message": "Deleted"}
+        return 404, {"message": "Not found"}
+
+    def _job(self, method: str, parts: list, query: dict, body, account: dict):
+        """
+        /job and /job/{id}; changes are reserved to recruiters.
+        """
+        data = self.data
+        if not parts:
+            if method == "GET":
+                return 200, self._job_list(query)
+            if method == "POST":
+                if account["role"] != "recruiter":
+                    return 403, {"message": "Recruiters only"}
+                job = dict(body, job_id=data.next_job_id)
+                data.next_job_id += 1
+                data.jobs[job["job_id"]] = job
+                data.changed()
+                return 201, job
+            return 405, {"message": "Method not allowed"}
+
+        job_id = _int(parts[0])
+        if job_id not in data.jobs:
+            return 404, {"message": "Job not found"}
+        if method == "GET":
+            return 200, data.jobs[job_id]
+        if account["role"] != "recruiter":
+            return 403, {"message": "Recruiters only"}
+        if method == "PUT":
+            data.jobs[job_id] = dict(body, job_id=job_id)
+            data.changed()
+            return 204, None
+        if method == "DELETE":
+            del data.jobs[job_id]
+            data.applications.pop(job_id, None)
+            data.changed()
+            return 204, None
+        return 405, {"message": "Method not allowed"}
+
+    def _job_list(self, query: dict):
+        """
+        Body of GET /job: the whole catalog, or a filtered page when paging
+        is on and parameters are given.
+        """
+        jobs = self.data.jobs
+        params = ("min_salary", "max_salary", "offset", "limit")
+        if not self.paging or not any(p in query for p in params):
+            # Encoded once per version: big catalogs are read over and over
+            version = self.data.version
+            if self._catalog_body is None or self._catalog_body[0] != version:
+                self._catalog_body = (version, json.dumps(list(jobs.values())).encode())
+            return self._catalog_body[1]
+
+        low = float(query.get("min_salary", ["-inf"])[0])
+        high = float(query.get("max_salary", ["inf"])[0])
+        offset = int(query.get("offset", ["0"])[0])
+        limit = int(query["limit"][0]) if "limit" in query else None
+        matching = [job for job in jobs.values() if low <= job["salary"] <= high]
+        end = None if limit is None else offset + limit
+        return matching[offset:end]
+
+    def _application(self, method: str, parts: list, query: dict, body, account):
+        """
+        /application/job/{id}, /application/{id} and, when enabled,
+        /application/counts.
+        """
+        data = self.data
+        if parts == ["counts"] and method == "GET" and self.counts:
+            counts = {}
+            for job_id in query.get("job_id", []):
+                if _int(job_id) in data.jobs:
+                    tally = counts[job_id] = {}
+                    for app in data.applications_of(_int(job_id)).values():
+                        tally[app["status"]] = tally.get(app["status"], 0) + 1
+            return 200, counts
+
+        if len(parts) == 2 and parts[0] == "job":
+            job_id = _int(parts[1])
+            if job_id not in data.jobs:
+                return 404, {"message": "Job not found"}
+            if method == "GET":
+                return 200, list(data.applications_of(job_id).values())
+            if method == "POST":
+                app = {
+                    "application_id": data.next_application_id,
+                    "job_id": job_id,
+                    "account_id": account["id"],
+                    "content": (body or {}).get("content", ""),
+                    "status": "pending",
+                }
+                data.next_application_id += 1
+                data.owner[app["application_id"]] = job_id
+                data.applications_of(job_id)[app["application_id"]] = app
+                data.changed()
+                return 201, app
+            return 405, {"message": "Method not allowed"}
+
+        if len(parts) != 1:
+            return 404, {"message": "Not found"}
+        app = data.find_application(_int(parts[0]))
+        if app is None:
+            return 404, {"message": "Application not found"}
+        if method == "GET":
+            return 200, app
+        if method == "PUT":
+            if account["role"] != "recruiter":
+                return 403, {"message": "Recruiters only"}
+            app["status"] = (body or {}).get("status", app["status"])
+            data.changed()
+            return 204, None
+        if method == "DELETE":
+            del data.applications_of(app["job_id"])[app["application_id"]]
+            data.changed()
+            return 204, None
+        return 405, {"message": "Method not allowed"}
+
+    def _handler(self):
+        """
+        Build the request handler class bound to this server.
+        """
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive, like the real server
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                self._handle("GET")
+
+            def do_POST(self):
+                self._handle("POST")
+
+            def do_PUT(self):
+                self._handle("PUT")
+
+            def do_DELETE(self):
+                self._handle("DELETE")
+
+            def _handle(self, method: str):
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length) if length else b""
+                status = stand_in._inject()
+                if status is not None:
+                    return self._send(status, {"message": "Injected failure"})
+                try:
+                    body = json.loads(raw) if raw else None
+                except ValueError:
+                    return self._send(400, {"message": "Malformed JSON"})
+
+                url = urlsplit(self.path)
+                if not url.path.startswith("/api/"):
+                    return self._send(404, {"message": "Not found"})
+                answer = stand_in.route(
+                    method, url.path, parse_qs(url.query), body, self._cookie()
+                )
+                status, payload = answer[:2]
+                cookie = answer[2] if len(answer) > 2 else None
+
+                etag = None
+                if method == "GET" and status == 200:
+                    etag = f'W/"{stand_in.data.version}"'
+                    if self.headers.get("If-None-Match") == etag:
+                        return self._send(304, None, etag=etag)
+                self._send(status, payload, etag=etag, cookie=cookie)
+
+            def _cookie(self) -> str:
+                for part in (self.headers.get("Cookie") or "").split(";"):
+                    name, _, value = part.strip().partition("=")
+                    if name == SESSION_COOKIE:
+                        return value
+                return None
+
+            def _send(self, status: int, payload, etag: str = None, cookie=None):
+                if isinstance(payload, bytes):
+                    data = payload
+                else:
+                    data = b"" if payload is None else json.dumps(payload).encode()
+                self.send_response(status)
+                if data:
+                    self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                if etag:
+                    self.send_header("ETag", etag)
+                if cookie:
+                    self.send_header(
+                        "Set-Cookie", f"{SESSION_COOKIE}={cookie}; Path=/; HttpOnly"
+                    )
+                self.end_headers()
+                try:
+                    self.wfile.write(data)
+                except ConnectionError:
+                    pass  # The client timed out or cancelled, and hung up
+
+        return Handler
+
+
+class _QuietServer(ThreadingHTTPServer):
+    """
+    HTTP server that stays silent when a client hangs up, e.g. a fetch
+    cancelled on purpose, and reports every other error as usual.
+    """
+
+    def handle_error(self, request, client_address):
+        """
+        Print the traceback of a failed request, unless the client hung up.
+        """
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+def _int(text: str) -> int:
+    """
+    Parse an id from a path or query, -1 if it is not a number.
+    """
+    try:
+        return int(text)
+    except (TypeError, ValueError):
+        return -1
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--port", type=int, default=5251)
+    parser.add_argument("--jobs", type=int, default=1000)
+    parser.add_argument("--applications", type=int, default=5)
+    parser.add_argument("--latency-ms", type=float, default=0)
+    parser.add_argument("--jitter-ms", type=float, default=0)
+    parser.add_argument("--error-rate", type=float, default=0)
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--no-paging", dest="paging", action="store_false")
+    parser.add_argument("--counts", action="store_true")
+    args = parser.parse_args()
+
+    faults = Faults(
+        latency=args.latency_ms / 1000,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        jitter=args.jitter_ms / 1000,
+    )
+    server = StandInServer(
+        args.jobs,
+        args.applications,
+        port=args.port,
+        faults=faults,
+        paging=args.paging,
+        counts=args.counts,
+    )
+    print(f"Serving {len(server.data.jobs)} jobs on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +1,81 @@
 BASE_API_URL = "http://localhost:5251/api"
+
+# Connection pool used by the shared API client session
+HTTP_POOL_CONNECTIONS = 4
+HTTP_POOL_MAXSIZE = 10
+
+# Background network execution
+BACKGROUND_WORKERS = 4
+BACKGROUND_POLL_MS = 16
+
+# Jobs fetched per page while scrolling the job list
+JOB_PAGE_SIZE = 50
+
+# In-memory cache of job and application lists
+CACHE_TTL_SECONDS = 30
+CACHE_MAX_ENTRIES = 64
+
+# On-disk replica of the last known jobs and applications, one file per account
+REPLICA_DIR = "~/.jobconnect"
+
+# Streaming /job downloads: bytes read per chunk and jobs handed to the UI per batch
+STREAM_CHUNK_BYTES = 16 * 1024
+STREAM_BATCH_SIZE = 50
+
+# Bulk status changes: PUT requests in flight at once (kept within HTTP_POOL_MAXSIZE)
+BULK_CONCURRENCY = 8
+
+# Idle-time prefetch of application lists for the job cards on screen:
+# requests in flight, requests allowed per window, window length, scroll debounce
+PREFETCH_CONCURRENCY = 2
+PREFETCH_BUDGET = 30
+PREFETCH_WINDOW_SECONDS = 60
+PREFETCH_DELAY_MS = 250
+# Pause in typing before the job search runs
+SEARCH_DELAY_MS = 300
+# Application lists kept in memory, prefetched or opened (separate from CACHE_MAX_ENTRIES)
+APPLICATION_CACHE_MAX_ENTRIES = 128
+
+# Application lists fetched at once to fill the status badges of visible job cards
+COUNTS_CONCURRENCY = 4
+
+# Session cookies kept between launches so returning users skip the login form
+SESSION_FILE = "~/.jobconnect/session.json"
+
+# HTTP timeouts as (connect, read) seconds; the longest matching path prefix wins
+HTTP_TIMEOUT = (3.05, 10)
+HTTP_TIMEOUTS = {
+    "/account/login": (3.05, 15),
+    "/job": (3.05, 20),
+}
+
+# Retries of idempotent requests on connection errors, timeouts and 502/503/504,
+# with exponential backoff and full jitter
+HTTP_RETRIES = 2
+RETRY_BACKOFF_SECONDS = 0.25
+RETRY_BACKOFF_CAP_SECONDS = 4
+
+# Circuit breaker: consecutive failures before failing fast, seconds before a probe
+BREAKER_FAILURE_THRESHOLD = 5
+BREAKER_RESET_SECONDS = 15
+
+# Instrumentation (View > Diagnostics): off unless switched on there; events go to a
+# rotating JSONL log, and the last METRICS_SAMPLES timings per phase feed percentiles
+METRICS_ENABLED = False
+METRICS_FILE = "~/.jobconnect/metrics.jsonl"
+METRICS_MAX_BYTES = 5 * 1024 * 1024
+METRICS_BACKUPS = 3
+METRICS_SAMPLES = 1000
+# How often the diagnostics window redraws its tables
+DIAGNOSTICS_REFRESH_MS = 1000
+
+# Cards created per idle cycle when a long card list is laid out, so input is
+# handled between slices
+RENDER_CHUNK_SIZE = 100
+
+# Collapsed cards show at most this many characters / lines of a description or
+# cover letter; the full text is laid out only when the card is expanded
+PREVIEW_CHARS = 280
+PREVIEW_LINES = 4
+# Previews kept computed, so ones warmed on a worker cost the UI a lookup
+PREVIEW_CACHE_SIZE = 4096
@@ -1,3 +1,6 @@
+import sys
+
+
 class Account:
     """
     Class representing the user account currently logged in.
@@ -21,8 +24,11 @@ class Account:
 class Job:
     """
     Class representing a job
+    Slotted, with the location interned, since catalogs hold many thousands.
     """
 
+    __slots__ = ("job_id", "title", "description", "salary", "location")
+
     def __init__(
         self, job_id: int, title: str, description: str, salary: float, location: str
     ):
@@ -30,14 +36,25 @@ class Job:
         self.title = title
         self.description = description
         self.salary = salary
-        self.location = location
+        self.location = sys.intern(location)
+
+    def __eq__(self, other):
+        return isinstance(other, Job) and all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
+
+    def __hash__(self):
+        return hash(tuple(getattr(self, name) for name in self.__slots__))
 
 
 class Application:
     """
     class representing a application
+    Slotted, with the status interned, since a job can have many of them.
     """
 
+    __slots__ = ("application_id", "job_id", "account_id", "content", "status")
+
     def __init__(
         self,
         application_id: int,
@@ -50,4 +67,12 @@ class Application:
         self.job_id = job_id
         self.account_id = account_id
         self.content = content
-        self.status = status
+        self.status = sys.intern(status)
+
+    def __eq__(self, other):
+        return isinstance(other, Application) and all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
+
+    def __hash__(self):
+        return hash(tuple(getattr(self, name) for name in self.__slots__))
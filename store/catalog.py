@@ -0,0 +1,127 @@
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+
+from objects import Job
+from store.search import JobSearchIndex
+
+
+class JobCatalog:
+    """
+    In-memory job collection with a sorted salary index.
+    Salary range queries bisect the index, costing O(log n + k) instead of a
+    scan of the whole catalog, and single jobs are added, updated or removed
+    without rebuilding anything. A full-text index is built on the first search
+    and maintained the same way from then on.
+    """
+
+    def __init__(self, jobs=()):
+        """
+        :param jobs: Initial jobs, in catalog order
+        """
+        self._lock = threading.Lock()
+        self.jobs = {job.job_id: job for job in jobs}
+        # Salary column as a packed array of doubles, sorted, with the jobs
+        # in the same order beside it so range results are a single slice
+        self._by_salary = sorted(
+            self.jobs.values(), key=lambda job: (job.salary, job.job_id)
+        )
+        self._salaries = array("d", (job.salary for job in self._by_salary))
+        # Position of each job in catalog order; new jobs go last
+        self._rank = {job_id: n for n, job_id in enumerate(self.jobs)}
+        self._next_rank = len(self._rank)
+        self._text_index = None
+
+    def __len__(self) -> int:
+        return len(self.jobs)
+
+    def __contains__(self, job_id) -> bool:
+        return job_id in self.jobs
+
+    def get(self, job_id: int) -> Job:
+        """
+        Return the job with an id, or None.
+        """
+        return self.jobs.get(job_id)
+
+    def all(self) -> list:
+        """
+        Return every job in catalog order.
+        """
+        with self._lock:
+            return list(self.jobs.values())
+
+    def range(self, min_salary: float = None, max_salary: float = None) -> list:
+        """
+        Return the jobs whose salary lies within [min_salary, max_salary], in
+        catalog order like the server's own filtered pages, so results do not
+        depend on whether they came from here or over the network.
+        """
+        if min_salary is None and max_salary is None:
+            return self.all()
+
+        with self._lock:
+            start = 0
+            if min_salary is not None:
+                start = bisect_left(self._salaries, min_salary)
+            end = len(self._salaries)
+            if max_salary is not None:
+                end = bisect_right(self._salaries, max_salary)
+            jobs = self._by_salary[start:end]
+            jobs.sort(key=lambda job: self._rank[job.job_id])
+            return jobs
+
+    def search(self, query: str) -> list:
+        """
+        Return the ids, in ascending order, of the jobs matching every term of
+        query as a prefix of a word in their title, description or location.
+        Ids rather than jobs so callers only materialize the rows they show.
+        """
+        with self._lock:
+            if self._text_index is None:
+                self._text_index = JobSearchIndex()
+                for job in self.jobs.values():
+                    self._text_index.add(job)
+            return sorted(self._text_index.search(query))
+
+    def upsert(self, job: Job):
+        """
+        Add a job or replace the stored version of it, keeping the index sorted.
+        """
+        with self._lock:
+            old = self.jobs.get(job.job_id)
+            if old is not None:
+                self._unindex(old)
+            else:
+                self._rank[job.job_id] = self._next_rank
+                self._next_rank += 1
+            self.jobs[job.job_id] = job
+            position = bisect_right(self._salaries, job.salary)
+            self._salaries.insert(position, job.salary)
+            self._by_salary.insert(position, job)
+            if self._text_index is not None:
+                self._text_index.add(job)
+
+    def remove(self, job_id: int):
+        """
+        Drop a job, if present.
+        """
+        with self._lock:
+            old = self.jobs.pop(job_id, None)
+            if old is not None:
+                self._unindex(old)
+                del self._rank[job_id]
+                if self._text_index is not None:
+                    self._text_index.remove(job_id)
+
+    def _unindex(self, job: Job):
+        """
+        Remove the index entry of a job. Caller holds the lock.
+        """
+        position = bisect_left(self._salaries, job.salary)
+        end = bisect_right(self._salaries, job.salary)
+        for position in range(position, end):
+            if self._by_salary[position].job_id == job.job_id:
+                del self._salaries[position]
+                del self._by_salary[position]
+                return
@@ -0,0 +1,109 @@
+import time
+
+from config import CACHE_TTL_SECONDS
+
+
+def count_statuses(applications: list) -> dict:
+    """
+    Count applications by lowercase status.
+    """
+    counts = {}
+    for app in applications:
+        status = app.status.lower()
+        counts[status] = counts.get(status, 0) + 1
+    return counts
+
+
+class ApplicationCounts:
+    """
+    Number of applications per job and status, shown as badges on job cards.
+    Filled from fetched application lists and adjusted one change at a time by
+    the windows that change a status, so badges follow edits without refetching.
+    Listeners are called with the job id after every change; they are meant
+    to be updated from the Tk thread only.
+    """
+
+    def __init__(self, ttl: float = CACHE_TTL_SECONDS, clock=time.monotonic):
+        """
+        :param ttl: Seconds counts loaded from the server are considered current
+        :param clock: Monotonic time source
+        """
+        self.ttl = ttl
+        self.clock = clock
+        self._counts = {}  # job_id -> {status: count}
+        self._loaded_at = {}  # job_id -> clock() when last loaded from the server
+        self._listeners = []
+
+    def get(self, job_id: int) -> dict:
+        """
+        Counts by lowercase status for a job, or None if never loaded.
+        """
+        return self._counts.get(job_id)
+
+    def is_fresh(self, job_id: int) -> bool:
+        """
+        Whether the counts of a job were loaded less than ttl seconds ago.
+        """
+        loaded_at = self._loaded_at.get(job_id)
+        return loaded_at is not None and self.clock() - loaded_at < self.ttl
+
+    def set_from(self, job_id: int, applications: list):
+        """
+        Replace the counts of a job with those of a full application list.
+        """
+        self.set(job_id, count_statuses(applications))
+
+    def set(self, job_id: int, counts: dict):
+        """
+        Replace the counts of a job.
+        """
+        self._loaded_at[job_id] = self.clock()
+        if self._counts.get(job_id) != counts:
+            self._counts[job_id] = counts
+            self._notify(job_id)
+
+    def adjust(self, job_id: int, old_status: str = None, new_status: str = None):
+        """
+        Move one application from old_status to new_status.
+        None as old_status adds an application, None as new_status removes one.
+        Ignored for jobs whose counts were never loaded.
+        """
+        counts = self._counts.get(job_id)
+        if counts is None or old_status == new_status:
+            return
+        counts = dict(counts)
+        if old_status is not None:
+            old_status = old_status.lower()
+            counts[old_status] = max(counts.get(old_status, 0) - 1, 0)
+        if new_status is not None:
+            new_status = new_status.lower()
+            counts[new_status] = counts.get(new_status, 0) + 1
+        self._counts[job_id] = counts
+        self._notify(job_id)
+
+    def clear(self):
+        """
+        Forget every count, e.g. when the user logs out.
+        """
+        self._counts.clear()
+        self._loaded_at.clear()
+
+    def subscribe(self, listener):
+        """
+        Call listener(job_id) whenever the counts of a job change.
+        """
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener):
+        """
+        Stop calling a listener registered with subscribe().
+        """
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _notify(self, job_id: int):
+        """
+        Tell every listener the counts of a job changed.
+        """
+        for listener in list(self._listeners):
+            listener(job_id)
@@ -0,0 +1,176 @@
+import os
+import re
+import sqlite3
+import threading
+
+from config import REPLICA_DIR
+from objects import Account, Application, Job
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL,
+    salary REAL NOT NULL,
+    location TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_salary ON jobs (salary);
+CREATE TABLE IF NOT EXISTS applications (
+    application_id INTEGER PRIMARY KEY,
+    job_id INTEGER NOT NULL,
+    account_id TEXT NOT NULL,
+    content TEXT NOT NULL,
+    status TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS applications_job ON applications (job_id);
+"""
+
+
+class LocalReplica:
+    """
+    SQLite copy of the last known jobs and applications.
+    Lets the UI paint immediately on startup from disk, then revalidate against
+    the API in the background (stale-while-revalidate).
+    Safe to use from the background workers: access is serialized by a lock.
+    """
+
+    def __init__(self, path: str):
+        """
+        :param path: SQLite database file, or ":memory:"
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.executescript(_SCHEMA)
+
+    @classmethod
+    def for_account(cls, account: Account) -> "LocalReplica":
+        """
+        Open the replica belonging to an account, creating it if needed.
+        """
+        directory = os.path.expanduser(REPLICA_DIR)
+        os.makedirs(directory, exist_ok=True)
+        name = re.sub(r"[^A-Za-z0-9_-]", "_", str(account.Id))
+        return cls(os.path.join(directory, f"replica-{name}.sqlite3"))
+
+    def close(self):
+        """
+        Close the database connection.
+        """
+        with self._lock:
+            self._db.close()
+
+    # Jobs
+
+    def load_jobs(
+        self, min_salary: float = None, max_salary: float = None, limit: int = None
+    ) -> list:
+        """
+        Return stored jobs, optionally within a salary range.
+        Ordered by id, as the server pages them, filtered or not, so the first
+        paint shows the jobs the first server page is about to confirm.
+        """
+        query = "SELECT job_id, title, description, salary, location FROM jobs"
+        clauses, args = [], []
+        if min_salary is not None:
+            clauses.append("salary >= ?")
+            args.append(min_salary)
+        if max_salary is not None:
+            clauses.append("salary <= ?")
+            args.append(max_salary)
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY job_id"
+        if limit is not None:
+            query += " LIMIT ?"
+            args.append(limit)
+
+        with self._lock:
+            rows = self._db.execute(query, args).fetchall()
+        return [Job(*row) for row in rows]
+
+    def upsert_jobs(self, jobs: list):
+        """
+        Insert or update a batch of jobs, leaving other stored jobs untouched.
+        """
+        with self._lock, self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO jobs VALUES (?, ?, ?, ?, ?)",
+                [
+                    (j.job_id, j.title, j.description, j.salary, j.location)
+                    for j in jobs
+                ],
+            )
+
+    def replace_jobs(self, jobs: list):
+        """
+        Store jobs as the complete catalog, dropping every job not in it.
+        """
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM jobs")
+            self._db.executemany(
+                "INSERT INTO jobs VALUES (?, ?, ?, ?, ?)",
+                [
+                    (j.job_id, j.title, j.description, j.salary, j.location)
+                    for j in jobs
+                ],
+            )
+
+    def delete_job(self, job_id: int):
+        """
+        Forget a deleted job and its applications.
+        """
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM jobs WHERE job_id = ?", (job_id,))
+            self._db.execute("DELETE FROM applications WHERE job_id = ?", (job_id,))
+
+    # Applications
+
+    def load_applications(self, job_id: int) -> list:
+        """
+        Return the stored applications of a job ordered by id.
+        """
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT application_id, job_id, account_id, content, status "
+                "FROM applications WHERE job_id = ? ORDER BY application_id",
+                (job_id,),
+            ).fetchall()
+        return [Application(*row) for row in rows]
+
+    def replace_applications(self, job_id: int, applications: list):
+        """
+        Store the complete application list of a job.
+        """
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM applications WHERE job_id = ?", (job_id,))
+            self._db.executemany(
+                "INSERT INTO applications VALUES (?, ?, ?, ?, ?)",
+                [
+                    (a.application_id, a.job_id, a.account_id, a.content, a.status)
+                    for a in applications
+                ],
+            )
+
+    def upsert_applications(self, applications: list):
+        """
+        Insert or update a batch of applications.
+        """
+        with self._lock, self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO applications VALUES (?, ?, ?, ?, ?)",
+                [
+                    (a.application_id, a.job_id, a.account_id, a.content, a.status)
+                    for a in applications
+                ],
+            )
+
+    def delete_application(self, application_id: int):
+        """
+        Forget a withdrawn application.
+        """
+        with self._lock, self._db:
+            self._db.execute(
+                "DELETE FROM applications WHERE application_id = ?",
+                (application_id,),
+            )
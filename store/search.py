@@ -0,0 +1,105 @@
+import re
+from bisect import bisect_left
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+# Below this many candidates, remaining terms are checked against each job's
+# own tokens instead of building the union of every matching posting list
+_SCAN_THRESHOLD = 256
+
+
+def tokenize(text: str) -> list:
+    """
+    Split text into lowercase alphanumeric tokens.
+    """
+    return _TOKEN.findall(text.lower())
+
+
+class JobSearchIndex:
+    """
+    Inverted index over job title, description and location.
+    Queries AND their terms together and treat each term as a prefix, so
+    "dev rem" matches a "Developer" job located "Remote". Jobs are added and
+    removed one at a time; nothing is ever rebuilt.
+    """
+
+    def __init__(self):
+        self.postings = {}  # token -> set of job ids
+        self.doc_tokens = {}  # job id -> frozenset of its tokens
+        self._vocabulary = []  # sorted tokens, for prefix lookups
+
+    def __len__(self) -> int:
+        return len(self.doc_tokens)
+
+    def add(self, job):
+        """
+        Index a job, replacing its previous version if any.
+        """
+        self.remove(job.job_id)
+        tokens = frozenset(tokenize(f"{job.title} {job.description} {job.location}"))
+        self.doc_tokens[job.job_id] = tokens
+        for token in tokens:
+            ids = self.postings.get(token)
+            if ids is None:
+                self.postings[token] = {job.job_id}
+                self._vocabulary.insert(bisect_left(self._vocabulary, token), token)
+            else:
+                ids.add(job.job_id)
+
+    def remove(self, job_id: int):
+        """
+        Drop a job from the index, if present.
+        """
+        tokens = self.doc_tokens.pop(job_id, None)
+        if tokens is None:
+            return
+        for token in tokens:
+            ids = self.postings[token]
+            ids.discard(job_id)
+            if not ids:
+                del self.postings[token]
+                del self._vocabulary[bisect_left(self._vocabulary, token)]
+
+    def search(self, query: str) -> set:
+        """
+        Return the ids of jobs matching every term of the query as a prefix.
+        An empty query matches nothing.
+        """
+        terms = set(tokenize(query))
+        if not terms:
+            return set()
+
+        # Most selective term first, estimated from its posting list sizes
+        postings = sorted(
+            (self._prefix_postings(term) for term in terms),
+            key=lambda lists: sum(len(ids) for ids in lists),
+        )
+        first = postings[0]
+        candidates = set(first[0]) if len(first) == 1 else set().union(*first)
+
+        for lists in postings[1:]:
+            if not candidates:
+                break
+            if len(lists) == 1:
+                candidates &= lists[0]
+            elif len(candidates) <= _SCAN_THRESHOLD:
+                candidates = {
+                    job_id
+                    for job_id in candidates
+                    if any(job_id in ids for ids in lists)
+                }
+            else:
+                candidates &= set().union(*lists)
+        return candidates
+
+    def _prefix_postings(self, prefix: str) -> list:
+        """
+        Posting lists of every token starting with prefix.
+        """
+        vocabulary = self._vocabulary
+        position = bisect_left(vocabulary, prefix)
+        matches = []
+        while position < len(vocabulary) and vocabulary[position].startswith(prefix):
+            matches.append(self.postings[vocabulary[position]])
+            position += 1
+        return matches
@@ -0,0 +1,81 @@
+import json
+import os
+import time
+
+from config import SESSION_FILE
+
+
+class SessionStore:
+    """
+    Auth cookies persisted between launches.
+    The file is created readable by its owner only (0600, in a 0700
+    directory), since the cookies grant access to the account until they
+    expire or the user logs out.
+    """
+
+    def __init__(self, path: str = SESSION_FILE):
+        """
+        :param path: JSON file holding the cookies; ~ is expanded
+        """
+        self.path = os.path.expanduser(path)
+
+    def save(self, cookies):
+        """
+        Write every unexpired cookie of a cookie jar to disk.
+        """
+        now = time.time()
+        data = [
+            {
+                "name": cookie.name,
+                "value": cookie.value,
+                "domain": cookie.domain,
+                "path": cookie.path,
+                "expires": cookie.expires,
+                "secure": cookie.secure,
+            }
+            for cookie in cookies
+            if cookie.expires is None or cookie.expires > now
+        ]
+        os.makedirs(os.path.dirname(self.path), mode=0o700, exist_ok=True)
+        temporary = f"{self.path}.tmp"
+        fd = os.open(temporary, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as file:
+            json.dump(data, file)
+        os.chmod(temporary, 0o600)
+        os.replace(temporary, self.path)
+
+    def load_into(self, cookies) -> bool:
+        """
+        Add the stored, unexpired cookies to a cookie jar.
+        Returns whether any cookie was restored.
+        """
+        try:
+            with open(self.path) as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return False
+
+        now = time.time()
+        restored = False
+        for cookie in data:
+            if cookie.get("expires") is not None and cookie["expires"] <= now:
+                continue
+            cookies.set(
+                cookie["name"],
+                cookie["value"],
+                domain=cookie.get("domain", ""),
+                path=cookie.get("path", "/"),
+                expires=cookie.get("expires"),
+                secure=cookie.get("secure", False),
+            )
+            restored = True
+        return restored
+
+    def clear(self):
+        """
+        Forget the stored session.
+        """
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
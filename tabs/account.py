@@ -1,9 +1,8 @@
 import tkinter as tk
 from tkinter import messagebox
 
-import requests
-
-from config import BASE_API_URL
+from api.background import get_runner
+from api.client import ApiError, JobConnectClient
 from objects import Account
 
 
@@ -13,15 +12,15 @@ class AccountTab(tk.Frame):
     like logout and account deletion.
     """
 
-    def __init__(self, master, cookies, user_account: Account):
+    def __init__(self, master, client: JobConnectClient, user_account: Account):
         """
         Initialize the Account tab.
         :param master: The notebook parent widget
-        :param cookies: Authenticated session cookies
+        :param client: Shared API client holding the auth session
         :param user_account: The logged-in user account data
         """
         super().__init__(master, bg="#f9f9f9")
-        self.cookies = cookies
+        self.client = client
         self.user_account = user_account
 
         tk.Label(
@@ -79,20 +78,13 @@ class AccountTab(tk.Frame):
         """
         Log out the current user and return to the login screen.
         """
-        try:
-            res = requests.post(
-                f"{BASE_API_URL}/account/logout", cookies=self.cookies, verify=False
-            )
-            if res.status_code == 200:
-                messagebox.showinfo("Logged Out", "You have been logged out.")
-                self.master.master.destroy()
-                from windows.login import LoginWindow
-
-                LoginWindow().mainloop()
-            else:
-                messagebox.showerror("Error", "Logout failed.")
-        except Exception as e:
-            messagebox.showerror("Connection Error", str(e))
+        get_runner(self).submit(
+            self.client.logout,
+            on_success=lambda _: self._return_to_login(
+                "Logged Out", "You have been logged out."
+            ),
+            on_error=lambda e: self._show_error(e, "Logout failed."),
+        )
 
     def delete_account(self):
         """
@@ -104,17 +96,30 @@ class AccountTab(tk.Frame):
         if not confirm:
             return
 
-        try:
-            res = requests.delete(
-                f"{BASE_API_URL}/account/delete", cookies=self.cookies, verify=False
-            )
-            if res.status_code == 200:
-                messagebox.showinfo("Deleted", "Your account has been deleted.")
-                self.master.master.destroy()
-                from windows.login import LoginWindow
-
-                LoginWindow().mainloop()
-            else:
-                messagebox.showerror("Error", "Account deletion failed.")
-        except Exception as e:
-            messagebox.showerror("Connection Error", str(e))
+        get_runner(self).submit(
+            self.client.delete_account,
+            on_success=lambda _: self._return_to_login(
+                "Deleted", "Your account has been deleted."
+            ),
+            on_error=lambda e: self._show_error(e, "Account deletion failed."),
+        )
+
+    def _return_to_login(self, title: str, message: str):
+        """
+        Close the dashboard and show the login screen again.
+        """
+        messagebox.showinfo(title, message)
+        self.master.master.destroy()
+        from windows.login import LoginWindow
+
+        LoginWindow(self.client).mainloop()
+
+    @staticmethod
+    def _show_error(error: Exception, message: str):
+        """
+        Report a failed account action.
+        """
+        if isinstance(error, ApiError):
+            messagebox.showerror("Error", message)
+        else:
+            messagebox.showerror("Connection Error", str(error))
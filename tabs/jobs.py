@@ -1,12 +1,21 @@
 import tkinter as tk
 
-import requests
-
-from config import BASE_API_URL
+from api.background import get_runner
+from api.client import ApiError, JobConnectClient
+from api.generation import Generation, Token
+from api.paging import JobPager, JobSearch
+from api.prefetch import Prefetcher
+from config import JOB_PAGE_SIZE, PREFETCH_DELAY_MS, SEARCH_DELAY_MS
 from objects import Account, Job
+from store.replica import LocalReplica
+from widgets.card_text import STATUS_COLORS, count_badges, job_text, warm_previews
+from widgets.virtual_list import VirtualList
 from windows.create_edit_job import CreateEditJobWindow
 from windows.job_applications import JobApplicationsWindow
 
+# Height of a job card slot in the list, padding included
+JOB_ROW_HEIGHT = 200
+
 
 class JobsTab(tk.Frame):
     """
@@ -14,15 +23,23 @@ class JobsTab(tk.Frame):
     job creation, editing, and deletion for recruiters.
     """
 
-    def __init__(self, master, cookies, user_account: Account):
+    def __init__(
+        self,
+        master,
+        client: JobConnectClient,
+        user_account: Account,
+        replica: LocalReplica = None,
+    ):
         """
         :param master: Parent widget (the notebook)
-        :param cookies: Authenticated session cookies
+        :param client: Shared API client holding the auth session
         :param user_account: Logged-in user information
+        :param replica: (Optional) on-disk copy of the jobs shown while loading
         """
         super().__init__(master, bg="#f5f5f5")
         self.user_account = user_account
-        self.cookies = cookies
+        self.client = client
+        self.replica = replica
 
         # Header with optional create button
         header = tk.Frame(self, bg="#f5f5f5")
@@ -41,6 +58,19 @@ class JobsTab(tk.Frame):
                 relief="raised",
             ).pack(anchor="w")
 
+        # Search
+        search_frame = tk.LabelFrame(
+            self, text="Search Jobs", bg="#f5f5f5", padx=10, pady=5
+        )
+        search_frame.pack(fill="x", padx=10, pady=(10, 0))
+
+        self.search_entry = tk.Entry(search_frame)
+        self.search_entry.pack(fill="x")
+        self.search_entry.bind("<KeyRelease>", lambda e: self._on_search_typed())
+        # Query of the list on screen and the pending debounced search
+        self._query = ""
+        self._search_timer = None
+
         # Filters
         filter_frame = tk.LabelFrame(
             self, text="Filter by Salary", bg="#f5f5f5", padx=10, pady=5
@@ -56,10 +86,10 @@ class JobsTab(tk.Frame):
         self.max_salary_entry.pack(side="left", padx=(0, 10))
 
         tk.Button(
-            filter_frame, text="Apply Filter", command=self.refresh_jobs, width=15
+            filter_frame, text="Apply Filter", command=self.apply_filter, width=15
         ).pack(side="left")
 
-        # Scrollable frame for job cards
+        # Virtualized list of job cards
         canvas_container = tk.Frame(self)
         canvas_container.pack(fill="both", expand=True, padx=10, pady=10)
 
@@ -69,146 +99,359 @@ class JobsTab(tk.Frame):
         self.scrollbar = tk.Scrollbar(
             canvas_container, orient="vertical", command=self.canvas.yview
         )
-        self.scrollable_frame = tk.Frame(self.canvas, bg="#f5f5f5")
-
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all")),
+        self.job_view = VirtualList(
+            self.canvas,
+            self.scrollbar,
+            JOB_ROW_HEIGHT,
+            create_row=lambda: JobCard(self),
+            key=lambda job: job.job_id,
+            on_near_end=self.load_more_jobs,
+            on_render=self._on_rows_rendered,
+            name="jobs",
         )
-
-        self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
-        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+        # Warms the application lists of the cards on screen while Tk is idle
+        self.prefetcher = Prefetcher(
+            self,
+            fetch=self.client.get_applications_for_job,
+            is_fresh=self.client.has_fresh_applications,
+        )
+        self.pager = None
+        self._loading = None  # pager whose next page is being fetched
+        # Every list fetch supersedes the previous one, aborting its download
+        self.generation = Generation()
+
+        # Status badges (recruiters): job ids waiting for counts, the pending
+        # fan-out timer and the generation of the fan-out for the cards on screen
+        self._counts_wanted = []
+        self._counts_timer = None
+        self.counts_generation = Generation()
+        if self.user_account.role == "recruiter":
+            self.client.application_counts.subscribe(self._on_counts_changed)
+        self.bind("<Destroy>", self._on_destroy)
 
         self.canvas.pack(side="left", fill="both", expand=True)
         self.scrollbar.pack(side="right", fill="y")
 
         self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
 
-        self.refresh_jobs()
+        self.apply_filter()
 
     def refresh_jobs(self):
         """
-        Load and filter jobs from the API, then render them.
+        Reload the jobs loaded so far in the background and reconcile them with the
+        cards on screen, keeping the scroll position.
         """
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
+        loaded = len(self.job_view.items)
+        if not loaded:
+            self._show_message("Loading jobs...")
+        self._fetch_page(self._new_pager(), max(loaded, JOB_PAGE_SIZE), reset=False)
 
-        try:
-            res = requests.get(
-                f"{BASE_API_URL}/job", cookies=self.cookies, verify=False
+    def apply_filter(self):
+        """
+        Start over from the first page of jobs matching the search and salary
+        filter. Jobs from the local replica are shown straight away and
+        reconciled with the server's answer once it arrives.
+        """
+        self._cancel_search()
+        pager = self._new_pager()
+        if isinstance(pager, JobSearch):
+            # Keep the current cards until the results arrive
+            self._fetch_page(pager, JOB_PAGE_SIZE, reset=True)
+            return
+
+        stored = []
+        if self.replica is not None:
+            stored = self.replica.load_jobs(
+                pager.min_salary, pager.max_salary, limit=JOB_PAGE_SIZE
             )
-            if res.status_code == 200:
-                job_list = res.json()
-
-                # Filter by salary
-                min_salary = self.min_salary_entry.get()
-                max_salary = self.max_salary_entry.get()
-
-                if min_salary:
-                    try:
-                        min_salary = float(min_salary)
-                        job_list = [j for j in job_list if j["salary"] >= min_salary]
-                    except ValueError:
-                        pass
-
-                if max_salary:
-                    try:
-                        max_salary = float(max_salary)
-                        job_list = [j for j in job_list if j["salary"] <= max_salary]
-                    except ValueError:
-                        pass
-
-                for job_data in job_list:
-                    job = Job(**job_data)
-                    self.add_job_widget(job)
+
+        if stored:
+            self.job_view.set_items(stored)
+            self._fetch_page(pager, JOB_PAGE_SIZE, reset=False)
+        else:
+            self._show_message("Loading jobs...")
+            self._fetch_page(pager, JOB_PAGE_SIZE, reset=True)
+
+    def _on_search_typed(self):
+        """
+        Run the search once typing pauses; keys that leave the query as it is
+        (arrows, Shift, Tab...) change nothing.
+        """
+        self._cancel_search()
+        if self.search_entry.get().strip() != self._query:
+            self._search_timer = self.after(SEARCH_DELAY_MS, self.apply_filter)
+
+    def _cancel_search(self):
+        """
+        Drop the debounced search waiting to run, if any.
+        """
+        if self._search_timer is not None:
+            self.after_cancel(self._search_timer)
+            self._search_timer = None
+
+    def load_more_jobs(self):
+        """
+        Fetch the next page once the user scrolls near the end of the list.
+        """
+        if self.pager is None or self.pager.exhausted or self._loading:
+            return
+        self._fetch_page(self.pager, None, reset=False, append=True)
+
+    def _new_pager(self) -> JobPager:
+        """
+        Make the pager for the search terms and salary filter currently entered.
+        """
+        min_salary = self._salary_bound(self.min_salary_entry)
+        max_salary = self._salary_bound(self.max_salary_entry)
+        query = self._query = self.search_entry.get().strip()
+        if query:
+            self.pager = JobSearch(self.client, query, min_salary, max_salary)
+        else:
+            self.pager = JobPager(self.client, min_salary, max_salary)
+        return self.pager
+
+    @staticmethod
+    def _salary_bound(entry: tk.Entry):
+        """
+        Parse a salary filter entry; empty or invalid input means no bound.
+        """
+        try:
+            return float(entry.get())
+        except ValueError:
+            return None
+
+    def _fetch_page(self, pager: JobPager, limit, reset: bool, append: bool = False):
+        """
+        Fetch a page in the background and hand it to the list.
+        Starting a fetch cancels the previous one: its connection is aborted
+        and its result dropped before any parsing or widget work.
+        """
+        token = self.generation.next()
+        if not append and not isinstance(pager, JobSearch):
+            self._stream_first_page(pager, limit, reset, token)
+            return
+
+        self._loading = pager
+
+        def on_success(jobs):
+            self._loading = None
+            if append:
+                self.job_view.append_items(jobs)
+            elif not jobs:
+                self._show_message("No jobs found.")
+            elif reset:
+                self.job_view.set_items(jobs)
             else:
-                tk.Label(
-                    self.scrollable_frame, text="Failed to load jobs.", bg="#f5f5f5"
-                ).pack(pady=10)
-        except Exception as e:
-            tk.Label(self.scrollable_frame, text=f"Error: {str(e)}", bg="#f5f5f5").pack(
-                pady=10
-            )
+                self.job_view.update_items(jobs)
+
+        def on_error(error):
+            self._loading = None
+            if not append:
+                self._show_load_error(error)
+
+        get_runner(self).submit(
+            self._fetch_and_store,
+            pager,
+            limit,
+            token,
+            on_success=on_success,
+            on_error=on_error,
+            cancelled=token,
+        )
 
-    def add_job_widget(self, job: Job):
+    def _fetch_and_store(self, pager: JobPager, limit, token: Token) -> list:
         """
-        Render a single job listing
-        :param job: The job object to display
+        Fetch a page and record it in the replica. Runs on a background worker.
         """
-        frame = tk.Frame(
-            self.scrollable_frame,
-            relief="ridge",
-            borderwidth=1,
-            padx=10,
-            pady=10,
-            bg="white",
+        jobs = pager.fetch(limit, token)
+        token.check()
+        warm_previews(job.description for job in jobs)
+        if self.replica is not None:
+            self.replica.upsert_jobs(jobs)
+        return jobs
+
+    def _stream_first_page(self, pager: JobPager, limit, reset: bool, token: Token):
+        """
+        Download the first page as a stream. With nothing on screen (reset),
+        cards appear batch by batch as the response arrives; otherwise the
+        batches are collected and reconciled with the current cards at the end.
+        """
+        self._loading = pager
+        received = []
+
+        def on_batch(jobs):
+            if reset:
+                if received:
+                    self.job_view.append_items(jobs)
+                else:
+                    self.job_view.set_items(jobs)
+            received.extend(jobs)
+
+        def on_success():
+            self._loading = None
+            if not received:
+                self._show_message("No jobs found.")
+            elif not reset:
+                self.job_view.update_items(received)
+
+        def on_error(error):
+            self._loading = None
+            if not received:
+                self._show_load_error(error)
+
+        get_runner(self).stream(
+            self._stream_and_store,
+            pager,
+            limit,
+            token,
+            on_batch=on_batch,
+            on_success=on_success,
+            on_error=on_error,
+            cancelled=token,
         )
-        frame.pack(fill="x", padx=5, pady=8)
 
-        tk.Label(frame, text=job.title, font=("Arial", 14, "bold"), bg="white").pack(
-            anchor="w"
+    def _stream_and_store(self, pager: JobPager, limit, token: Token):
+        """
+        Stream the first page and record it in the replica once complete.
+        Runs on a background worker.
+        """
+        jobs = []
+        for batch in pager.stream(limit, token):
+            warm_previews(job.description for job in batch)
+            jobs.extend(batch)
+            yield batch
+        token.check()
+        if self.replica is not None:
+            if pager.exhausted and not pager.filtered:
+                self.replica.replace_jobs(jobs)
+            else:
+                self.replica.upsert_jobs(jobs)
+
+    def _on_rows_rendered(self, jobs: list):
+        """
+        Load what the cards on screen need next: status counts for recruiters,
+        and an idle-time prefetch of the application lists. The prefetch is
+        skipped only once counts are known to come from the per-job fan-out,
+        which warms the same lists; /application/counts warms nothing.
+        """
+        if self.user_account.role == "recruiter":
+            self._want_counts(jobs)
+            if self.client.counts_endpoint_supported is False:
+                return
+        self.prefetcher.want([job.job_id for job in jobs])
+
+    def _want_counts(self, jobs: list):
+        """
+        Load the status counts of the jobs on screen once scrolling settles,
+        cancelling a fan-out still running for jobs scrolled away from.
+        """
+        wanted = [
+            job.job_id
+            for job in jobs
+            if not self.client.application_counts.is_fresh(job.job_id)
+        ]
+        if wanted == self._counts_wanted:
+            return
+        self._counts_wanted = wanted
+        self.counts_generation.cancel()
+        if self._counts_timer is not None:
+            self.after_cancel(self._counts_timer)
+            self._counts_timer = None
+        if wanted:
+            self._counts_timer = self.after(PREFETCH_DELAY_MS, self._load_counts)
+
+    def _load_counts(self):
+        """
+        Fetch the counts of the wanted jobs in parallel, updating each badge as
+        soon as its counts arrive.
+        """
+        self._counts_timer = None
+        token = self.counts_generation.next()
+
+        def on_done():
+            self._counts_wanted = []
+
+        get_runner(self).stream(
+            self.client.stream_application_counts,
+            self._counts_wanted,
+            token=token,
+            on_batch=lambda result: self.client.application_counts.set(*result),
+            on_success=on_done,
+            on_error=lambda e: on_done(),
+            cancelled=token,
         )
-        tk.Label(
-            frame, text=f"Location: {job.location}", font=("Arial", 10), bg="white"
-        ).pack(anchor="w")
-        tk.Label(
-            frame, text=f"Salary: ${job.salary:,.2f}", font=("Arial", 10), bg="white"
-        ).pack(anchor="w")
-        tk.Label(
-            frame,
-            text=job.description,
-            font=("Arial", 10),
-            wraplength=550,
-            justify="left",
-            bg="white",
-        ).pack(anchor="w", pady=(5, 0))
 
-        btn_frame = tk.Frame(frame, bg="white")
-        btn_frame.pack(anchor="e", pady=(10, 0))
+    def _on_counts_changed(self, job_id: int):
+        """
+        Refresh the badge of a job if its card is on screen.
+        """
+        for row, _, job in self.job_view.visible.values():
+            if job.job_id == job_id:
+                row.show_counts(self.client.application_counts.get(job_id))
 
-        tk.Button(
-            btn_frame,
-            text="Open",
-            command=lambda j=job: self.open_job_applications(j),
-            width=10,
-        ).pack(side="left", padx=5)
+    def _on_destroy(self, event):
+        """
+        Abort the tab's fetches and stop listening for count changes once the
+        tab is gone.
+        """
+        if event.widget is self:
+            self._cancel_search()
+            self.generation.cancel()
+            self.counts_generation.cancel()
+            self.client.application_counts.unsubscribe(self._on_counts_changed)
 
-        if self.user_account.role == "recruiter":
-            tk.Button(
-                btn_frame,
-                text="Edit",
-                command=lambda j=job: self.edit_job(j),
-                width=10,
-                bg="#f57c00",
-                fg="white",
-            ).pack(side="left", padx=5)
+    def _show_message(self, text: str):
+        """
+        Replace the job list with a single placeholder line.
+        """
+        self.job_view.set_message(text)
 
-            tk.Button(
-                btn_frame,
-                text="Delete",
-                command=lambda j=job: self.delete_job(j),
-                width=10,
-                bg="#c62828",
-                fg="white",
-            ).pack(side="left", padx=5)
+    def _show_load_error(self, error: Exception):
+        """
+        Replace the job list with the reason loading failed.
+        """
+        if isinstance(error, ApiError):
+            self._show_message("Failed to load jobs.")
+        else:
+            self._show_message(f"Error: {str(error)}")
 
     def open_job_applications(self, job: Job):
         """
         Open the applications window for a specific job.
         """
-        JobApplicationsWindow(self, self.cookies, self.user_account, job)
+        JobApplicationsWindow(
+            self, self.client, self.user_account, job, replica=self.replica
+        )
+
+    def show_description(self, job: Job):
+        """
+        Show the full description of a job in a window of its own; the text
+        is only laid out when asked for.
+        """
+        window = tk.Toplevel(self)
+        window.title(job.title)
+        window.geometry("600x400")
+        scrollbar = tk.Scrollbar(window)
+        scrollbar.pack(side="right", fill="y")
+        text = tk.Text(
+            window, wrap="word", font=("Arial", 10), yscrollcommand=scrollbar.set
+        )
+        text.insert("1.0", job.description)
+        text.config(state="disabled")
+        text.pack(fill="both", expand=True, padx=10, pady=10)
+        scrollbar.config(command=text.yview)
 
     def create_job(self):
         """
         Open the create job form window.
         """
-        CreateEditJobWindow(self, self.cookies, self.refresh_jobs)
+        CreateEditJobWindow(self, self.client, self.refresh_jobs)
 
     def edit_job(self, job: Job):
         """
         Open the edit job form window for the selected job.
         """
-        CreateEditJobWindow(self, self.cookies, self.refresh_jobs, job=job)
+        CreateEditJobWindow(self, self.client, self.refresh_jobs, job=job)
 
     def delete_job(self, job: Job):
         """
@@ -220,22 +463,156 @@ class JobsTab(tk.Frame):
         if not confirm:
             return
 
-        try:
-            res = requests.delete(
-                f"{BASE_API_URL}/job/{job.job_id}",
-                cookies=self.cookies,
-                verify=False,
-            )
-            if res.status_code == 204:
-                tk.messagebox.showinfo("Success", "Job deleted successfully.")
-                self.refresh_jobs()
-            else:
-                tk.messagebox.showerror("Error", "Failed to delete job.")
-        except Exception as e:
-            tk.messagebox.showerror("Error", str(e))
+        get_runner(self).submit(
+            self.client.delete_job,
+            job.job_id,
+            on_success=lambda _: self._on_job_deleted(job),
+            on_error=self._on_delete_error,
+        )
+
+    def _on_job_deleted(self, job: Job):
+        """
+        Confirm a deletion and reload the list.
+        """
+        if self.replica is not None:
+            self.replica.delete_job(job.job_id)
+        tk.messagebox.showinfo("Success", "Job deleted successfully.")
+        self.refresh_jobs()
+
+    @staticmethod
+    def _on_delete_error(error: Exception):
+        """
+        Report a failed deletion.
+        """
+        if isinstance(error, ApiError):
+            tk.messagebox.showerror("Error", "Failed to delete job.")
+        else:
+            tk.messagebox.showerror("Error", str(error))
 
     def _on_mousewheel(self, event):
         """
         Enable mouse wheel scrolling
         """
         self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+
+
+class JobCard(tk.Frame):
+    """
+    Card displaying a single job listing.
+    Cards are recycled by the virtual list, so the job shown can change through
+    set_item instead of building new widgets.
+    """
+
+    def __init__(self, tab: JobsTab):
+        """
+        :param tab: The jobs tab whose canvas hosts the card and handles its actions
+        """
+        super().__init__(
+            tab.canvas,
+            relief="ridge",
+            borderwidth=1,
+            padx=10,
+            pady=10,
+            bg="white",
+        )
+        self.tab = tab
+        self.job = None
+        # Hovering is a strong hint the user is about to open this job
+        self.bind(
+            "<Enter>",
+            lambda e: self.job and tab.prefetcher.prioritize(self.job.job_id),
+        )
+
+        # Packed first so a long description is clipped instead of the buttons
+        btn_frame = tk.Frame(self, bg="white")
+        btn_frame.pack(side="bottom", anchor="e", pady=(10, 0))
+
+        tk.Button(
+            btn_frame,
+            text="Open",
+            command=lambda: tab.open_job_applications(self.job),
+            width=10,
+        ).pack(side="left", padx=5)
+
+        if tab.user_account.role == "recruiter":
+            tk.Button(
+                btn_frame,
+                text="Edit",
+                command=lambda: tab.edit_job(self.job),
+                width=10,
+                bg="#f57c00",
+                fg="white",
+            ).pack(side="left", padx=5)
+
+            tk.Button(
+                btn_frame,
+                text="Delete",
+                command=lambda: tab.delete_job(self.job),
+                width=10,
+                bg="#c62828",
+                fg="white",
+            ).pack(side="left", padx=5)
+
+        self.title_label = tk.Label(self, font=("Arial", 14, "bold"), bg="white")
+        self.title_label.pack(anchor="w")
+        self.location_label = tk.Label(self, font=("Arial", 10), bg="white")
+        self.location_label.pack(anchor="w")
+        self.salary_label = tk.Label(self, font=("Arial", 10), bg="white")
+        self.salary_label.pack(anchor="w")
+
+        # Application counts by status, for recruiters
+        self.count_labels = {}
+        if tab.user_account.role == "recruiter":
+            counts_frame = tk.Frame(self, bg="white")
+            counts_frame.pack(anchor="w", pady=(3, 0))
+            for status, color in STATUS_COLORS.items():
+                label = tk.Label(
+                    counts_frame, font=("Arial", 9, "bold"), fg="white", bg=color
+                )
+                label.pack(side="left", padx=(0, 5))
+                self.count_labels[status] = label
+
+        self.description_label = tk.Label(
+            self,
+            font=("Arial", 10),
+            wraplength=550,
+            justify="left",
+            bg="white",
+        )
+        self.description_label.pack(anchor="w", pady=(5, 0))
+
+        # Rows have a fixed height, so the full description opens in its own
+        # window; only packed when the description was shortened
+        self.more_label = tk.Label(
+            self,
+            text="Read more",
+            fg="#1565c0",
+            cursor="hand2",
+            font=("Arial", 9, "underline"),
+            bg="white",
+        )
+        self.more_label.bind("<Button-1>", lambda e: tab.show_description(self.job))
+
+    def set_item(self, job: Job):
+        """
+        Show a different job in this card.
+        """
+        self.job = job
+        text = job_text(job)
+        self.title_label.config(text=text.title)
+        self.location_label.config(text=text.location)
+        self.salary_label.config(text=text.salary)
+        self.description_label.config(text=text.description)
+        if text.truncated:
+            self.more_label.pack(anchor="w", after=self.description_label)
+        else:
+            self.more_label.pack_forget()
+        self.show_counts(self.tab.client.application_counts.get(job.job_id))
+
+    def show_counts(self, counts: dict):
+        """
+        Show application counts by status; None while they are loading.
+        """
+        if self.count_labels:
+            for status, text in count_badges(counts).items():
+                self.count_labels[status].config(text=text)
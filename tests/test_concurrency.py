@@ -0,0 +1,156 @@
+"""
+Single-flight coalescing and generation-token cancellation of the client,
+against the local stand-in API.
+
+Run from the repository root:
+    python -m pytest -q tests
+"""
+
+import threading
+import time
+
+import pytest
+
+from api.client import JobConnectClient
+from api.generation import RequestCancelled, Token
+from benchmarks.stand_in_server import PASSWORD, StandInServer
+
+LATENCY = 1.0
+# Well under LATENCY, so a fetch that waited for the server cannot pass
+PROMPT = LATENCY / 2
+
+
+@pytest.fixture(scope="module")
+def server():
+    server = StandInServer(jobs=2000, applications=5, paging=True).start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def client(server):
+    server.faults.latency = 0.0
+    client = JobConnectClient(server.url)
+    client.login("recruiter@test.com", PASSWORD)
+    yield client
+    server.faults.latency = 0.0
+    client.close()
+
+
+def in_thread(fn) -> dict:
+    """
+    Run fn on a thread of its own; the returned dict gets its "result" or
+    "error" and the "thread" to join.
+    """
+    outcome = {}
+
+    def run():
+        try:
+            outcome["result"] = fn()
+        except BaseException as error:
+            outcome["error"] = error
+
+    outcome["thread"] = threading.Thread(target=run)
+    outcome["thread"].start()
+    return outcome
+
+
+def wait_for_waiters(client: JobConnectClient, count: int):
+    """
+    Block until a request is in flight with count callers waiting on it.
+    """
+    deadline = time.monotonic() + 5
+    while not any(f.waiters >= count for f in client.flights._flights.values()):
+        assert time.monotonic() < deadline, "callers never joined the flight"
+        time.sleep(0.01)
+
+
+def cancel_after(token: Token, seconds: float):
+    """
+    Cancel token from another thread after a delay.
+    """
+    timer = threading.Timer(seconds, token.cancel)
+    timer.start()
+    return timer
+
+
+def test_identical_reads_share_one_request(server, client):
+    server.faults.latency = 0.3
+    before = server.requests
+    callers = [in_thread(lambda: client.get_applications_for_job(7)) for _ in range(5)]
+    for caller in callers:
+        caller["thread"].join()
+
+    assert [len(caller["result"]) for caller in callers] == [5] * 5
+    assert server.requests - before == 1
+    assert client.flights.stats() == {"executed": 1, "coalesced": 4}
+
+
+def test_leader_closed_early_still_serves_its_waiters(client):
+    params = dict(offset=0, limit=2000)
+    stream = client.stream_jobs(batch_size=10, **params)
+    assert len(next(stream)) == 10
+
+    follower = in_thread(lambda: client.list_jobs(**params))
+    wait_for_waiters(client, 1)
+    stream.close()
+    follower["thread"].join()
+
+    assert len(follower["result"]) == 2000
+    assert client.flights.stats() == {"executed": 1, "coalesced": 1}
+    # The body read on the followers' behalf is cached for everyone
+    assert client.cache.get(("/job", (("limit", 2000), ("offset", 0)))) is not None
+
+
+def test_cancel_before_headers_aborts_the_stream(server, client):
+    server.faults.latency = LATENCY
+    token = Token()
+    cancel_after(token, 0.1)
+    start = time.monotonic()
+    with pytest.raises(RequestCancelled):
+        list(client.stream_jobs(offset=0, limit=20, token=token))
+
+    assert time.monotonic() - start < PROMPT
+    assert client.cache.get(("/job", (("limit", 20), ("offset", 0)))) is None
+
+
+def test_cancel_before_headers_aborts_a_plain_fetch(server, client):
+    server.faults.latency = LATENCY
+    token = Token()
+    cancel_after(token, 0.1)
+    start = time.monotonic()
+    with pytest.raises(RequestCancelled):
+        client.get_applications_for_job(3, token)
+
+    assert time.monotonic() - start < PROMPT
+    assert client.cached_applications(3) is None
+    # An abort is not a server failure, and the pool recovers from it
+    assert client.breaker.failures == 0
+    server.faults.latency = 0.0
+    assert len(client.get_applications_for_job(3)) == 5
+
+
+def test_cancel_after_headers_stops_parsing(client):
+    token = Token()
+    stream = client.stream_jobs(offset=0, limit=2000, batch_size=10, token=token)
+    assert len(next(stream)) == 10
+    token.cancel()
+    with pytest.raises(RequestCancelled):
+        list(stream)
+
+    assert client.cache.get(("/job", (("limit", 2000), ("offset", 0)))) is None
+
+
+def test_cancelled_leader_keeps_the_request_for_its_waiters(server, client):
+    server.faults.latency = LATENCY
+    token = Token()
+    leader = in_thread(lambda: client.get_applications_for_job(9, token))
+    wait_for_waiters(client, 0)
+    follower = in_thread(lambda: client.get_applications_for_job(9))
+    wait_for_waiters(client, 1)
+    token.cancel()
+    leader["thread"].join()
+    follower["thread"].join()
+
+    assert "error" not in follower and len(follower["result"]) == 5
+    assert len(leader.get("result", [])) == 5
@@ -0,0 +1,118 @@
+from functools import lru_cache
+
+from config import PREVIEW_CACHE_SIZE, PREVIEW_CHARS, PREVIEW_LINES
+from objects import Application, Job
+
+# Colors of the application statuses, on cards, badges and buttons
+STATUS_COLORS = {
+    "pending": "#f57c00",  # Orange
+    "accepted": "#2e7d32",  # Green
+    "rejected": "#c62828",  # Red
+}
+
+
+class JobText:
+    """
+    Strings shown by a job card.
+    Built without Tk, so it can be prepared and benchmarked off the UI thread.
+    """
+
+    __slots__ = ("title", "location", "salary", "description", "truncated")
+
+    def __init__(
+        self,
+        title: str,
+        location: str,
+        salary: str,
+        description: str,
+        truncated: bool = False,
+    ):
+        self.title = title
+        self.location = location
+        self.salary = salary
+        self.description = description
+        self.truncated = truncated  # the description is longer than its preview
+
+
+class ApplicationText:
+    """
+    Strings and status color shown by an application card.
+    """
+
+    __slots__ = ("content", "status", "color", "truncated")
+
+    def __init__(self, content: str, status: str, color: str, truncated: bool = False):
+        self.content = content
+        self.status = status
+        self.color = color
+        self.truncated = truncated  # the content is longer than its preview
+
+
+@lru_cache(maxsize=PREVIEW_CACHE_SIZE)
+def preview(text: str) -> str:
+    """
+    Shorten text for a collapsed card: at most PREVIEW_LINES lines and
+    PREVIEW_CHARS characters, cut at a word boundary and ending in "…".
+    Text that already fits is returned unchanged.
+    """
+    head = text[: PREVIEW_CHARS + 1]
+    lines = head.split("\n", PREVIEW_LINES)
+    if len(lines) > PREVIEW_LINES:
+        head = "\n".join(lines[:PREVIEW_LINES])
+    elif len(text) <= PREVIEW_CHARS:
+        return text
+    if len(head) > PREVIEW_CHARS:
+        head = head[:PREVIEW_CHARS]
+        space = head.rfind(" ")
+        if space > PREVIEW_CHARS // 2:
+            head = head[:space]
+    return head.rstrip() + "…"
+
+
+def warm_previews(texts):
+    """
+    Compute the previews of texts ahead of time; meant for the worker that
+    fetched them, so cards only look them up on the UI thread.
+    """
+    for text in texts:
+        preview(text)
+
+
+def job_text(job: Job, expanded: bool = False) -> JobText:
+    """
+    Format a job for its card.
+    :param expanded: Keep the whole description instead of its preview
+    """
+    short = preview(job.description)
+    return JobText(
+        job.title,
+        f"Location: {job.location}",
+        f"Salary: ${job.salary:,.2f}",
+        job.description if expanded else short,
+        short != job.description,
+    )
+
+
+def application_text(app: Application, expanded: bool = False) -> ApplicationText:
+    """
+    Format an application for its card.
+    :param expanded: Keep the whole content instead of its preview
+    """
+    short = preview(app.content)
+    return ApplicationText(
+        f"Content:\n{app.content if expanded else short}",
+        f"Status: {app.status.capitalize()}",
+        STATUS_COLORS.get(app.status.lower(), "black"),
+        short != app.content,
+    )
+
+
+def count_badges(counts: dict) -> dict:
+    """
+    Badge text per status for a job's application counts; "…" while they
+    are loading (None).
+    """
+    return {
+        status: f" {'…' if counts is None else counts.get(status, 0)} {status} "
+        for status in STATUS_COLORS
+    }
@@ -0,0 +1,326 @@
+import tkinter as tk
+from contextlib import contextmanager
+
+from api.metrics import metrics
+from config import RENDER_CHUNK_SIZE
+
+
+class KeyedList:
+    """
+    Reconciles a list of packed card widgets against fresh data.
+    Cards are keyed (e.g. by application_id): unchanged cards are left alone,
+    changed cards are updated in place, new ones are inserted and missing ones
+    destroyed, so redraw cost follows what changed and scroll position survives.
+    Long lists are laid out in slices of chunk_size new cards, one slice per
+    idle cycle, so input is handled in between. Items are current at once;
+    only the cards of slices not laid out yet are missing.
+    """
+
+    def __init__(
+        self,
+        parent: tk.Frame,
+        key,
+        create_card,
+        bg: str = None,
+        name: str = "cards",
+        canvas: tk.Canvas = None,
+        chunk_size: int = RENDER_CHUNK_SIZE,
+        **pack,
+    ):
+        """
+        :param parent: Frame the cards are packed into
+        :param key: Function returning the unique key of an item
+        :param create_card: Factory taking an item and returning a new card widget
+            (child of parent) exposing set_item(item)
+        :param bg: Background of the placeholder message label
+        :param name: Name of the list in the render timings (diagnostics)
+        :param canvas: (Optional) canvas scrolling parent; its scrollregion is
+            kept fitted to the cards, once per batch rather than once per card
+        :param chunk_size: New cards created per idle cycle
+        :param pack: Pack options applied to every card
+        """
+        self.parent = parent
+        self.key = key
+        self.create_card = create_card
+        self.bg = bg
+        self.name = name
+        self.canvas = canvas
+        self.chunk_size = chunk_size
+        self.pack_options = pack
+
+        self.cards = {}  # key -> card widget
+        self.items = {}  # key -> item to show (its card may not be laid out yet)
+        self.hidden = {}  # key -> card packed before it when it was hidden
+        self._message = None
+        # Keys in display order while slices remain to be laid out, else None
+        self._order = None
+        self._layout_id = None
+        self._batches = 0  # depth of nested batch() blocks
+        self._scroll_id = None
+
+        if canvas is not None:
+            parent.bind("<Configure>", lambda e: self._schedule_scrollregion())
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __contains__(self, key) -> bool:
+        return key in self.items
+
+    @property
+    def rendering(self) -> bool:
+        """
+        Whether slices of the last sync are still waiting to be laid out.
+        """
+        return self._layout_id is not None
+
+    @contextmanager
+    def batch(self):
+        """
+        Group card insertions, updates and removals into one layout pass:
+        geometry propagation and scrollregion updates are frozen inside the
+        block and done once when the outermost block exits.
+        """
+        if not self._batches:
+            self.parent.pack_propagate(False)
+        self._batches += 1
+        try:
+            yield self
+        finally:
+            self._batches -= 1
+            if not self._batches:
+                self.parent.pack_propagate(True)
+                self._schedule_scrollregion()
+
+    def sync(self, items: list):
+        """
+        Make the rendered cards match items, in order.
+        Hidden cards are kept even when items leave them out, until show() or
+        remove() decides their fate.
+        """
+        span = metrics.span("ui", self.name)
+        self._clear_message()
+        self._cancel_layout()
+        wanted = {self.key(item): item for item in items}
+
+        with self.batch():
+            for key in [
+                k for k in self.items if k not in wanted and k not in self.hidden
+            ]:
+                self.remove(key)
+            span.mark("remove")
+
+            for key, item in wanted.items():
+                if self.items.get(key) != item:
+                    self.items[key] = item
+                    card = self.cards.get(key)
+                    if card is not None:
+                        card.set_item(item)
+            span.mark("update")
+
+            self._order = list(wanted)
+            created = self._layout(span)
+        span.set(items=len(items), created=created, cards=len(self.cards))
+        span.end()
+
+    def update(self, item):
+        """
+        Update the card of a single item in place, if it is listed.
+        """
+        key = self.key(item)
+        if key in self.items:
+            self.items[key] = item
+            card = self.cards.get(key)
+            if card is not None:
+                card.set_item(item)
+
+    def append(self, item):
+        """
+        Render a card for a new item after every other card.
+        """
+        self._clear_message()
+        key = self.key(item)
+        card = self.create_card(item)
+        self.cards[key] = card
+        self.items[key] = item
+        if self._order is not None:
+            self._order.append(key)
+        card.pack(**self.pack_options)
+        return card
+
+    def rekey(self, old_key, item):
+        """
+        Hand the card of old_key over to item (e.g. a placeholder that got its
+        real id), updating it in place.
+        """
+        card = self.cards.pop(old_key)
+        del self.items[old_key]
+        key = self.key(item)
+        self.cards[key] = card
+        self.items[key] = item
+        if self._order is not None:
+            self._order = [key if k == old_key else k for k in self._order]
+        card.set_item(item)
+
+    def hide(self, key):
+        """
+        Take a card out of the layout without destroying it, so it can be put
+        back where it was with show().
+        """
+        card = self.cards.get(key)
+        if card is None or key in self.hidden:
+            return
+        slaves = self.parent.pack_slaves()
+        position = slaves.index(card)
+        self.hidden[key] = slaves[position - 1] if position else None
+        card.pack_forget()
+
+    def show(self, key):
+        """
+        Put a hidden card back after the card that preceded it.
+        """
+        if key not in self.hidden:
+            return
+        previous = self.hidden.pop(key)
+        if previous is not None and (
+            not previous.winfo_exists() or previous.winfo_manager() != "pack"
+        ):
+            previous = None
+        self._pack(self.cards[key], previous, self.parent.pack_slaves())
+
+    def remove(self, key):
+        """
+        Drop a single item, destroying its card if it is rendered.
+        """
+        card = self.cards.pop(key, None)
+        if card is not None:
+            card.destroy()
+        self.items.pop(key, None)
+        self.hidden.pop(key, None)
+
+    def get(self, key):
+        """
+        Return the card rendered for a key, or None.
+        """
+        return self.cards.get(key)
+
+    def visible_keys(self) -> list:
+        """
+        Keys of the items in the layout, in display order, including the ones
+        whose cards are still waiting for their slice.
+        """
+        if self._order is not None:
+            return [k for k in self._order if k in self.items and k not in self.hidden]
+        keys = {card: key for key, card in self.cards.items()}
+        return [keys[card] for card in self.parent.pack_slaves() if card in keys]
+
+    def show_message(self, text: str):
+        """
+        Replace every card with a single placeholder line.
+        """
+        self._cancel_layout()
+        for card in self.cards.values():
+            card.destroy()
+        self.cards.clear()
+        self.items.clear()
+        self.hidden.clear()
+        self._clear_message()
+        self._message = tk.Label(self.parent, text=text, bg=self.bg)
+        self._message.pack(pady=10)
+
+    def _layout(self, span=None) -> int:
+        """
+        Pack the cards of self._order, creating at most chunk_size of them;
+        the rest is left to another call on the next idle cycle.
+        Returns the number of cards created.
+        :param span: Metrics span of the sync, a new one for later slices
+        """
+        self._layout_id = None
+        if not self.parent.winfo_exists():
+            return 0
+        own_span = span is None
+        if own_span:
+            span = metrics.span("ui", f"{self.name} (slice)")
+
+        created = 0
+        with self.batch():
+            # Kept in step with the packing below rather than asked of Tk
+            # after every card, which made long lists quadratic
+            slaves = self.parent.pack_slaves()
+            previous = None
+            position = 0
+            for key in self._order:
+                if key not in self.items or key in self.hidden:
+                    continue
+                card = self.cards.get(key)
+                if card is None:
+                    if created >= self.chunk_size:
+                        self._layout_id = self.parent.after_idle(self._layout)
+                        break
+                    card = self.cards[key] = self.create_card(self.items[key])
+                    created += 1
+                    span.mark("create")
+                    self._pack(card, previous, slaves)
+                    slaves.insert(position, card)
+                    span.mark("pack")
+                elif position >= len(slaves) or slaves[position] is not card:
+                    self._pack(card, previous, slaves)
+                    if card in slaves:
+                        slaves.remove(card)
+                    slaves.insert(position, card)
+                    span.mark("pack")
+                previous = card
+                position += 1
+            else:
+                self._order = None
+
+        if own_span:
+            span.set(created=created, cards=len(self.cards))
+            span.end()
+        return created
+
+    def _cancel_layout(self):
+        """
+        Drop the slices waiting to be laid out.
+        """
+        if self._layout_id is not None:
+            self.parent.after_cancel(self._layout_id)
+            self._layout_id = None
+        self._order = None
+
+    def _pack(self, card: tk.Widget, previous: tk.Widget, slaves: list):
+        """
+        Pack a card right after previous, or first in the parent.
+        :param slaves: Current pack order of the parent
+        """
+        if previous is not None:
+            card.pack(after=previous, **self.pack_options)
+        elif slaves and slaves[0] is not card:
+            card.pack(before=slaves[0], **self.pack_options)
+        else:
+            card.pack(**self.pack_options)
+
+    def _schedule_scrollregion(self):
+        """
+        Fit the canvas scrollregion to the cards on the next idle cycle,
+        unless a batch is in progress; bursts of changes share one update.
+        """
+        if self.canvas is None or self._batches or self._scroll_id is not None:
+            return
+        self._scroll_id = self.parent.after_idle(self._update_scrollregion)
+
+    def _update_scrollregion(self):
+        """
+        Size the canvas scrollregion to everything drawn on it.
+        """
+        self._scroll_id = None
+        if self.canvas.winfo_exists():
+            self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+
+    def _clear_message(self):
+        """
+        Remove the placeholder line, if any.
+        """
+        if self._message is not None:
+            self._message.destroy()
+            self._message = None
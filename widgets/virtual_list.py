@@ -0,0 +1,273 @@
+import tkinter as tk
+
+from api.metrics import metrics
+
+
+class VirtualList:
+    """
+    Virtualized list drawn on a canvas.
+    Only rows inside (or just around) the viewport exist as widgets; they are
+    recycled as the user scrolls, so widget count is bounded by the window height
+    and not by the number of items.
+    """
+
+    def __init__(
+        self,
+        canvas: tk.Canvas,
+        scrollbar: tk.Scrollbar,
+        row_height: int,
+        create_row,
+        key=None,
+        on_near_end=None,
+        on_render=None,
+        name: str = "list",
+        padx: int = 5,
+        pady: int = 8,
+        overscan: int = 2,
+    ):
+        """
+        :param canvas: Canvas the rows are drawn on
+        :param scrollbar: Vertical scrollbar attached to the canvas
+        :param row_height: Fixed height of a row slot in pixels, padding included
+        :param create_row: Factory returning a new row widget (child of the canvas)
+            exposing set_item(item)
+        :param key: Function returning the unique key of an item, used to keep the
+            scroll position anchored on the same item across updates
+        :param on_near_end: Called when rows within the overscan of the last item
+            get rendered, e.g. to load the next page
+        :param on_render: Called with the items materialized (viewport plus
+            overscan) after every render, e.g. to prefetch their details
+        :param name: Name of the list in the render timings (diagnostics)
+        :param padx: Horizontal gap between a row and the canvas edges
+        :param pady: Vertical gap above and below each row
+        :param overscan: Extra rows materialized above and below the viewport
+        """
+        self.canvas = canvas
+        self.scrollbar = scrollbar
+        self.row_height = row_height
+        self.create_row = create_row
+        self.key = key
+        self.on_near_end = on_near_end
+        self.on_render = on_render
+        self.name = name
+        self.padx = padx
+        self.pady = pady
+        self.overscan = overscan
+
+        self.items = []
+        self.visible = {}  # item index -> (row widget, canvas window id, item)
+        self.spare = []  # detached (row widget, canvas window id) pairs
+        self._message_id = None
+        self._render_pending = False
+
+        self.canvas.configure(yscrollcommand=self._on_yview)
+        self.canvas.bind("<Configure>", self._on_resize, add="+")
+
+    def set_items(self, items: list):
+        """
+        Replace the displayed items and scroll back to the top.
+        """
+        self._clear_message()
+        self.items = list(items)
+        self._release_all()
+        self._update_scrollregion()
+        self.canvas.yview_moveto(0)
+        self.schedule_render()
+
+    def append_items(self, items: list):
+        """
+        Add items after the current ones without moving the viewport.
+        """
+        if not items:
+            return
+        self._clear_message()
+        self.items.extend(items)
+        self._update_scrollregion()
+        self.schedule_render()
+
+    def update_items(self, items: list):
+        """
+        Replace the displayed items, keeping the scroll position on the same item
+        and only rebinding rows whose item actually changed.
+        """
+        if self._message_id is not None or not self.items:
+            self.set_items(items)
+            return
+
+        top = self.canvas.canvasy(0)
+        anchor_index = min(int(top // self.row_height), len(self.items) - 1)
+        offset = top - anchor_index * self.row_height
+        anchor_key = self.key(self.items[anchor_index]) if self.key else None
+
+        self.items = list(items)
+        self._update_scrollregion()
+
+        new_index = anchor_index
+        if self.key is not None:
+            for index, item in enumerate(self.items):
+                if self.key(item) == anchor_key:
+                    new_index = index
+                    break
+        total = len(self.items) * self.row_height
+        if total:
+            self.canvas.yview_moveto((new_index * self.row_height + offset) / total)
+
+        for index in list(self.visible):
+            row, window_id, shown = self.visible[index]
+            if index >= len(self.items):
+                self._release(index)
+            elif self.items[index] != shown:
+                row.set_item(self.items[index])
+                self.visible[index] = (row, window_id, self.items[index])
+        self.schedule_render()
+
+    def set_message(self, text: str):
+        """
+        Replace the list with a single line of text (loading, empty or error state).
+        """
+        self.items = []
+        self._release_all()
+        self._clear_message()
+        self._message_id = self.canvas.create_text(
+            self.canvas.winfo_width() // 2 or 10,
+            20,
+            text=text,
+            anchor="n",
+        )
+        self._update_scrollregion()
+
+    def schedule_render(self):
+        """
+        Render on the next idle cycle, coalescing bursts of scroll events.
+        """
+        if not self._render_pending:
+            self._render_pending = True
+            self.canvas.after_idle(self._render)
+
+    def row_count(self) -> int:
+        """
+        Number of row widgets currently materialized, visible or spare.
+        """
+        return len(self.visible) + len(self.spare)
+
+    def _visible_range(self) -> range:
+        """
+        Indices of the items intersecting the viewport, padded by the overscan.
+        """
+        top = self.canvas.canvasy(0)
+        height = max(self.canvas.winfo_height(), self.row_height)
+        first = max(int(top // self.row_height) - self.overscan, 0)
+        last = min(
+            int((top + height) // self.row_height) + 1 + self.overscan, len(self.items)
+        )
+        return range(first, last)
+
+    def _render(self):
+        """
+        Materialize rows for the viewport and recycle the ones scrolled away.
+        """
+        self._render_pending = False
+        span = metrics.span("ui", self.name)
+        wanted = self._visible_range()
+
+        for index in [i for i in self.visible if i not in wanted]:
+            self._release(index)
+        span.mark("recycle")
+
+        width = self._row_width()
+        created = bound = 0
+        for index in wanted:
+            if index in self.visible:
+                continue
+            if self.spare:
+                row, window_id = self.spare.pop()
+                self.canvas.itemconfigure(window_id, state="normal", width=width)
+            else:
+                row = self.create_row()
+                window_id = self.canvas.create_window(
+                    0,
+                    0,
+                    window=row,
+                    anchor="nw",
+                    width=width,
+                    height=self.row_height - 2 * self.pady,
+                )
+                created += 1
+                span.mark("create")
+            item = self.items[index]
+            row.set_item(item)
+            self.canvas.coords(
+                window_id, self.padx, index * self.row_height + self.pady
+            )
+            self.visible[index] = (row, window_id, item)
+            bound += 1
+            span.mark("bind")
+        span.set(
+            items=len(self.items), created=created, bound=bound, rows=self.row_count()
+        )
+        span.end()
+
+        if self.on_render and self.items:
+            self.on_render(self.items[wanted.start : wanted.stop])
+
+        if self.on_near_end and self.items and wanted.stop >= len(self.items):
+            self.on_near_end()
+
+    def _release(self, index: int):
+        """
+        Hide the row showing an item and keep it for reuse.
+        """
+        row, window_id, _ = self.visible.pop(index)
+        self.canvas.itemconfigure(window_id, state="hidden")
+        self.spare.append((row, window_id))
+
+    def _release_all(self):
+        """
+        Detach every visible row so it can be reused for new items.
+        """
+        for index in list(self.visible):
+            self._release(index)
+
+    def _clear_message(self):
+        """
+        Remove the placeholder text, if any.
+        """
+        if self._message_id is not None:
+            self.canvas.delete(self._message_id)
+            self._message_id = None
+
+    def _row_width(self) -> int:
+        """
+        Width given to every row window.
+        """
+        return max(self.canvas.winfo_width() - 2 * self.padx, 1)
+
+    def _update_scrollregion(self):
+        """
+        Size the scrollable area to fit every item, materialized or not.
+        """
+        height = len(self.items) * self.row_height
+        self.canvas.configure(
+            scrollregion=(0, 0, self.canvas.winfo_width(), max(height, 1))
+        )
+
+    def _on_yview(self, first, last):
+        """
+        Keep the scrollbar in sync and render whatever scrolled into view.
+        """
+        self.scrollbar.set(first, last)
+        self.schedule_render()
+
+    def _on_resize(self, _event):
+        """
+        Stretch rows to the new canvas width and fill a taller viewport.
+        """
+        width = self._row_width()
+        for _, window_id, _ in self.visible.values():
+            self.canvas.itemconfigure(window_id, width=width)
+        for _, window_id in self.spare:
+            self.canvas.itemconfigure(window_id, width=width)
+        if self._message_id is not None:
+            self.canvas.coords(self._message_id, self.canvas.winfo_width() // 2, 20)
+        self._update_scrollregion()
+        self.schedule_render()
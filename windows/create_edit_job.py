@@ -1,9 +1,9 @@
 import tkinter as tk
+from functools import partial
 from tkinter import messagebox
 
-import requests
-
-from config import BASE_API_URL
+from api.background import get_runner
+from api.client import ApiError, JobConnectClient
 
 
 class CreateEditJobWindow(tk.Toplevel):
@@ -12,10 +12,10 @@ class CreateEditJobWindow(tk.Toplevel):
     The same interface adapts based on whether a job object is passed in.
     """
 
-    def __init__(self, master, cookies, on_success, job=None):
+    def __init__(self, master, client: JobConnectClient, on_success, job=None):
         """
         :param master: Parent window
-        :param cookies: Authenticated session cookies
+        :param client: Shared API client holding the auth session
         :param on_success: Callback function to call after successful submission
         :param job: (Optional) Job object to edit if no job is passed, its new job mode
         """
@@ -24,7 +24,7 @@ class CreateEditJobWindow(tk.Toplevel):
         self.title("Edit Job" if job else "Create New Job")
         self.geometry("400x450")
         self.configure(bg="#f9f9f9")
-        self.cookies = cookies
+        self.client = client
         self.on_success = on_success
 
         # Title Label
@@ -69,14 +69,15 @@ class CreateEditJobWindow(tk.Toplevel):
             self.description_text.insert("1.0", job.description)
 
         # Submit button
-        tk.Button(
+        self.submit_button = tk.Button(
             self,
             text="Submit",
             command=self.submit_job,
             width=20,
             bg="#007acc",
             fg="white",
-        ).pack(pady=20)
+        )
+        self.submit_button.pack(pady=20)
 
     def submit_job(self):
         """
@@ -100,28 +101,31 @@ class CreateEditJobWindow(tk.Toplevel):
             messagebox.showerror("Validation Error", "All fields are required.")
             return
 
-        try:
-            if self.job:
-                data["job_id"] = self.job.job_id
-                res = requests.put(
-                    f"{BASE_API_URL}/job/{self.job.job_id}",
-                    json=data,
-                    cookies=self.cookies,
-                    verify=False,
-                )
-            else:
-                res = requests.post(
-                    f"{BASE_API_URL}/job",
-                    json=data,
-                    cookies=self.cookies,
-                    verify=False,
-                )
-
-            if res.status_code in [200, 201, 204]:
-                messagebox.showinfo("Success", "Job saved successfully!")
-                self.destroy()
-                self.on_success()
-            else:
-                messagebox.showerror("Error", f"Failed to save job.\n{res.text}")
-        except Exception as e:
-            messagebox.showerror("Connection Error", str(e))
+        if self.job:
+            data["job_id"] = self.job.job_id
+            request = partial(self.client.update_job, self.job.job_id, data)
+        else:
+            request = partial(self.client.create_job, data)
+
+        self.submit_button.config(state="disabled", text="Saving...")
+        get_runner(self).submit(
+            request, on_success=self._on_saved, on_error=self._on_save_error
+        )
+
+    def _on_saved(self, _):
+        """
+        Close the form and let the owner refresh.
+        """
+        messagebox.showinfo("Success", "Job saved successfully!")
+        self.destroy()
+        self.on_success()
+
+    def _on_save_error(self, error: Exception):
+        """
+        Report a failed save and re-enable the form.
+        """
+        self.submit_button.config(state="normal", text="Submit")
+        if isinstance(error, ApiError):
+            messagebox.showerror("Error", f"Failed to save job.\n{error.text}")
+        else:
+            messagebox.showerror("Connection Error", str(error))
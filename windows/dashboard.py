@@ -1,7 +1,10 @@
 import tkinter as tk
 from tkinter import ttk
 
+from api.background import BackgroundRunner
+from api.client import JobConnectClient
 from objects import Account
+from store.replica import LocalReplica
 from tabs.account import AccountTab
 from tabs.jobs import JobsTab
 
@@ -11,17 +14,30 @@ class MainDashboardWindow(tk.Tk):
     Main dashboard window for JobConnect after successful login - has tabs to things
     """
 
-    def __init__(self, cookies, user_account: Account):
+    def __init__(self, client: JobConnectClient, user_account: Account):
         """
-        :param cookies: Session cookies for API requests fro auth
+        :param client: Shared API client holding the auth session
         :param user_account: Logged-in user's account info
         """
         super().__init__()
         self.title("JobConnect - Dashboard")
         self.geometry("700x600")
         self.configure(bg="#f0f0f0")
-        self.cookies = cookies
+        self.client = client
         self.user_account = user_account
+        self.runner = BackgroundRunner(self)
+        self.replica = LocalReplica.for_account(user_account)
+
+        # Menu: timings and connection state for troubleshooting slowness
+        menubar = tk.Menu(self)
+        view_menu = tk.Menu(menubar, tearoff=0)
+        view_menu.add_command(
+            label="Diagnostics", accelerator="Ctrl+D", command=self.open_diagnostics
+        )
+        menubar.add_cascade(label="View", menu=view_menu)
+        self.config(menu=menubar)
+        self.bind("<Control-d>", lambda e: self.open_diagnostics())
+        self._diagnostics = None
 
         # Header
         header_frame = tk.Frame(self, bg="#f0f0f0")
@@ -40,6 +56,20 @@ class MainDashboardWindow(tk.Tk):
 
         # Tabs
         notebook.add(
-            AccountTab(notebook, self.cookies, self.user_account), text="Account"
+            AccountTab(notebook, self.client, self.user_account), text="Account"
+        )
+        notebook.add(
+            JobsTab(notebook, self.client, self.user_account, self.replica),
+            text="Jobs",
         )
-        notebook.add(JobsTab(notebook, self.cookies, self.user_account), text="Jobs")
+
+    def open_diagnostics(self):
+        """
+        Show the diagnostics window, or raise it if already open.
+        """
+        if self._diagnostics is not None and self._diagnostics.winfo_exists():
+            self._diagnostics.lift()
+            return
+        from windows.diagnostics import DiagnosticsWindow
+
+        self._diagnostics = DiagnosticsWindow(self, self.client)
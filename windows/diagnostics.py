@@ -0,0 +1,199 @@
+import bisect
+import tkinter as tk
+from tkinter import ttk
+
+from api.client import JobConnectClient
+from api.metrics import metrics
+from config import DIAGNOSTICS_REFRESH_MS
+
+# Upper bounds (ms) of the histogram buckets; the last bucket is open-ended
+HISTOGRAM_BOUNDS = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+
+class DiagnosticsWindow(tk.Toplevel):
+    """
+    Shows where time goes: p50/p95/p99 of every phase of every API endpoint
+    and list render, a latency histogram of the selected row, and the state
+    of the connection (shared requests, circuit breaker, widget count).
+    Recording is off until switched on here.
+    """
+
+    def __init__(self, master: tk.Misc, client: JobConnectClient):
+        """
+        :param master: Parent window, whose widgets are counted
+        :param client: Shared API client whose connection state is shown
+        """
+        super().__init__(master)
+        self.master = master
+        self.client = client
+        self.title("JobConnect - Diagnostics")
+        self.geometry("760x560")
+        self.configure(bg="#f9f9f9")
+
+        # Recording switch and log location
+        controls = tk.Frame(self, bg="#f9f9f9")
+        controls.pack(fill="x", padx=10, pady=(10, 5))
+        self.recording = tk.BooleanVar(value=metrics.enabled)
+        tk.Checkbutton(
+            controls,
+            text="Record timings",
+            variable=self.recording,
+            command=self.toggle_recording,
+            bg="#f9f9f9",
+        ).pack(side="left")
+        tk.Button(controls, text="Clear", command=self.clear).pack(side="left", padx=5)
+        tk.Label(
+            controls,
+            text=f"Log: {metrics.path}" if metrics.path else "Log: off",
+            fg="gray",
+            bg="#f9f9f9",
+        ).pack(side="right")
+
+        self.status_label = tk.Label(self, anchor="w", bg="#f9f9f9")
+        self.status_label.pack(fill="x", padx=10)
+
+        # Percentiles per (endpoint or list, phase)
+        columns = ("phase", "count", "errors", "p50", "p95", "p99", "max")
+        self.table = ttk.Treeview(self, columns=columns, height=12)
+        self.table.heading("#0", text="endpoint / list")
+        self.table.column("#0", width=240)
+        for column in columns:
+            self.table.heading(column, text=column)
+            self.table.column(column, width=70, anchor="e")
+        self.table.column("phase", width=90, anchor="w")
+        self.table.pack(fill="both", expand=True, padx=10, pady=5)
+        self.table.bind("<<TreeviewSelect>>", lambda e: self._draw_histogram())
+        self._rows = {}  # table item id -> (kind, name, phase)
+
+        # Histogram of the selected row
+        self.histogram = tk.Canvas(self, height=150, bg="white", highlightthickness=0)
+        self.histogram.pack(fill="x", padx=10, pady=(0, 10))
+
+        self._refresh_id = None
+        self.refresh()
+        self.bind("<Destroy>", self._on_destroy)
+
+    def toggle_recording(self):
+        """
+        Switch recording on or off, following the checkbox.
+        """
+        if self.recording.get():
+            metrics.enable()
+        else:
+            metrics.disable()
+        self.refresh()
+
+    def clear(self):
+        """
+        Forget the timings collected so far.
+        """
+        metrics.clear()
+        self.refresh()
+
+    def refresh(self):
+        """
+        Redraw the table and histogram, and schedule the next redraw.
+        """
+        if self._refresh_id is not None:
+            self.after_cancel(self._refresh_id)
+        flights = self.client.flights.stats()
+        breaker = self.client.breaker
+        self.status_label.config(
+            text=(
+                f"Requests sent: {flights['executed']}   "
+                f"shared: {flights['coalesced']}   "
+                f"Server: {breaker.state} ({breaker.failures} failures)   "
+                f"Widgets: {count_widgets(self.master)}"
+            )
+        )
+
+        selected = self._rows.get(next(iter(self.table.selection()), None))
+        self.table.delete(*self.table.get_children())
+        self._rows.clear()
+        parents = {}
+        for row in metrics.summary():
+            series = (row["kind"], row["name"])
+            parent = parents.get(series)
+            if parent is None:
+                parent = parents[series] = self.table.insert(
+                    "", "end", text=f"{row['kind']}  {row['name']}", open=True
+                )
+            item = self.table.insert(
+                parent,
+                "end",
+                values=(
+                    row["phase"],
+                    row["count"],
+                    row["errors"],
+                    f"{row['p50']:.1f}",
+                    f"{row['p95']:.1f}",
+                    f"{row['p99']:.1f}",
+                    f"{row['max']:.1f}",
+                ),
+            )
+            key = series + (row["phase"],)
+            self._rows[item] = key
+            if key == selected:
+                self.table.selection_set(item)
+        self._draw_histogram()
+        self._refresh_id = self.after(DIAGNOSTICS_REFRESH_MS, self.refresh)
+
+    def _draw_histogram(self):
+        """
+        Draw the distribution of the selected phase's timings.
+        """
+        canvas = self.histogram
+        canvas.delete("all")
+        key = self._rows.get(next(iter(self.table.selection()), None))
+        if key is None:
+            canvas.create_text(
+                10, 10, anchor="nw", text="Select a phase to see its distribution."
+            )
+            return
+
+        counts = histogram(metrics.timings(*key))
+        width = max(canvas.winfo_width(), len(counts) * 40)
+        height = int(canvas.cget("height"))
+        slot = width / len(counts)
+        tallest = max(counts) or 1
+        labels = [f"≤{bound:g}" for bound in HISTOGRAM_BOUNDS]
+        labels.append(f">{HISTOGRAM_BOUNDS[-1]:g}")
+        for index, (count, label) in enumerate(zip(counts, labels)):
+            left = index * slot + 4
+            bar = (height - 40) * count / tallest
+            canvas.create_rectangle(
+                left, height - 20 - bar, left + slot - 8, height - 20, fill="#4a90d9"
+            )
+            if count:
+                canvas.create_text(
+                    left + slot / 2 - 4, height - 24 - bar, text=count, anchor="s"
+                )
+            canvas.create_text(left + slot / 2 - 4, height - 10, text=label)
+        canvas.create_text(
+            width - 4, 4, anchor="ne", text=f"{key[1]} · {key[2]} (ms)", fill="gray"
+        )
+
+    def _on_destroy(self, event):
+        """
+        Stop redrawing once the window is closed.
+        """
+        if event.widget is self and self._refresh_id is not None:
+            self.after_cancel(self._refresh_id)
+            self._refresh_id = None
+
+
+def histogram(timings: list) -> list:
+    """
+    Count timings per HISTOGRAM_BOUNDS bucket, plus one for anything slower.
+    """
+    counts = [0] * (len(HISTOGRAM_BOUNDS) + 1)
+    for ms in timings:
+        counts[bisect.bisect_left(HISTOGRAM_BOUNDS, ms)] += 1
+    return counts
+
+
+def count_widgets(widget: tk.Misc) -> int:
+    """
+    Number of widgets in the tree under widget, itself included.
+    """
+    return 1 + sum(count_widgets(child) for child in widget.winfo_children())
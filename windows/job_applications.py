@@ -1,10 +1,15 @@
+import itertools
 import tkinter as tk
-from tkinter import messagebox
+from tkinter import messagebox, ttk
 
-import requests
-
-from config import BASE_API_URL
+from api.background import get_runner
+from api.bulk import run_bounded
+from api.client import ApiError, JobConnectClient
+from api.generation import Generation, Token
 from objects import Account, Application, Job
+from store.replica import LocalReplica
+from widgets.card_text import STATUS_COLORS, application_text, warm_previews
+from widgets.keyed_list import KeyedList
 
 
 class JobApplicationsWindow(tk.Toplevel):
@@ -13,17 +18,43 @@ class JobApplicationsWindow(tk.Toplevel):
     recruiters (can manage status) and applicants (can apply or withdraw).
     """
 
-    def __init__(self, master, cookies, user_account: Account, job: Job):
+    def __init__(
+        self,
+        master,
+        client: JobConnectClient,
+        user_account: Account,
+        job: Job,
+        replica: LocalReplica = None,
+    ):
         """
         :param master: Parent window
-        :param cookies: Session cookies for authenticated API access
+        :param client: Shared API client holding the auth session
         :param user_account: The current logged-in user
         :param job: The job for which applications are shown
+        :param replica: (Optional) on-disk copy of applications shown while loading
         """
         super().__init__(master)
-        self.cookies = cookies
+        self.client = client
         self.user_account = user_account
         self.job = job
+        self.replica = replica
+        # Optimistic changes awaiting the server, overlaid on every refresh:
+        # application_id -> (token, application shown, or None while withdrawing)
+        self.pending = {}
+        # Placeholder key -> application submitted but not yet confirmed
+        self.submissions = {}
+        # Placeholder keys whose POST is still in flight (not withdrawable yet)
+        self.submitting = set()
+        self._tokens = itertools.count()
+        # Last list fetched from the server (or the replica while loading)
+        self.applications = []
+        # Recruiter multi-select: selected application ids and the shift-click anchor
+        self.selected = set()
+        self._anchor = None
+        self._bulk = None  # BulkRun in progress, if any
+        self._failed = None  # (applications, status) of the last failed bulk items
+        # Each refresh supersedes the previous one, aborting its download
+        self.generation = Generation()
 
         self.title(f"Applications - {job.title}")
         self.geometry("700x550")
@@ -50,6 +81,10 @@ class JobApplicationsWindow(tk.Toplevel):
                 height=1,
             ).pack(pady=(0, 15))
 
+        # Recruiter bulk triage: filter, selection and bulk status actions
+        if self.user_account.role == "recruiter":
+            self._build_bulk_toolbar()
+
         # Scrollable container
         container = tk.Frame(self)
         container.pack(fill="both", expand=True, padx=10, pady=5)
@@ -60,182 +95,520 @@ class JobApplicationsWindow(tk.Toplevel):
         )
         self.scrollable_frame = tk.Frame(self.canvas, bg="#f9f9f9")
 
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all")),
-        )
         self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
+        self.application_list = KeyedList(
+            self.scrollable_frame,
+            key=lambda app: app.application_id,
+            create_card=self.render_application,
+            bg="#f9f9f9",
+            name="applications",
+            canvas=self.canvas,
+            fill="x",
+            padx=15,
+            pady=10,
+        )
         self.canvas.configure(yscrollcommand=self.scrollbar.set)
 
         self.canvas.pack(side="left", fill="both", expand=True)
         self.scrollbar.pack(side="right", fill="y")
         self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
 
+        # Prefetched or previously fetched list first, then the replica;
+        # the refresh below reconciles either with the server
+        stored = self.client.cached_applications(job.job_id)
+        if stored is None and self.replica is not None:
+            stored = self.replica.load_applications(job.job_id)
+        if stored:
+            self._show_applications(stored)
         self.refresh_applications()
+        self.bind("<Destroy>", self._on_destroy)
 
-    def refresh_applications(self):
+    def _build_bulk_toolbar(self):
         """
-        Fetch and display applications for the current job.
+        Build the filter, selection and bulk action controls for recruiters.
         """
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
+        toolbar = tk.Frame(self, bg="#f9f9f9")
+        toolbar.pack(fill="x", padx=15)
+
+        tk.Label(toolbar, text="Show:", bg="#f9f9f9").pack(side="left")
+        self.status_filter = ttk.Combobox(
+            toolbar, values=["all", *STATUS_COLORS], width=10, state="readonly"
+        )
+        self.status_filter.set("all")
+        self.status_filter.bind("<<ComboboxSelected>>", lambda e: self._render())
+        self.status_filter.pack(side="left", padx=(5, 10))
 
-        try:
-            res = requests.get(
-                f"{BASE_API_URL}/application/job/{self.job.job_id}",
-                cookies=self.cookies,
-                verify=False,
+        tk.Button(toolbar, text="Select all", command=self.select_all).pack(
+            side="left", padx=2
+        )
+        tk.Button(toolbar, text="Clear", command=self.clear_selection).pack(
+            side="left", padx=2
+        )
+        self.selection_label = tk.Label(toolbar, text="0 selected", bg="#f9f9f9")
+        self.selection_label.pack(side="left", padx=10)
+
+        self.bulk_buttons = []
+        for status, color in STATUS_COLORS.items():
+            button = tk.Button(
+                toolbar,
+                text=f"Mark {status}",
+                command=lambda s=status: self.bulk_update(s),
+                font=("Arial", 9),
+                bg=color,
+                fg="white",
+                activebackground=color,
             )
-            if res.status_code == 200:
-                applications = res.json()
-                if not applications:
-                    tk.Label(
-                        self.scrollable_frame,
-                        text="No applications found.",
-                        bg="#f9f9f9",
-                    ).pack(pady=10)
-                    return
-
-                for app_data in applications:
-                    self.render_application(app_data)
-            else:
-                messagebox.showerror(
-                    "Error", f"Failed to fetch applications.\n{res.text}"
-                )
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
+            button.pack(side="right", padx=2)
+            self.bulk_buttons.append(button)
+
+        progress_row = tk.Frame(self, bg="#f9f9f9")
+        progress_row.pack(fill="x", padx=15, pady=(5, 0))
+        self.progress = ttk.Progressbar(progress_row, length=250, mode="determinate")
+        self.progress_label = tk.Label(progress_row, bg="#f9f9f9")
+        self.retry_button = tk.Button(
+            progress_row, text="Retry failed", command=self.retry_failed
+        )
 
-    def render_application(self, data):
+    def refresh_applications(self):
         """
-        Render a single application in the scrollable frame with status and buttons.
+        Fetch applications for the current job in the background and display them.
+        Cards already on screen stay up until the new list is reconciled with them.
+        A refresh cancels the one before it, so only the latest answer is drawn.
         """
-        app = Application(
-            application_id=data["application_id"],
-            job_id=data["job_id"],
-            account_id=data["account_id"],
-            content=data["content"],
-            status=data["status"],
+        if not len(self.application_list):
+            self.application_list.show_message("Loading applications...")
+        token = self.generation.next()
+        get_runner(self).submit(
+            self._fetch_and_store,
+            token,
+            on_success=self._on_applications_loaded,
+            on_error=self._on_load_error,
+            cancelled=token,
         )
 
-        frame = tk.Frame(
-            self.scrollable_frame,
-            relief="ridge",
-            borderwidth=2,
-            padx=15,
-            pady=12,
-            bg="white",
-        )
-        frame.pack(fill="x", padx=15, pady=10)
+    def _fetch_and_store(self, token: Token) -> list:
+        """
+        Fetch the applications, record them in the replica and prepare their
+        card previews. Runs on a background worker.
+        """
+        applications = self.client.get_applications_for_job(self.job.job_id, token)
+        token.check()
+        warm_previews(app.content for app in applications)
+        if self.replica is not None:
+            self.replica.replace_applications(self.job.job_id, applications)
+        return applications
+
+    def _show_applications(self, applications: list):
+        """
+        Keep the fetched applications and reconcile the cards with them.
+        """
+        self.applications = applications
+        self._render()
 
-        # Application content
-        tk.Label(
-            frame,
-            text=f"Content:\n{app.content}",
-            anchor="w",
-            justify="left",
-            wraplength=550,
-            font=("Arial", 11),
-            bg="white",
-        ).pack(fill="x", pady=(0, 6))
+    def _on_applications_loaded(self, applications: list):
+        """
+        Show the applications fetched from the server and recount the job's
+        status badges from them.
+        """
+        self._show_applications(applications)
+        self.client.application_counts.set_from(self.job.job_id, self._overlaid())
 
-        # Status label with color
-        status_colors = {
-            "pending": "#f57c00",  # Orange
-            "accepted": "#2e7d32",  # Green
-            "rejected": "#c62828",  # Red
-        }
-        status_color = status_colors.get(app.status.lower(), "black")
+    def _render(self):
+        """
+        Reconcile the rendered cards with the last fetched applications,
+        keeping unconfirmed submissions and applying the status filter.
+        """
+        shown = self._overlaid()
+        shown.extend(self.submissions.values())
 
-        tk.Label(
-            frame,
-            text=f"Status: {app.status.capitalize()}",
-            fg=status_color,
-            font=("Arial", 10, "bold"),
-            bg="white",
-        ).pack(anchor="w", pady=(0, 10))
+        wanted = self._filter_status()
+        if wanted is not None:
+            shown = [app for app in shown if app.status.lower() == wanted]
 
-        # Recruiter controls with color-coded buttons
-        if self.user_account.role == "recruiter":
-            status_frame = tk.Frame(frame, bg="white")
-            status_frame.pack(anchor="w", pady=5)
+        if not shown:
+            self.application_list.show_message("No applications found.")
+        else:
+            self.application_list.sync(shown)
 
-            for status, color in {
-                "pending": "#f57c00",
-                "accepted": "#2e7d32",
-                "rejected": "#c62828",
-            }.items():
-                tk.Button(
-                    status_frame,
-                    text=f"Mark {status}",
-                    command=lambda s=status, a=app: self.update_status(a, s),
-                    width=12,
-                    font=("Arial", 9),
-                    bg=color,
-                    fg="white",
-                    activebackground=color,
-                ).pack(side="left", padx=5)
+        if self.selected:
+            # Selection only ever covers what is on screen
+            self.selected &= set(self.application_list.visible_keys())
+            self._selection_changed()
 
-        # Applicant controls
-        elif self.user_account.role == "applicant":
-            tk.Button(
-                frame,
-                text="Withdraw Application",
-                command=lambda a=app: self.withdraw_application(a),
-                bg="red",
-                fg="white",
-                padx=10,
-                pady=5,
-                font=("Arial", 10, "bold"),
-            ).pack(pady=(5, 0))
+    def _overlaid(self) -> list:
+        """
+        The last fetched applications with the optimistic changes not yet
+        confirmed applied on top, withdrawn ones left out.
+        """
+        shown = []
+        for app in self.applications:
+            pending = self.pending.get(app.application_id)
+            if pending is None:
+                shown.append(app)
+            elif pending[1] is not None:
+                shown.append(pending[1])
+        return shown
+
+    def _filter_status(self):
+        """
+        Status selected in the recruiter filter, or None to show everything.
+        """
+        if self.user_account.role != "recruiter":
+            return None
+        wanted = self.status_filter.get()
+        return None if wanted == "all" else wanted
+
+    def _on_load_error(self, error: Exception):
+        """
+        Report a failed fetch.
+        """
+        if not len(self.application_list):
+            self.application_list.show_message("Failed to load applications.")
+        if isinstance(error, ApiError):
+            messagebox.showerror(
+                "Error", f"Failed to fetch applications.\n{error.text}"
+            )
+        else:
+            messagebox.showerror("Error", str(error))
+
+    def render_application(self, app: Application) -> "ApplicationCard":
+        """
+        Build the card for a single application with status and buttons.
+        """
+        return ApplicationCard(self, app)
 
     def update_status(self, app: Application, new_status: str):
         """
         Recruiter can update the status of an application.
+        The card changes immediately; the PUT runs in the background and the
+        card rolls back with an inline error if the server rejects it.
         """
-        try:
-            res = requests.put(
-                f"{BASE_API_URL}/application/{app.application_id}",
-                json={
-                    "application_id": app.application_id,
-                    "job_id": app.job_id,
-                    "account_id": app.account_id,
-                    "content": app.content,
-                    "status": new_status,
-                },
-                cookies=self.cookies,
-                verify=False,
-            )
-            if res.status_code == 204:
-                self.refresh_applications()
-            else:
-                messagebox.showerror("Error", f"Failed to update status.\n{res.text}")
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
+        updated = Application(
+            application_id=app.application_id,
+            job_id=app.job_id,
+            account_id=app.account_id,
+            content=app.content,
+            status=new_status,
+        )
+        token = self._begin(app, updated)
+        self.application_list.update(updated)
+
+        get_runner(self).submit(
+            self._save_status,
+            updated,
+            on_success=lambda _: self._settle(app.application_id, token),
+            on_error=lambda e: self._roll_back(
+                app.application_id, token, app, e, "Failed to update status."
+            ),
+        )
+
+    def _save_status(self, app: Application):
+        """
+        Send a status change and record it locally. Runs on a background worker.
+        """
+        self.client.update_application(app, app.status)
+        if self.replica is not None:
+            self.replica.upsert_applications([app])
 
     def withdraw_application(self, app: Application):
         """
         Applicants can delete their own applications.
+        The card disappears immediately and comes back with an inline error if
+        the server refuses.
         """
+        if app.application_id in self.submitting:
+            # Its POST cannot be called back; withdraw once it has an id
+            return
+        if app.application_id in self.submissions:
+            # A submission that failed, so never reached the server: dismiss it
+            del self.submissions[app.application_id]
+            self.application_list.remove(app.application_id)
+            return
+
         confirm = messagebox.askyesno(
             "Withdraw", "Are you sure you want to withdraw this application?"
         )
         if not confirm:
             return
 
-        try:
-            res = requests.delete(
-                f"{BASE_API_URL}/application/{app.application_id}",
-                cookies=self.cookies,
-                verify=False,
+        token = self._begin(app, None)
+        self.application_list.hide(app.application_id)
+
+        get_runner(self).submit(
+            self._delete,
+            app.application_id,
+            on_success=lambda _: self._on_withdrawn(app.application_id, token),
+            on_error=lambda e: self._roll_back(
+                app.application_id, token, app, e, "Failed to delete application."
+            ),
+        )
+
+    def _delete(self, application_id: int):
+        """
+        Delete an application and forget it locally. Runs on a background worker.
+        """
+        self.client.delete_application(application_id)
+        if self.replica is not None:
+            self.replica.delete_application(application_id)
+
+    def _on_withdrawn(self, application_id: int, token: int):
+        """
+        Drop the hidden card once the server confirmed the withdrawal.
+        """
+        if self._settle(application_id, token):
+            self.application_list.remove(application_id)
+
+    def _begin(self, previous: Application, shown: Application) -> int:
+        """
+        Register an optimistic change and return its token.
+        :param previous: The application as displayed before the change
+        :param shown: The application displayed until the server answers,
+            None while it is being withdrawn
+        """
+        token = next(self._tokens)
+        self.pending[previous.application_id] = (token, shown)
+        self.client.application_counts.adjust(
+            self.job.job_id, previous.status, shown.status if shown else None
+        )
+        return token
+
+    def _settle(self, application_id: int, token: int) -> bool:
+        """
+        Forget a confirmed change; False if a newer change superseded it.
+        """
+        current = self.pending.get(application_id)
+        if current is None or current[0] != token:
+            return False
+        del self.pending[application_id]
+        return True
+
+    def _roll_back(
+        self,
+        application_id: int,
+        token: int,
+        previous: Application,
+        error: Exception,
+        message: str,
+    ):
+        """
+        Undo a rejected optimistic change and explain why on the card.
+        """
+        shown = self.pending.get(application_id, (None, None))[1]
+        if not self._settle(application_id, token):
+            return
+        self.client.application_counts.adjust(
+            self.job.job_id, shown.status if shown else None, previous.status
+        )
+        if not self.winfo_exists():
+            # Closed meanwhile (a bulk run outlives its window): counts only
+            return
+        self.application_list.show(application_id)
+        self.application_list.update(previous)
+        card = self.application_list.get(application_id)
+        if card is None:
+            # The card went away with a refresh meanwhile: bring it back
+            self.refresh_applications()
+            return
+        detail = error.text if isinstance(error, ApiError) else str(error)
+        card.show_error(f"{message} {detail}".strip())
+
+    def toggle_selected(self, application_id: int, selected: bool):
+        """
+        Select or deselect one application and make it the shift-click anchor.
+        """
+        if selected:
+            self.selected.add(application_id)
+        else:
+            self.selected.discard(application_id)
+        self._anchor = application_id
+        self._selection_changed()
+
+    def select_range(self, application_id: int):
+        """
+        Select every card between the anchor and application_id (shift-click).
+        """
+        keys = self.application_list.visible_keys()
+        if self._anchor not in keys:
+            self.toggle_selected(application_id, True)
+            return
+        start, end = sorted((keys.index(self._anchor), keys.index(application_id)))
+        self.selected.update(keys[start : end + 1])
+        self._selection_changed()
+
+    def select_all(self):
+        """
+        Select every application passing the current filter.
+        """
+        self.selected = set(self.application_list.visible_keys())
+        self._selection_changed()
+
+    def clear_selection(self):
+        """
+        Deselect every application.
+        """
+        self.selected = set()
+        self._anchor = None
+        self._selection_changed()
+
+    def _selection_changed(self):
+        """
+        Reflect the selection in the card checkboxes and the toolbar.
+        """
+        for key, card in self.application_list.cards.items():
+            card.set_selected(key in self.selected)
+        self.selection_label.config(text=f"{len(self.selected)} selected")
+
+    def bulk_update(self, new_status: str):
+        """
+        Set the status of every selected application.
+        """
+        if self._bulk is not None:
+            return
+        apps = [
+            self.application_list.items[key]
+            for key in self.application_list.visible_keys()
+            if key in self.selected
+        ]
+        if apps:
+            self._run_bulk(apps, new_status)
+
+    def retry_failed(self):
+        """
+        Send the status change again for the applications that failed last time.
+        """
+        if self._bulk is None and self._failed:
+            failed, status = self._failed
+            apps = [
+                self.application_list.items.get(app.application_id, app)
+                for app in failed
+            ]
+            self._run_bulk(apps, status)
+
+    def _run_bulk(self, apps: list, new_status: str):
+        """
+        Apply a status to many applications optimistically and push the PUTs
+        through a bounded number of parallel requests, rolling back each card
+        whose request fails.
+        """
+        run = BulkRun(new_status)
+        updates = []
+        for app in apps:
+            updated = Application(
+                application_id=app.application_id,
+                job_id=app.job_id,
+                account_id=app.account_id,
+                content=app.content,
+                status=new_status,
+            )
+            run.changes[app.application_id] = (
+                self._begin(app, updated),
+                app,
             )
-            if res.status_code == 204:
-                self.refresh_applications()
-            else:
+            self.application_list.update(updated)
+            updates.append(updated)
+
+        self._bulk = run
+        self._failed = None
+        for button in self.bulk_buttons:
+            button.config(state="disabled")
+        self.retry_button.pack_forget()
+        self.progress.config(maximum=len(updates), value=0)
+        self.progress.pack(side="left")
+        self.progress_label.pack(side="left", padx=10)
+        self._show_progress(run)
+
+        get_runner(self).stream(
+            run_bounded,
+            lambda app: self.client.update_application(app, app.status),
+            updates,
+            on_batch=lambda result: self._on_bulk_result(run, *result),
+            on_success=lambda: self._on_bulk_done(run),
+            on_error=lambda e: self._on_bulk_error(run, e),
+            cancelled=lambda: self._bulk is not run,
+        )
+
+    def _on_bulk_result(
+        self, run: "BulkRun", app: Application, _result, error: Exception
+    ):
+        """
+        Settle or roll back one application of a bulk change.
+        """
+        token, previous = run.changes[app.application_id]
+        if error is None:
+            self._settle(app.application_id, token)
+            run.succeeded.append(app)
+        else:
+            self._roll_back(
+                app.application_id, token, previous, error, "Failed to update status."
+            )
+            run.failed.append(previous)
+        if self.winfo_exists():
+            self.progress.config(value=len(run.succeeded) + len(run.failed))
+            self._show_progress(run)
+
+    def _on_bulk_done(self, run: "BulkRun"):
+        """
+        Report the outcome of a bulk change and record the successes locally.
+        A run the window was closed on still finishes; its failures are then
+        reported in a message box.
+        """
+        self._bulk = None
+        if self.replica is not None and run.succeeded:
+            get_runner(self).submit(self.replica.upsert_applications, run.succeeded)
+        if not self.winfo_exists():
+            if run.failed:
                 messagebox.showerror(
-                    "Error", f"Failed to delete application.\n{res.text}"
+                    "Error",
+                    f"{len(run.failed)} of {len(run.changes)} applications to "
+                    f"{self.job.title} could not be marked {run.status}.",
                 )
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
+            return
+
+        for button in self.bulk_buttons:
+            button.config(state="normal")
+        self._show_progress(run)
+
+        # Leave the failures selected, ready to retry or handle one by one
+        self.selected = {app.application_id for app in run.failed}
+        self._selection_changed()
+        if run.failed:
+            self._failed = (run.failed, run.status)
+            self.retry_button.pack(side="right")
+
+    def _on_bulk_error(self, run: "BulkRun", error: Exception):
+        """
+        Roll back whatever a bulk change had not settled when it broke off.
+        """
+        finished = {app.application_id for app in run.succeeded + run.failed}
+        for application_id, (token, previous) in run.changes.items():
+            if application_id not in finished:
+                self._roll_back(
+                    application_id, token, previous, error, "Failed to update status."
+                )
+                run.failed.append(previous)
+        self._on_bulk_done(run)
+
+    def _show_progress(self, run: "BulkRun"):
+        """
+        Describe how far a bulk change got.
+        """
+        total = len(run.changes)
+        done = len(run.succeeded) + len(run.failed)
+        text = f"Marked {len(run.succeeded)} of {total} {run.status}"
+        if run.failed:
+            text += f", {len(run.failed)} failed"
+        if done < total:
+            text += "..."
+        self.progress_label.config(text=text)
+
+    def _on_destroy(self, event):
+        """
+        Abort the refresh in flight when the window closes.
+        A running bulk change is left to finish: its cards are gone, but every
+        count it adjusted is either sent or rolled back.
+        """
+        if event.widget is self:
+            self.generation.cancel()
 
     def open_new_application_window(self):
         """
@@ -255,22 +628,8 @@ class JobApplicationsWindow(tk.Toplevel):
             if not content:
                 messagebox.showwarning("Validation", "Content cannot be empty.")
                 return
-
-            try:
-                res = requests.post(
-                    f"{BASE_API_URL}/application/job/{self.job.job_id}",
-                    json={"content": content},
-                    cookies=self.cookies,
-                    verify=False,
-                )
-                if res.status_code in [200, 201]:
-                    messagebox.showinfo("Success", "Application submitted.")
-                    window.destroy()
-                    self.refresh_applications()
-                else:
-                    messagebox.showerror("Error", f"Submission failed.\n{res.text}")
-            except Exception as e:
-                messagebox.showerror("Error", str(e))
+            window.destroy()
+            self.submit_application(content)
 
         tk.Button(
             window,
@@ -281,8 +640,259 @@ class JobApplicationsWindow(tk.Toplevel):
             width=15,
         ).pack(pady=15)
 
+    def submit_application(self, content: str):
+        """
+        Show the new application right away as a placeholder card and post it
+        in the background; the card gets its real id once the server confirms.
+        """
+        key = f"new-{next(self._tokens)}"
+        placeholder = Application(
+            application_id=key,
+            job_id=self.job.job_id,
+            account_id=self.user_account.Id,
+            content=content,
+            status="pending",
+        )
+        self.submissions[key] = placeholder
+        self.submitting.add(key)
+        card = self.application_list.append(placeholder)
+        card.show_note("Submitting...")
+
+        get_runner(self).submit(
+            self._create,
+            content,
+            on_success=lambda created: self._on_submitted(key, created),
+            on_error=lambda e: self._on_submit_error(key, e),
+        )
+
+    def _create(self, content: str) -> Application:
+        """
+        Post an application and record it locally. Runs on a background worker.
+        """
+        created = self.client.create_application(self.job.job_id, content)
+        if created is not None and self.replica is not None:
+            self.replica.upsert_applications([created])
+        return created
+
+    def _on_submitted(self, key: str, created: Application):
+        """
+        Swap the placeholder for the confirmed application.
+        """
+        self.submitting.discard(key)
+        if self.submissions.pop(key, None) is None:
+            return
+        if created is None:
+            # Server did not echo the application: the next sync replaces it
+            self.refresh_applications()
+        elif created.application_id in self.application_list:
+            # A refresh already brought (and counted) the confirmed card
+            self.application_list.remove(key)
+        else:
+            self.application_list.rekey(key, created)
+            self.client.application_counts.adjust(
+                self.job.job_id, new_status=created.status
+            )
+
+    def _on_submit_error(self, key: str, error: Exception):
+        """
+        Keep the placeholder, marked as not submitted, with the reason; it can
+        now be dismissed.
+        """
+        self.submitting.discard(key)
+        card = self.application_list.get(key)
+        if card is None:
+            return
+        card.set_withdrawable(True)
+        detail = error.text if isinstance(error, ApiError) else str(error)
+        card.show_note("Not submitted", "#c62828")
+        card.show_error(f"Submission failed. {detail}".strip())
+
     def _on_mousewheel(self, event):
         """
         Scroll the canvas using mouse wheel input.
         """
         self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+
+
+class ApplicationCard(tk.Frame):
+    """
+    Card displaying a single application.
+    Kept alive across refreshes and updated in place through set_item.
+    """
+
+    def __init__(self, window: JobApplicationsWindow, app: Application):
+        """
+        :param window: The applications window hosting the card and its actions
+        :param app: The application to display
+        """
+        super().__init__(
+            window.scrollable_frame,
+            relief="ridge",
+            borderwidth=2,
+            padx=15,
+            pady=12,
+            bg="white",
+        )
+        self.app = app
+        self.window = window
+        self.expanded = False  # full content laid out instead of its preview
+
+        # Selection checkbox for bulk triage; shift-click selects a range
+        self.selected_var = tk.BooleanVar()
+        if window.user_account.role == "recruiter":
+            checkbox = tk.Checkbutton(
+                self,
+                text="Select",
+                variable=self.selected_var,
+                command=lambda: window.toggle_selected(
+                    self.app.application_id, self.selected_var.get()
+                ),
+                bg="white",
+            )
+            checkbox.bind("<Shift-Button-1>", self._on_shift_click)
+            checkbox.pack(anchor="w")
+
+        # Application content
+        self.content_label = tk.Label(
+            self,
+            anchor="w",
+            justify="left",
+            wraplength=550,
+            font=("Arial", 11),
+            bg="white",
+        )
+        self.content_label.pack(fill="x", pady=(0, 6))
+
+        # Expands a long cover letter; only packed when there is more to show
+        self.more_label = tk.Label(
+            self,
+            fg="#1565c0",
+            cursor="hand2",
+            font=("Arial", 9, "underline"),
+            bg="white",
+        )
+        self.more_label.bind("<Button-1>", lambda e: self.toggle_expanded())
+
+        self.status_label = tk.Label(self, font=("Arial", 10, "bold"), bg="white")
+        self.status_label.pack(anchor="w", pady=(0, 10))
+
+        # Inline error, only packed while there is something to report
+        self.error_label = tk.Label(
+            self,
+            anchor="w",
+            justify="left",
+            wraplength=550,
+            fg="#c62828",
+            font=("Arial", 9),
+            bg="white",
+        )
+
+        # Recruiter controls with color-coded buttons
+        if window.user_account.role == "recruiter":
+            status_frame = tk.Frame(self, bg="white")
+            status_frame.pack(anchor="w", pady=5)
+
+            for status, color in STATUS_COLORS.items():
+                tk.Button(
+                    status_frame,
+                    text=f"Mark {status}",
+                    command=lambda s=status: window.update_status(self.app, s),
+                    width=12,
+                    font=("Arial", 9),
+                    bg=color,
+                    fg="white",
+                    activebackground=color,
+                ).pack(side="left", padx=5)
+
+        # Applicant controls
+        self.withdraw_button = None
+        if window.user_account.role == "applicant":
+            self.withdraw_button = tk.Button(
+                self,
+                text="Withdraw Application",
+                command=lambda: window.withdraw_application(self.app),
+                bg="red",
+                fg="white",
+                padx=10,
+                pady=5,
+                font=("Arial", 10, "bold"),
+            )
+            self.withdraw_button.pack(pady=(5, 0))
+
+        self.set_item(app)
+
+    def set_item(self, app: Application):
+        """
+        Show the latest state of the application.
+        """
+        self.app = app
+        text = application_text(app, self.expanded)
+        self.content_label.config(text=text.content)
+        if text.truncated:
+            self.more_label.config(text="Show less" if self.expanded else "Show more")
+            self.more_label.pack(anchor="w", after=self.content_label, pady=(0, 6))
+        else:
+            self.more_label.pack_forget()
+        self.status_label.config(text=text.status, fg=text.color)
+        self.error_label.pack_forget()
+        self.set_selected(app.application_id in self.window.selected)
+        self.set_withdrawable(app.application_id not in self.window.submitting)
+
+    def toggle_expanded(self):
+        """
+        Switch between the preview and the full content of the application.
+        """
+        self.expanded = not self.expanded
+        text = application_text(self.app, self.expanded)
+        self.content_label.config(text=text.content)
+        self.more_label.config(text="Show less" if self.expanded else "Show more")
+
+    def set_selected(self, selected: bool):
+        """
+        Tick or untick the selection checkbox.
+        """
+        if self.selected_var.get() != selected:
+            self.selected_var.set(selected)
+
+    def set_withdrawable(self, enabled: bool):
+        """
+        Enable or disable the withdraw button, for applicants.
+        """
+        if self.withdraw_button is not None:
+            self.withdraw_button.config(state="normal" if enabled else "disabled")
+
+    def _on_shift_click(self, event):
+        """
+        Extend the selection up to this card instead of toggling it.
+        """
+        self.window.select_range(self.app.application_id)
+        return "break"
+
+    def show_note(self, text: str, color: str = "gray"):
+        """
+        Temporarily replace the status line, e.g. while a request is in flight.
+        """
+        self.status_label.config(text=f"Status: {text}", fg=color)
+
+    def show_error(self, text: str):
+        """
+        Show an error under the status line until the card is next updated.
+        """
+        self.error_label.config(text=text)
+        self.error_label.pack(anchor="w", after=self.status_label, pady=(0, 6))
+
+
+class BulkRun:
+    """
+    Progress of one bulk status change.
+    """
+
+    def __init__(self, status: str):
+        """
+        :param status: Status applied to every application of the run
+        """
+        self.status = status
+        # application_id -> (optimistic change token, application before the change)
+        self.changes = {}
+        self.succeeded = []
+        self.failed = []
@@ -1,12 +1,23 @@
+import sys
 import tkinter as tk
+from concurrent.futures import Future
 from tkinter import messagebox
 
-import requests
-
-from config import BASE_API_URL
+from api.background import BackgroundRunner
+from config import JOB_PAGE_SIZE
 from objects import Account
-from windows.dashboard import MainDashboardWindow
-from windows.register import RegisterWindow
+
+# The HTTP stack (requests) and the dashboard are imported in the background
+# once the login form has painted; see LoginWindow._preload.
+
+
+def _is_api_error(error: Exception) -> bool:
+    """
+    Whether error is an ApiError, without importing api.client: when that
+    import is what failed, error cannot be one.
+    """
+    client = sys.modules.get("api.client")
+    return client is not None and isinstance(error, client.ApiError)
 
 
 class LoginWindow(tk.Tk):
@@ -14,11 +25,17 @@ class LoginWindow(tk.Tk):
     A window for users to log in to JobConnect
     """
 
-    def __init__(self):
+    def __init__(self, client=None):
         """
         Initialize the LoginWindow with input fields and control buttons.
+        :param client: (Optional) JobConnectClient to reuse, e.g. after a logout
         """
         super().__init__()
+        self.runner = BackgroundRunner(self)
+        self._client = Future()
+        if client is not None:
+            # Coming back from a logout: never resume a stored session
+            self._client.set_result(client)
         self.title("JobConnect - Login")
         self.geometry("360x500")
         self.configure(bg="#f9f9f9")
@@ -45,14 +62,15 @@ class LoginWindow(tk.Tk):
         action_frame = tk.Frame(self, bg="#f9f9f9")
         action_frame.pack(pady=5)
 
-        tk.Button(
+        self.login_button = tk.Button(
             action_frame,
             text="Login",
             command=self.login,
             width=15,
             bg="#007acc",
             fg="white",
-        ).pack(pady=5)
+        )
+        self.login_button.pack(pady=5)
         tk.Button(
             action_frame, text="Register", command=self.open_register_window, width=15
         ).pack(pady=5)
@@ -69,6 +87,82 @@ class LoginWindow(tk.Tk):
             autofill_frame, text="Fill Applicant", command=self.fill_applicant, width=20
         ).pack()
 
+        # Runs after the first paint, while the user types
+        self.after_idle(self._preload)
+
+    @property
+    def client(self):
+        """
+        The API client, waiting for the background load if it is not ready yet.
+        """
+        return self._client.result()
+
+    def _preload(self):
+        """
+        Import the HTTP stack and the dashboard on a worker thread and build the
+        API client, so the login form never waits for them. A session stored
+        by an earlier launch is then resumed without showing the form.
+        """
+        self.runner.submit(
+            self._load_modules,
+            on_success=lambda restored: restored and self._resume_session(),
+        )
+
+    def _load_modules(self) -> bool:
+        """
+        Import the modules needed after login and build the API client.
+        Returns whether a stored session was restored. Runs on a background worker.
+        """
+        try:
+            from api.client import JobConnectClient
+            from store.session import SessionStore
+            import windows.dashboard  # noqa: F401
+            import windows.register  # noqa: F401
+
+            if self._client.done():
+                return False
+            client = JobConnectClient(session_store=SessionStore())
+            self._client.set_result(client)
+            return client.restore_session()
+        except Exception as error:
+            # Surfaces through self.client when the user tries to log in
+            if not self._client.done():
+                self._client.set_exception(error)
+            return False
+
+    def _resume_session(self):
+        """
+        Validate the restored session and open the dashboard if it still works.
+        """
+        self.login_button.config(state="disabled", text="Signing in...")
+        self.runner.submit(
+            self._fetch_account,
+            on_success=self._open_dashboard,
+            on_error=self._on_resume_error,
+        )
+
+    def _on_resume_error(self, error: Exception):
+        """
+        Fall back to the login form when the stored session cannot be used.
+        An expired or revoked session is forgotten; a network error keeps it
+        for the next launch.
+        """
+        self._reset_login_button()
+        if _is_api_error(error) and error.status_code in (401, 403):
+            self.runner.submit(self.client.forget_session)
+
+    def _fetch_account(self) -> Account:
+        """
+        Fetch the logged-in account while the first page of jobs starts
+        downloading in parallel. The dashboard opens as soon as the account is
+        in: its Jobs tab asks for the same page and joins the download still
+        in flight (single-flight) instead of sending another. Runs on a
+        background worker.
+        """
+        # Not waited for, and a failure is not fatal: the Jobs tab retries
+        self.runner.submit(self.client.list_jobs, offset=0, limit=JOB_PAGE_SIZE)
+        return self.client.me()
+
     def login(self):
         """
         Attempt to log in the user using the API with provided email and password.
@@ -77,39 +171,59 @@ class LoginWindow(tk.Tk):
         email = self.email_entry.get()
         password = self.password_entry.get()
 
-        try:
-            res = requests.post(
-                f"{BASE_API_URL}/account/login",
-                json={"email": email, "password": password},
-                verify=False,
-            )
-            if res.status_code == 200:
-                me = requests.get(
-                    f"{BASE_API_URL}/account/me", cookies=res.cookies, verify=False
-                )
-                if me.status_code == 200:
-                    user_account = Account(
-                        me.json()["id"],
-                        me.json()["first_name"],
-                        me.json()["last_name"],
-                        me.json()["email"],
-                        me.json()["role"],
-                    )
-                    self.destroy()
-                    MainDashboardWindow(res.cookies, user_account).mainloop()
-                else:
-                    messagebox.showerror("Error", "Failed to fetch user data.")
-            else:
-                messagebox.showerror(
-                    "Login Failed", res.json().get("message", "Invalid credentials")
-                )
-        except Exception as e:
-            messagebox.showerror("Connection Error", str(e))
+        self.login_button.config(state="disabled", text="Logging in...")
+        # self.client is resolved on the worker, never blocking the form
+        self.runner.submit(
+            lambda: self.client.login(email, password),
+            on_success=lambda _: self.runner.submit(
+                self._fetch_account,
+                on_success=self._open_dashboard,
+                on_error=self._on_me_error,
+            ),
+            on_error=self._on_login_error,
+        )
+
+    def _on_login_error(self, error: Exception):
+        """
+        Report a failed login attempt and re-enable the form.
+        """
+        self._reset_login_button()
+        if _is_api_error(error):
+            messagebox.showerror("Login Failed", error.message or "Invalid credentials")
+        else:
+            messagebox.showerror("Connection Error", str(error))
+
+    def _on_me_error(self, error: Exception):
+        """
+        Report a failure to load the logged-in account.
+        """
+        self._reset_login_button()
+        if _is_api_error(error):
+            messagebox.showerror("Error", "Failed to fetch user data.")
+        else:
+            messagebox.showerror("Connection Error", str(error))
+
+    def _reset_login_button(self):
+        """
+        Restore the login button after a request finished.
+        """
+        self.login_button.config(state="normal", text="Login")
+
+    def _open_dashboard(self, user_account: Account):
+        """
+        Replace the login window with the main dashboard.
+        """
+        from windows.dashboard import MainDashboardWindow
+
+        self.destroy()
+        MainDashboardWindow(self.client, user_account).mainloop()
 
     def open_register_window(self):
         """
         Open a separate window for user registration.
         """
+        from windows.register import RegisterWindow
+
         RegisterWindow(self)
 
     def fill_recruiter(self):
@@ -1,9 +1,8 @@
 import tkinter as tk
 from tkinter import messagebox, ttk
 
-import requests
-
-from config import BASE_API_URL
+from api.background import get_runner
+from api.client import ApiError
 
 
 class RegisterWindow(tk.Toplevel):
@@ -86,27 +85,26 @@ class RegisterWindow(tk.Toplevel):
             messagebox.showerror("Missing Info", "Please fill in all fields.")
             return
 
-        try:
-            res = requests.post(
-                f"{BASE_API_URL}/account/register", json=data, verify=False
-            )
-
-            if res.status_code == 200:
-                messagebox.showinfo("Success", "Account registered successfully!")
-                self.destroy()
-            else:
-                try:
-                    error_response = res.json()
-                    if isinstance(error_response, dict):
-                        message = error_response.get("message", str(error_response))
-                    elif isinstance(error_response, list):
-                        message = "\n".join(str(item) for item in error_response)
-                    else:
-                        message = str(error_response)
-                except Exception as parse_err:
-                    message = res.text or str(parse_err)
-
-                messagebox.showerror("Register Failed", message)
-
-        except Exception as e:
-            messagebox.showerror("Connection Error", str(e))
+        # The login window's client is resolved on the worker: it may still be
+        # loading, and a failed load is reported like any other error
+        get_runner(self).submit(
+            lambda: self.master.client.register(data),
+            on_success=self._on_registered,
+            on_error=self._on_register_error,
+        )
+
+    def _on_registered(self, _):
+        """
+        Confirm the new account and close the form.
+        """
+        messagebox.showinfo("Success", "Account registered successfully!")
+        self.destroy()
+
+    def _on_register_error(self, error: Exception):
+        """
+        Show why the registration was rejected.
+        """
+        if isinstance(error, ApiError):
+            messagebox.showerror("Register Failed", error.message)
+        else:
+            messagebox.showerror("Connection Error", str(error))